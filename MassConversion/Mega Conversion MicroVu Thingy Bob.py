@@ -1,14 +1,15 @@
 import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 import logging
 from fuzzywuzzy import fuzz
 import re
 import lib
 import lib.Utilities
 from lib import MicroVuFileProcessor
-from lib.MicroVuFileProcessor import get_processor, ProcessorException
-from lib.MicroVuProgram import MicroVuProgram
+from lib.ConversionJournal import ConversionJournal, ConversionJournalEntry
+from lib.MicroVuFileProcessor import get_processor, ProcessorJob, ProcessorResult
+from lib.MicroVuProgramProbe import MicroVuProgramProbe
 
 
 class MegaConversionThingyBob:
@@ -24,7 +25,7 @@ class MegaConversionThingyBob:
         self._op_regex = re.compile(r"^(.*)([ _-]OP)( *)(\d+)(.*)(\.IWP)$")
         self._rev_regex = re.compile(r"(REV)( *)(\w+)")
         self._processor = get_processor("JTW")
-        logging.basicConfig(filename="C:\\Users\\JTWhitney\\PycharmProjects\\MicroVu1FConversion\\MassConversion\\ErrorLog.txt", filemode='a', format='%(message)s')
+        logging.basicConfig(filename="C:\\Users\\JTWhitney\\PycharmProjects\\MicroVu1FConversion\\MassConversion\\ErrorLog.txt", filemode='a', format='%(message)s', level=logging.INFO)
 
     def find_highest_fuzzy_match(self, target_line, lines):
         max_ratio = 0
@@ -52,26 +53,64 @@ class MegaConversionThingyBob:
         parts = re.split("[ _]", filestem)
         return parts[0]
 
-    def mass_process_microvus(self, input_file_path: str, output_root_path: str) -> None:
-        lib.Utilities.StoreIniValue(output_root_path, "Paths", "output_rootpath", "Settings")
-
-        with open(input_file_path, "r") as f:
-            filelines = f.readlines()
-        for file_path in filelines:
+    def get_processor_jobs(self, file_paths: List[str], journal: ConversionJournal,
+                           file_signatures: dict[str, tuple[int, int, str]]) -> Iterator[ProcessorJob]:
+        for file_path in file_paths:
             file_path = file_path.rstrip("\n")
             if os.path.exists(file_path):
+                if journal.is_completed(file_path):
+                    continue
                 file_name = os.path.basename(file_path)
                 part_number = self.parse_part_number(file_name)
                 directory_name = os.path.basename(os.path.dirname(file_path))
                 op_number = self.parse_operation_from_file_name(file_name)
                 rev_number = self.parse_rev_from_file_name(directory_name)
-                micro_vu = MicroVuProgram(file_path, op_number, rev_number, "")
-                if micro_vu.is_smartprofile:
-                    micro_vu.smartprofile_projectname = self.find_highest_fuzzy_match(part_number, self._sp_lines)
+                size, mtime_ns = ConversionJournal.get_file_signature(file_path)
+                job = ProcessorJob(type(self._processor), self._processor.user_initials, file_path, op_number,
+                                   rev_number, transform=ProcessorJob.PROCESS_FILE)
                 try:
-                    self._processor.process_file(micro_vu)
-                except ProcessorException as e:
-                    logging.error(f"FilePath:{file_path}: {e.args[0]}", exc_info=False)
+                    job.read_file()
+                    content_hash = job.content_hash
+                    if journal.is_completed(file_path, content_hash):
+                        continue
+                    if journal.reconcile_started(file_path, content_hash):
+                        continue
+                    if MicroVuProgramProbe(file_path, job.file_bytes).is_smartprofile:
+                        job.smartprofile_projectname = self.find_highest_fuzzy_match(part_number, self._sp_lines)
+                except Exception as e:
+                    self._record_entry(journal, ConversionJournalEntry(
+                        file_path, ConversionJournalEntry.FAILED, "", str(e), size, mtime_ns))
+                    continue
+                if not os.path.exists(job.output_filepath):
+                    self._record_entry(journal, ConversionJournalEntry(
+                        file_path, ConversionJournalEntry.STARTED, job.output_filepath, "", size, mtime_ns,
+                        content_hash))
+                file_signatures[file_path] = (size, mtime_ns, content_hash)
+                yield job
+
+    def mass_process_microvus(self, input_file_path: str, output_root_path: str) -> None:
+        lib.Utilities.StoreIniValue(output_root_path, "Paths", "output_rootpath", "Settings")
+
+        with open(input_file_path, "r") as f:
+            filelines = f.readlines()
+        journal = ConversionJournal(str(Path(input_file_path).with_suffix(".journal.jsonl")))
+        file_signatures: dict[str, tuple[int, int, str]] = {}
+
+        def record_result(result: ProcessorResult) -> None:
+            size, mtime_ns, content_hash = file_signatures.pop(result.input_filepath, (-1, -1, ""))
+            outcome = ConversionJournalEntry.SUCCEEDED if result.succeeded else ConversionJournalEntry.FAILED
+            self._record_entry(journal, ConversionJournalEntry(
+                result.input_filepath, outcome, result.output_filepath, result.error, size, mtime_ns, content_hash))
+
+        self._processor.process_files_in_pipeline(self.get_processor_jobs(filelines, journal, file_signatures),
+                                                  on_result=record_result)
+        logging.info(str(journal))
+
+    @staticmethod
+    def _record_entry(journal: ConversionJournal, entry: ConversionJournalEntry) -> None:
+        journal.record(entry)
+        if entry.failed:
+            logging.error(f"FilePath:{entry.input_filepath}: {entry.error}", exc_info=False)
 
 
 sp_filepath = "C:\\Users\\JTWhitney\\PycharmProjects\\MicroVu1FConversion\\MassConversion\\SmartProfiles.txt"
@@ -82,7 +121,8 @@ three_eleven_output = "V:\\Inspect Programs\\Micro-Vu\\1Factory_Untested\\311"
 three_forty_one_output = "V:\\Inspect Programs\\Micro-Vu\\1Factory_Untested\\341"
 four_twenty_output = "V:\\Inspect Programs\\Micro-Vu\\1Factory_Untested\\420"
 
-megaConverter = MegaConversionThingyBob(sp_filepath)
-#megaConverter.mass_process_microvus(three_elevens, three_eleven_output)
-#megaConverter.mass_process_microvus(three_forty_ones, three_forty_one_output)
-megaConverter.mass_process_microvus(four_twenties, four_twenty_output)
+if __name__ == "__main__":
+    megaConverter = MegaConversionThingyBob(sp_filepath)
+    #megaConverter.mass_process_microvus(three_elevens, three_eleven_output)
+    #megaConverter.mass_process_microvus(three_forty_ones, three_forty_one_output)
+    megaConverter.mass_process_microvus(four_twenties, four_twenty_output)
@@ -1,13 +1,12 @@
 import os
 
+import lib.Utilities
 from lib.MicroVuProgram import MicroVuProgram
 
 
 def _write_file_to_harddrive(micro_vu: MicroVuProgram) -> None:
     try:
-        with open(micro_vu.filepath, "w", encoding="utf-16-le", newline="\r\n") as f:
-            for line in micro_vu.file_lines:
-                f.write(f"{line}")
+        micro_vu.write_file(micro_vu.filepath, lib.Utilities.get_settings().fsync_output_files)
     except:
         pass
 
@@ -7,8 +7,7 @@ from ui.MicroVuProcessor_MainWindow import MicroVuProcessorMainWindow
 
 
 def main():
-    stylesheet_filepath = Utilities.get_filepath_by_name("MacOS.qss")
-    styleSheet = Utilities.get_file_as_string(stylesheet_filepath)
+    styleSheet = Utilities.get_resources().get_text("MacOS.qss")
     app = QtWidgets.QApplication(sys.argv)
     app.setStyleSheet(styleSheet)
     ui = MicroVuProcessorMainWindow()
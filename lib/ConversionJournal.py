@@ -0,0 +1,153 @@
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from threading import Lock
+from typing import Iterator, Optional
+
+
+class ConversionJournalEntry:
+    FAILED: str = "failed"
+    STARTED: str = "started"
+    SUCCEEDED: str = "succeeded"
+
+    def __init__(self, input_filepath: str, outcome: str, output_filepath: str = "", error: str = "",
+                 size: int = -1, mtime_ns: int = -1, content_hash: str = "", recorded_at: str = ""):
+        self.input_filepath = input_filepath
+        self.outcome = outcome
+        self.output_filepath = output_filepath
+        self.error = error
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.content_hash = content_hash
+        self.recorded_at = recorded_at or datetime.now().isoformat(timespec="seconds")
+
+    @staticmethod
+    def from_dict(values: dict) -> "ConversionJournalEntry":
+        return ConversionJournalEntry(values["input_filepath"], values["outcome"], values.get("output_filepath", ""),
+                                      values.get("error", ""), values.get("size", -1), values.get("mtime_ns", -1),
+                                      values.get("content_hash", ""), values.get("recorded_at", ""))
+
+    @property
+    def failed(self) -> bool:
+        return self.outcome == ConversionJournalEntry.FAILED
+
+    @property
+    def succeeded(self) -> bool:
+        return self.outcome == ConversionJournalEntry.SUCCEEDED
+
+    def to_dict(self) -> dict:
+        return {
+            "input_filepath": self.input_filepath,
+            "outcome": self.outcome,
+            "output_filepath": self.output_filepath,
+            "error": self.error,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "content_hash": self.content_hash,
+            "recorded_at": self.recorded_at,
+        }
+
+
+class ConversionJournal:
+    _entries: dict[str, ConversionJournalEntry]
+    _filepath: str
+    _is_line_open: bool
+    _lock: Lock
+    _record_count: int
+
+    # Static Methods
+    @staticmethod
+    def get_file_signature(filepath: str) -> tuple[int, int]:
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return -1, -1
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def get_key(filepath: str) -> str:
+        return os.path.normcase(os.path.abspath(filepath))
+
+    # Dunder Methods
+    def __init__(self, filepath: str):
+        self._filepath = filepath
+        self._entries = {}
+        self._is_line_open = False
+        self._lock = Lock()
+        self._record_count = 0
+        self._load()
+
+    def __iter__(self) -> Iterator[ConversionJournalEntry]:
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        failed_entries = self.failed_entries
+        succeeded_count = sum(entry.succeeded for entry in self._entries.values())
+        lines = [f"{succeeded_count} of {len(self)} files converted, {len(failed_entries)} failed "
+                 f"({self._record_count} recorded this run)."]
+        for error, count in Counter(entry.error for entry in failed_entries).most_common():
+            lines.append(f"{count} x {error}")
+        lines.extend(f"{entry.input_filepath}: {entry.error}" for entry in failed_entries)
+        return "\n".join(lines)
+
+    # Internal Methods
+    def _load(self) -> None:
+        if not os.path.exists(self._filepath):
+            return
+        with open(self._filepath, "r", encoding="utf-8") as f:
+            for line in f:
+                self._is_line_open = not line.endswith("\n")
+                try:
+                    entry = ConversionJournalEntry.from_dict(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    continue
+                self._entries[ConversionJournal.get_key(entry.input_filepath)] = entry
+
+    # Properties
+    @property
+    def failed_entries(self) -> list[ConversionJournalEntry]:
+        return [entry for entry in self._entries.values() if entry.failed]
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def record_count(self) -> int:
+        return self._record_count
+
+    # Public Methods
+    def get_entry(self, input_filepath: str) -> Optional[ConversionJournalEntry]:
+        return self._entries.get(ConversionJournal.get_key(input_filepath))
+
+    def is_completed(self, input_filepath: str, content_hash: str = "") -> bool:
+        entry = self.get_entry(input_filepath)
+        if entry is None or not entry.succeeded:
+            return False
+        if ConversionJournal.get_file_signature(input_filepath) == (entry.size, entry.mtime_ns):
+            return True
+        return bool(content_hash) and content_hash == entry.content_hash
+
+    def reconcile_started(self, input_filepath: str, content_hash: str) -> bool:
+        entry = self.get_entry(input_filepath)
+        if entry is None or entry.outcome != ConversionJournalEntry.STARTED:
+            return False
+        if not content_hash or content_hash != entry.content_hash or not os.path.exists(entry.output_filepath):
+            return False
+        self.record(ConversionJournalEntry(entry.input_filepath, ConversionJournalEntry.SUCCEEDED,
+                                           entry.output_filepath, "", entry.size, entry.mtime_ns, content_hash))
+        return True
+
+    def record(self, entry: ConversionJournalEntry) -> None:
+        with self._lock:
+            with open(self._filepath, "a", encoding="utf-8") as f:
+                if self._is_line_open:
+                    f.write("\n")
+                    self._is_line_open = False
+                f.write(json.dumps(entry.to_dict()) + "\n")
+            self._entries[ConversionJournal.get_key(entry.input_filepath)] = entry
+            self._record_count += 1
@@ -1,39 +1,67 @@
+import configparser
+import json
+import os
 import re
+from collections import Counter, OrderedDict
 from abc import ABCMeta, abstractmethod
-from typing import List
+from itertools import product
+from typing import Callable, Iterable, List, Optional, Sequence
 
 
 class DimensionParser(metaclass=ABCMeta):
-    _regex: re
+    _examples: tuple[str, ...]
+    _regex: re.Pattern
+
+    def __init__(self, pattern: str, examples: Iterable[str] = ()):
+        self._regex = re.compile(pattern)
+        self._examples = tuple(example.upper() for example in examples)
+
+    @property
+    def examples(self) -> tuple[str, ...]:
+        return self._examples
+
+    @property
+    def group_count(self) -> int:
+        return self._regex.groups
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    @property
+    def pattern(self) -> str:
+        return self._regex.pattern
 
     def does_pattern_match(self, search_string: str) -> bool:
         return bool(_ := self._regex.fullmatch(search_string))
 
     @abstractmethod
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
         return ""
 
+    def get_dimension_name(self, search_string: str, prefix: str) -> str:
+        if not (match := self._regex.fullmatch(search_string)):
+            return search_string
+        return self.format_dimension_name((match[0],) + match.groups(), prefix)
+
 
 class Parser1(DimensionParser):
     def __init__(self):
         # Matches "ITEM_12.1A 1X"
-        self._regex = re.compile(r"^(?:#*)(?:ITEM|INSP)([ _-])(\d+)\.(\d+)([A-Za-z])([ _-])\d+(?:X*)$")
+        super().__init__(r"(?:#*)(?:ITEM|INSP)([ _-])(\d+)\.(\d+)([A-Za-z])([ _-])\d+(?:X*)",
+                         ("ITEM_12.1A 1X", "#INSP-3.2B_1"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            return f"{prefix}{match[2]}.{match[3]}{match[4]}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        return f"{prefix}{match[2]}.{match[3]}{match[4]}"
 
 
 class Parser2(DimensionParser):
     def __init__(self):
         # Matches "INSP-12.1_1X"
-        self._regex = re.compile(r"^(?:#*)(ITEM|INSP)([ _-])(\d+)\.(\d+)([ _-])(\d+)X$")
+        super().__init__(r"(?:#*)(ITEM|INSP)([ _-])(\d+)\.(\d+)([ _-])(\d+)X",
+                         ("INSP-12.1_1X", "ITEM 4.2 3X"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if not (match := self._regex.search(search_string)):
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
         letter = chr(ord('@') + int(match[6]))
         return f"{prefix}{match[3]}.{match[4]}{letter}"
 
@@ -41,23 +69,20 @@ class Parser2(DimensionParser):
 class Parser3(DimensionParser):
     def __init__(self):
         # Matches "ITEM_12A_1X"
-        self._regex = re.compile(r"^(?:#*)(ITEM|INSP)([ _-])(\d+)([A-Za-z])([ _-])\d+(?:X*)$")
+        super().__init__(r"(?:#*)(ITEM|INSP)([ _-])(\d+)([A-Za-z])([ _-])\d+(?:X*)",
+                         ("ITEM_12A_1X", "#INSP 7B-2"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            return f"{prefix}{match[3]}{match[4]}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        return f"{prefix}{match[3]}{match[4]}"
 
 
 class Parser4(DimensionParser):
     def __init__(self):
         # Matches "INSP_12 1X"
-        self._regex = re.compile(r"^(?:#*)(ITEM|INSP)([ _-])(\d+)([ _-])(\d+)(?:X*)$")
+        super().__init__(r"(?:#*)(ITEM|INSP)([ _-])(\d+)([ _-])(\d+)(?:X*)",
+                         ("INSP_12 1X", "ITEM-5_2"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if not (match := self._regex.search(search_string)):
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
         letter = chr(ord('@') + int(match[5]))
         return f"{prefix}{match[3]}{letter}"
 
@@ -65,23 +90,20 @@ class Parser4(DimensionParser):
 class Parser5(DimensionParser):
     def __init__(self):
         # Matches "INSP 12.1"
-        self._regex = re.compile(r"^(?:#*)(ITEM|INSP)([ _-])(\d+)\.(\d+)$")
+        super().__init__(r"(?:#*)(ITEM|INSP)([ _-])(\d+)\.(\d+)",
+                         ("INSP 12.1", "#ITEM_3.14"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            return f"{prefix}{match[3]}.{match[4]}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        return f"{prefix}{match[3]}.{match[4]}"
 
 
 class Parser6(DimensionParser):
     def __init__(self):
         # Matches "12.1A_1X"
-        self._regex = re.compile(r"^(?:#*)(\d+)\.(\d+)([A-Za-z])([ _-])(\d+)(?:X*)$")
+        super().__init__(r"(?:#*)(\d+)\.(\d+)([A-Za-z])([ _-])(\d+)(?:X*)",
+                         ("12.1A_1X", "#4.2B 2"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if not (match := self._regex.search(search_string)):
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
         letter = chr(ord('@') + int(match[5]))
         return f"{prefix}{match[1]}.{match[2]}{letter}"
 
@@ -89,11 +111,10 @@ class Parser6(DimensionParser):
 class Parser7(DimensionParser):
     def __init__(self):
         # Matches "12.1_1"
-        self._regex = re.compile(r"^(?:#*)(\d+)\.(\d+)([ _-])(\d+)(?:X*)$")
+        super().__init__(r"(?:#*)(\d+)\.(\d+)([ _-])(\d+)(?:X*)",
+                         ("12.1_1", "#3.2-2X"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if not (match := self._regex.search(search_string)):
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
         letter = chr(ord('@') + int(match[4]))
         return f"{prefix}{match[1]}.{match[2]}{letter}"
 
@@ -101,35 +122,30 @@ class Parser7(DimensionParser):
 class Parser8(DimensionParser):
     def __init__(self):
         # Matches "#12.1_A"
-        self._regex = re.compile(r"^(?:#*)(\d+)\.(\d+)([ _-])([A-Za-z])$")
+        super().__init__(r"(?:#*)(\d+)\.(\d+)([ _-])([A-Za-z])",
+                         ("#12.1_A", "4.2 B"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            return f"{prefix}{match[1]}.{match[2]}{match[4]}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        return f"{prefix}{match[1]}.{match[2]}{match[4]}"
 
 
 class Parser9(DimensionParser):
     def __init__(self):
         # Matches "#12.16A"
-        self._regex = re.compile(r"^(?:#*)(\d+)\.(\d+)([A-Za-z])$")
+        super().__init__(r"(?:#*)(\d+)\.(\d+)([A-Za-z])",
+                         ("#12.16A", "3.1B"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            return f"{prefix}{match[1]}.{match[2]}{match[3]}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        return f"{prefix}{match[1]}.{match[2]}{match[3]}"
 
 
 class Parser10(DimensionParser):
     def __init__(self):
         # Matches "#12_1"
-        self._regex = re.compile(r"^(?:#*)(\d+)[ _-](\d+)(?:X*)$")
+        super().__init__(r"(?:#*)(\d+)[ _-](\d+)(?:X*)",
+                         ("#12_1", "12 1", "5-2X"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if not (match := self._regex.search(search_string)):
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
         letter = chr(ord('@') + int(match[2]))
         return f"{prefix}{match[1]}{letter}"
 
@@ -137,23 +153,19 @@ class Parser10(DimensionParser):
 class Parser11(DimensionParser):
     def __init__(self):
         # Matches "#ITEM-12"
-        self._regex = re.compile(r"^(?:#*)(?:ITEM|INSP)([ _-])(\d+)$")
+        super().__init__(r"(?:#*)(?:ITEM|INSP)([ _-])(\d+)",
+                         ("#ITEM-12", "INSP 7"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            return f"{prefix}{match[2]}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        return f"{prefix}{match[2]}"
 
 
 class Parser12(DimensionParser):
     def __init__(self):
-        # Matches "12 1"
-        self._regex = re.compile(r"^(?:#*)(\d+)([ _-])(\d+)$")
+        # Matches "12 1", but Parser10 matches all of these first, so it has no examples of its own
+        super().__init__(r"(?:#*)(\d+)([ _-])(\d+)")
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if not (match := self._regex.search(search_string)):
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
         letter = chr(ord('@') + int(match[3]))
         return f"{prefix}{match[1]}{letter}"
 
@@ -161,90 +173,538 @@ class Parser12(DimensionParser):
 class Parser13(DimensionParser):
     def __init__(self):
         # Matches "12_B"
-        self._regex = re.compile(r"^(?:#*)(\d+)([ _-])([A-Za-z])$")
+        super().__init__(r"(?:#*)(\d+)([ _-])([A-Za-z])",
+                         ("12_B", "#4 C"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            return f"{prefix}{match[1]}{match[3]}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        return f"{prefix}{match[1]}{match[3]}"
 
 
 class Parser14(DimensionParser):
     def __init__(self):
         # Matches "12.16"
-        self._regex = re.compile(r"^(?:#*)(\d+)\.(\d+)$")
+        super().__init__(r"(?:#*)(\d+)\.(\d+)",
+                         ("12.16", "#3.2"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            return f"{prefix}{match[1]}.{match[2]}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        return f"{prefix}{match[1]}.{match[2]}"
 
 
 class Parser15(DimensionParser):
     def __init__(self):
         # Matches "12A"
-        self._regex = re.compile(r"^(?:#*)(\d+)([A-Za-z])$")
+        super().__init__(r"(?:#*)(\d+)([A-Za-z])",
+                         ("12A", "#7B"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            return f"{prefix}{match[1]}{match[2]}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        return f"{prefix}{match[1]}{match[2]}"
 
 
 class Parser16(DimensionParser):
     def __init__(self):
         # Matches "#12"
-        self._regex = re.compile(r"^(?:#*)(\d+)$")
+        super().__init__(r"(?:#*)(\d+)",
+                         ("#12", "7"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            return f"{prefix}{match[1]}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        return f"{prefix}{match[1]}"
 
 
 class Parser17(DimensionParser):
     def __init__(self):
         # Matches "ITEM_32X1"
-        self._regex = re.compile(r"^(?:#*)(ITEM|INSP)(?:[ _-])(\d+)(X)(\d+)$")
+        super().__init__(r"(?:#*)(ITEM|INSP)(?:[ _-])(\d+)(X)(\d+)",
+                         ("ITEM_32X1", "INSP-4X2"))
 
-    def get_dimension_name(self, search_string: str, prefix: str) -> str:
-        if match := self._regex.search(search_string):
-            letter = chr(ord('@') + int(match[4]))
-            return f"{prefix}{match[2]}{letter}"
-        else:
-            return search_string
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        letter = chr(ord('@') + int(match[4]))
+        return f"{prefix}{match[2]}{letter}"
+
+
+class DimensionRuleException(Exception):
+    pass
+
+
+class DimensionRule(DimensionParser):
+    _BACKREFERENCE: re.Pattern = re.compile(r"(?<!\\)(?:\\\\)*\\(?:[1-9]|g<\d+>)")
+    _GLOBAL_FLAGS: re.Pattern = re.compile(r"\(\?[aiLmsux]+\)")
+
+    _before: str
+    _letter_group: int
+    _name: str
+    _template: str
+
+    # Static Methods
+    @staticmethod
+    def read_rules(filepath: str) -> List["DimensionRule"]:
+        config = configparser.ConfigParser(interpolation=None)
+        try:
+            config.read(filepath)
+        except configparser.Error as e:
+            raise DimensionRuleException(f"Can't read dimension rules file '{filepath}': {e}") from e
+        rules: List[DimensionRule] = []
+        for name in config.sections():
+            values = config[name]
+            if not values.get("pattern") or not values.get("template"):
+                raise DimensionRuleException(f"Dimension rule '{name}' needs a pattern and a template.")
+            try:
+                letter_group = values.getint("letter_group", 0)
+            except ValueError as e:
+                raise DimensionRuleException(f"Dimension rule '{name}' has an invalid letter_group.") from e
+            examples = tuple(example.strip() for example in values.get("examples", "").split(",") if example.strip())
+            rules.append(DimensionRule(name, values["pattern"], values["template"], letter_group, examples,
+                                       values.get("before", "").strip()))
+        return rules
+
+    # Dunder Methods
+    def __init__(self, name: str, pattern: str, template: str, letter_group: int = 0,
+                 examples: Iterable[str] = (), before: str = ""):
+        if not name.isidentifier():
+            raise DimensionRuleException(f"Dimension rule name '{name}' must be a valid identifier.")
+        try:
+            super().__init__(pattern, examples)
+        except re.error as e:
+            raise DimensionRuleException(f"Dimension rule '{name}' has an invalid pattern: {e}") from e
+        if DimensionRule._BACKREFERENCE.search(pattern):
+            raise DimensionRuleException(f"Dimension rule '{name}' can't use numbered backreferences.")
+        if DimensionRule._GLOBAL_FLAGS.search(pattern):
+            raise DimensionRuleException(f"Dimension rule '{name}' can't use global inline flags.")
+        self._name = name
+        self._template = template
+        self._letter_group = letter_group
+        self._before = before
+        if not 0 <= letter_group <= self.group_count:
+            raise DimensionRuleException(f"Dimension rule '{name}' has no group {letter_group}.")
+        if not self._examples:
+            raise DimensionRuleException(f"Dimension rule '{name}' needs at least one example.")
+        for example in self._examples:
+            if not self.does_pattern_match(example):
+                raise DimensionRuleException(f"Dimension rule '{name}' doesn't match its example '{example}'.")
+            try:
+                self.get_dimension_name(example, "")
+            except (IndexError, KeyError, ValueError) as e:
+                raise DimensionRuleException(f"Dimension rule '{name}' has an invalid template: {e}") from e
+
+    # Properties
+    @property
+    def before(self) -> str:
+        return self._before
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def template(self) -> str:
+        return self._template
+
+    # Public Methods
+    def format_dimension_name(self, match: Sequence[str], prefix: str) -> str:
+        letter = chr(ord('@') + int(match[self._letter_group])) if self._letter_group else ""
+        return self._template.format(*match, prefix=prefix, letter=letter)
+
+
+class DimensionRuleStatistics:
+    def __init__(self, match_counts: Optional[dict[str, int]] = None,
+                 unmatched_names: Optional[dict[str, int]] = None):
+        self.match_counts = Counter(match_counts or {})
+        self.unmatched_names = Counter(unmatched_names or {})
+
+    def __add__(self, other: "DimensionRuleStatistics") -> "DimensionRuleStatistics":
+        return DimensionRuleStatistics(self.match_counts + other.match_counts,
+                                       self.unmatched_names + other.unmatched_names)
+
+    def __str__(self) -> str:
+        return (f"{self.match_count} matched, {sum(self.unmatched_names.values())} unmatched "
+                f"({len(self.unmatched_names)} distinct)")
+
+    def __sub__(self, other: "DimensionRuleStatistics") -> "DimensionRuleStatistics":
+        return DimensionRuleStatistics(self.match_counts - other.match_counts,
+                                       self.unmatched_names - other.unmatched_names)
+
+    @property
+    def match_count(self) -> int:
+        return sum(self.match_counts.values())
+
+    def export_json(self, filepath: str, rule_names: Iterable[str] = ()) -> None:
+        with open(filepath, "w") as f:
+            json.dump(self.to_dict(rule_names), f, indent=2)
+
+    def to_dict(self, rule_names: Iterable[str] = ()) -> dict:
+        match_counts = {name: 0 for name in rule_names}
+        match_counts.update(self.match_counts)
+        return {
+            "match_counts": dict(sorted(match_counts.items(), key=lambda item: -item[1])),
+            "unmatched_names": dict(self.unmatched_names.most_common()),
+        }
+
+
+class DimensionNameTranslation:
+    @staticmethod
+    def from_lookup(search_strings: Iterable[str], prefix: str,
+                    translate: Callable[[str, str], tuple[str, Optional[DimensionParser]]],
+                    record_match: Callable[[str, Optional[DimensionParser]], None]) -> "DimensionNameTranslation":
+        search_strings = list(search_strings)
+        translations: dict[str, tuple[str, Optional[DimensionParser]]] = {}
+        for search_string in search_strings:
+            if (translation := translations.get(search_string)) is None:
+                translations[search_string] = translate(search_string, prefix)
+            else:
+                record_match(search_string.upper(), translation[1])
+        return DimensionNameTranslation(search_strings, translations)
+
+    def __init__(self, names: Iterable[str],
+                 translations: dict[str, tuple[str, Optional[DimensionParser]]]):
+        self.names = list(names)
+        self.dimension_names = [translations[name][0] for name in self.names]
+        self.dimension_parsers = [translations[name][1] for name in self.names]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def collisions(self) -> dict[str, List[str]]:
+        names_by_dimension_name: dict[str, List[str]] = {}
+        for name, dimension_name in zip(self.names, self.dimension_names):
+            names = names_by_dimension_name.setdefault(dimension_name, [])
+            if name not in names:
+                names.append(name)
+        return {dimension_name: names for dimension_name, names in names_by_dimension_name.items() if len(names) > 1}
+
+    @property
+    def colliding_indexes(self) -> List[int]:
+        collisions = self.collisions
+        return [i for i, dimension_name in enumerate(self.dimension_names) if dimension_name in collisions]
+
+    @property
+    def unmatched_names(self) -> List[str]:
+        return list(dict.fromkeys(name for name, p in zip(self.names, self.dimension_parsers) if p is None))
 
 
 class DimensionNameSorter:
-    _dimension_parsers: List[DimensionParser] = []
-
-    def __init__(self):
-        self._dimension_parsers.append(Parser1())
-        self._dimension_parsers.append(Parser2())
-        self._dimension_parsers.append(Parser3())
-        self._dimension_parsers.append(Parser4())
-        self._dimension_parsers.append(Parser5())
-        self._dimension_parsers.append(Parser6())
-        self._dimension_parsers.append(Parser7())
-        self._dimension_parsers.append(Parser8())
-        self._dimension_parsers.append(Parser9())
-        self._dimension_parsers.append(Parser10())
-        self._dimension_parsers.append(Parser11())
-        self._dimension_parsers.append(Parser12())
-        self._dimension_parsers.append(Parser13())
-        self._dimension_parsers.append(Parser14())
-        self._dimension_parsers.append(Parser15())
-        self._dimension_parsers.append(Parser16())
-        self._dimension_parsers.append(Parser17())
+    DEFAULT_PARSER_TYPES: tuple[type[DimensionParser], ...] = (
+        Parser1, Parser2, Parser3, Parser4, Parser5, Parser6, Parser7, Parser8, Parser9, Parser10, Parser11,
+        Parser12, Parser13, Parser14, Parser15, Parser16, Parser17)
+    _registered_parser_types: List[type[DimensionParser]] = list(DEFAULT_PARSER_TYPES)
+    _rules: List[DimensionRule] = []
+    _rules_filepath: str = ""
+    _rules_file_signature: Optional[tuple[int, int]] = None
+    _shared: Optional["DimensionNameSorter"] = None
+    PROBE_BODIES: tuple[str, ...] = ("12", "12.1", "12A", "12.1A", "3.16B")
+    PROBE_HEADS: tuple[str, ...] = ("", "#", "##", "ITEM ", "ITEM_", "INSP-", "#INSP_")
+    PROBE_TAILS: tuple[str, ...] = ("", "X", "XX", " 1", "_2", "-3", " 1X", "_2X", "X1", "X12", "_A", " B", "-C")
+    REORDER_INTERVAL: int = 1000
+
+    _dimension_parsers: tuple[DimensionParser, ...]
+    _is_adaptive: bool
+    _lookups_since_reorder: int
+    _match_order: tuple[DimensionParser, ...]
+    _overlapping_names: Optional[set[tuple[str, str]]]
+    _parsers_by_group_index: dict[int, DimensionParser]
+    _regex: re.Pattern
+    _statistics: DimensionRuleStatistics
+
+    # Static Methods
+    @staticmethod
+    def get_shared() -> "DimensionNameSorter":
+        if DimensionNameSorter._shared is None:
+            DimensionNameSorter._shared = DimensionNameSorter()
+        return DimensionNameSorter._shared
+
+    @staticmethod
+    def load_rules(filepath: str) -> None:
+        try:
+            stat = os.stat(filepath)
+            file_signature = stat.st_mtime_ns, stat.st_size
+        except OSError:
+            file_signature = None
+        if filepath == DimensionNameSorter._rules_filepath and \
+                file_signature == DimensionNameSorter._rules_file_signature:
+            return
+        rules = DimensionRule.read_rules(filepath) if file_signature is not None else []
+        sorter = DimensionNameSorter(rules=rules)
+        if problems := sorter.validate():
+            raise DimensionRuleException("\n".join(problems))
+        DimensionNameSorter._rules = rules
+        DimensionNameSorter._rules_filepath = filepath
+        DimensionNameSorter._rules_file_signature = file_signature
+        DimensionNameSorter._shared = sorter
+
+    @staticmethod
+    def register_parser(parser_type: type[DimensionParser], index: Optional[int] = None) -> None:
+        if parser_type in DimensionNameSorter._registered_parser_types:
+            raise ValueError(f"Dimension parser '{parser_type.__name__}' is already registered.")
+        if index is None:
+            index = len(DimensionNameSorter._registered_parser_types)
+        DimensionNameSorter._registered_parser_types.insert(index, parser_type)
+        DimensionNameSorter._shared = None
+
+    @staticmethod
+    def unregister_parser(parser_type: type[DimensionParser]) -> None:
+        DimensionNameSorter._registered_parser_types.remove(parser_type)
+        DimensionNameSorter._shared = None
+
+    # Dunder Methods
+    def __init__(self, parser_types: Optional[Iterable[type[DimensionParser]]] = None,
+                 rules: Optional[Iterable[DimensionRule]] = None):
+        if parser_types is None:
+            parser_types = DimensionNameSorter._registered_parser_types
+        if rules is None:
+            rules = DimensionNameSorter._rules
+        dimension_parsers: List[DimensionParser] = [parser_type() for parser_type in parser_types]
+        for rule in rules:
+            names = [p.name for p in dimension_parsers]
+            if rule.name in names:
+                raise DimensionRuleException(f"Dimension rule '{rule.name}' is defined more than once.")
+            if not rule.before:
+                dimension_parsers.append(rule)
+            elif rule.before in names:
+                dimension_parsers.insert(names.index(rule.before), rule)
+            else:
+                raise DimensionRuleException(f"Dimension rule '{rule.name}' refers to unknown rule '{rule.before}'.")
+        self._dimension_parsers = tuple(dimension_parsers)
+        self._is_adaptive = False
+        self._lookups_since_reorder = 0
+        self._overlapping_names = None
+        self._statistics = DimensionRuleStatistics()
+        self._compile(self._dimension_parsers)
+
+    # Internal Methods
+    def _compile(self, match_order: tuple[DimensionParser, ...]) -> None:
+        branches: List[str] = []
+        self._match_order = match_order
+        self._parsers_by_group_index = {}
+        group_index = 1
+        for p in match_order:
+            branches.append(f"(?P<{p.name}>{p.pattern})")
+            self._parsers_by_group_index[group_index] = p
+            group_index += p.group_count + 1
+        try:
+            self._regex = re.compile("|".join(branches))
+        except re.error as e:
+            raise DimensionRuleException(
+                f"Dimension rule '{self._get_uncombinable_name(branches)}' can't be combined with the other "
+                f"rules: {e}") from e
+
+    def _get_uncombinable_name(self, branches: List[str]) -> str:
+        for i in range(len(branches)):
+            try:
+                re.compile("|".join(branches[:i + 1]))
+            except re.error:
+                return self._match_order[i].name
+        return self._match_order[-1].name
+
+    def _get_overlapping_names(self) -> set[tuple[str, str]]:
+        if self._overlapping_names is None:
+            probe_names = {"".join(parts) for parts in product(DimensionNameSorter.PROBE_HEADS,
+                                                               DimensionNameSorter.PROBE_BODIES,
+                                                               DimensionNameSorter.PROBE_TAILS)}
+            for p in self._dimension_parsers:
+                probe_names.update(p.examples)
+            matched_names = [{name for name in probe_names if p.does_pattern_match(name)}
+                             for p in self._dimension_parsers]
+            self._overlapping_names = set()
+            for i, p1 in enumerate(self._dimension_parsers):
+                for j in range(i + 1, len(self._dimension_parsers)):
+                    # A parser no probe name matches could overlap anything, so it keeps its place.
+                    if not matched_names[i] or not matched_names[j] or matched_names[i] & matched_names[j]:
+                        self._overlapping_names.add((p1.name, self._dimension_parsers[j].name))
+        return self._overlapping_names
+
+    # Properties
+    @property
+    def dimension_parsers(self) -> tuple[DimensionParser, ...]:
+        return self._dimension_parsers
+
+    @property
+    def is_adaptive(self) -> bool:
+        return self._is_adaptive
+
+    @is_adaptive.setter
+    def is_adaptive(self, is_adaptive: bool) -> None:
+        self._is_adaptive = is_adaptive
+        if not is_adaptive and self._match_order != self._dimension_parsers:
+            self._compile(self._dimension_parsers)
+
+    @property
+    def match_order(self) -> tuple[DimensionParser, ...]:
+        return self._match_order
+
+    @property
+    def statistics(self) -> DimensionRuleStatistics:
+        return DimensionRuleStatistics(self._statistics.match_counts, self._statistics.unmatched_names)
+
+    # Public Methods
+    def export_statistics(self, filepath: str) -> None:
+        self._statistics.export_json(filepath, (p.name for p in self._dimension_parsers))
 
     def get_dimension_name(self, search_string: str, prefix: str) -> str:
+        return self.translate(search_string, prefix)[0]
+
+    def get_dimension_parser(self, search_string: str) -> Optional[DimensionParser]:
+        if not (match := self._regex.fullmatch(search_string.upper())):
+            return None
+        return self._parsers_by_group_index[match.lastindex]
+
+    def record_match(self, search_string: str, dimension_parser: Optional[DimensionParser]) -> None:
+        if dimension_parser is None:
+            self._statistics.unmatched_names[search_string] += 1
+        else:
+            self._statistics.match_counts[dimension_parser.name] += 1
+        self._lookups_since_reorder += 1
+        if self._is_adaptive and self._lookups_since_reorder >= DimensionNameSorter.REORDER_INTERVAL:
+            self.reorder()
+
+    def reorder(self) -> None:
+        self._lookups_since_reorder = 0
+        overlapping_names = self._get_overlapping_names()
+        pending = list(self._dimension_parsers)
+        match_order: List[DimensionParser] = []
+        while pending:
+            ready = [p for i, p in enumerate(pending)
+                     if not any((earlier.name, p.name) in overlapping_names for earlier in pending[:i])]
+            p = max(ready, key=lambda candidate: self._statistics.match_counts[candidate.name])
+            match_order.append(p)
+            pending.remove(p)
+        if tuple(match_order) != self._match_order:
+            self._compile(tuple(match_order))
+
+    def reset_statistics(self) -> None:
+        self._lookups_since_reorder = 0
+        self._statistics = DimensionRuleStatistics()
+
+    def translate(self, search_string: str, prefix: str) -> tuple[str, Optional[DimensionParser]]:
         search_string = search_string.upper()
+        if not (match := self._regex.fullmatch(search_string)):
+            self.record_match(search_string, None)
+            return search_string, None
+        p = self._parsers_by_group_index[match.lastindex]
+        groups = match.groups()[match.lastindex:match.lastindex + p.group_count]
+        self.record_match(search_string, p)
+        return p.format_dimension_name((search_string,) + groups, prefix), p
+
+    def translate_many(self, search_strings: Iterable[str], prefix: str) -> DimensionNameTranslation:
+        return DimensionNameTranslation.from_lookup(search_strings, prefix, self.translate, self.record_match)
+
+    def validate(self) -> List[str]:
+        problems: List[str] = []
+        names_by_pattern: dict[str, str] = {}
         for p in self._dimension_parsers:
-            if p.does_pattern_match(search_string):
-                return p.get_dimension_name(search_string, prefix)
+            if p.pattern in names_by_pattern:
+                problems.append(f"Dimension rule '{p.name}' is unreachable: "
+                                f"'{names_by_pattern[p.pattern]}' has the same pattern.")
+                continue
+            names_by_pattern[p.pattern] = p.name
+            for example in p.examples:
+                if (matched_parser := self.get_dimension_parser(example)) is not p:
+                    matched_name = matched_parser.name if matched_parser else "nothing"
+                    problems.append(f"Dimension rule '{p.name}' is shadowed by '{matched_name}' for '{example}'.")
+        return problems
+
+
+class DimensionNameCacheStats:
+    def __init__(self, hits: int = 0, misses: int = 0, evictions: int = 0, size: int = 0, max_size: int = 0):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.size = size
+        self.max_size = max_size
+
+    def __add__(self, other: "DimensionNameCacheStats") -> "DimensionNameCacheStats":
+        return DimensionNameCacheStats(self.hits + other.hits, self.misses + other.misses,
+                                       self.evictions + other.evictions, max(self.size, other.size),
+                                       max(self.max_size, other.max_size))
+
+    def __str__(self) -> str:
+        return (f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions, "
+                f"{self.size}/{self.max_size} entries")
+
+    def __sub__(self, other: "DimensionNameCacheStats") -> "DimensionNameCacheStats":
+        return DimensionNameCacheStats(self.hits - other.hits, self.misses - other.misses,
+                                       self.evictions - other.evictions, self.size, self.max_size)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DimensionNameCache:
+    DEFAULT_MAX_SIZE: int = 4096
+    _shared: Optional["DimensionNameCache"] = None
+
+    _entries: OrderedDict[tuple[str, str], tuple[str, Optional[DimensionParser]]]
+    _evictions: int
+    _hits: int
+    _max_size: int
+    _misses: int
+    _sorter: Optional[DimensionNameSorter]
+
+    # Static Methods
+    @staticmethod
+    def get_shared() -> "DimensionNameCache":
+        if DimensionNameCache._shared is None:
+            DimensionNameCache._shared = DimensionNameCache()
+        return DimensionNameCache._shared
+
+    # Dunder Methods
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self._entries = OrderedDict()
+        self._evictions = 0
+        self._hits = 0
+        self._max_size = max(max_size, 1)
+        self._misses = 0
+        self._sorter = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # Internal Methods
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    # Properties
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def stats(self) -> DimensionNameCacheStats:
+        return DimensionNameCacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._max_size)
+
+    # Public Methods
+    def clear(self) -> None:
+        self._entries.clear()
+        self._evictions = 0
+        self._hits = 0
+        self._misses = 0
 
-        return search_string
+    def get_dimension_name(self, search_string: str, prefix: str) -> str:
+        return self.translate(search_string, prefix)[0]
+
+    def resize(self, max_size: int) -> None:
+        self._max_size = max(max_size, 1)
+        self._evict()
+
+    def translate(self, search_string: str, prefix: str) -> tuple[str, Optional[DimensionParser]]:
+        sorter = DimensionNameSorter.get_shared()
+        if sorter is not self._sorter:
+            self._entries.clear()
+            self._sorter = sorter
+        key = (search_string, prefix)
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            sorter.record_match(search_string.upper(), entry[1])
+            return entry
+        self._misses += 1
+        entry = sorter.translate(search_string, prefix)
+        self._entries[key] = entry
+        self._evict()
+        return entry
+
+    def translate_many(self, search_strings: Iterable[str], prefix: str) -> DimensionNameTranslation:
+        return DimensionNameTranslation.from_lookup(search_strings, prefix, self.translate,
+                                                    DimensionNameSorter.get_shared().record_match)
@@ -0,0 +1,85 @@
+from typing import Iterable, List
+
+
+class FeatureRename:
+    DUPLICATE: str = "duplicate"
+    NAME_EXISTS: str = "name exists"
+    RENAMED: str = "renamed"
+    UNCHANGED: str = "unchanged"
+
+    def __init__(self, index: int, old_name: str, new_name: str, status: str = RENAMED):
+        self.index = index
+        self.old_name = old_name
+        self.new_name = new_name
+        self.status = status
+        self.conflicting_index = -1
+
+    def __str__(self) -> str:
+        text = f"'{self.old_name}' -> '{self.new_name}' (line {self.index}): {self.status}"
+        if self.conflicting_index > -1:
+            text += f" at line {self.conflicting_index}"
+        return text
+
+    @property
+    def is_renamed(self) -> bool:
+        return self.status == FeatureRename.RENAMED
+
+
+class FeatureRenamePlan:
+    _renames: List[FeatureRename]
+
+    # Dunder Methods
+    def __init__(self, feature_names: dict[int, str], current_names: dict[int, str],
+                 name_indexes: dict[str, Iterable[int]]):
+        self._renames = []
+        for index, new_name in feature_names.items():
+            old_name = current_names.get(index, "")
+            status = FeatureRename.UNCHANGED if new_name == old_name else FeatureRename.RENAMED
+            self._renames.append(FeatureRename(index, old_name, new_name, status))
+        self._resolve(name_indexes)
+
+    def __iter__(self):
+        return iter(self._renames)
+
+    def __len__(self) -> int:
+        return len(self._renames)
+
+    # Internal Methods
+    def _resolve(self, name_indexes: dict[str, Iterable[int]]) -> None:
+        pending = [rename for rename in self._renames if rename.is_renamed]
+        is_changed = True
+        while is_changed:
+            is_changed = False
+            renamed_indexes = {rename.index for rename in pending}
+            claimed_indexes: dict[str, int] = {}
+            for rename in pending:
+                holders = [i for i in name_indexes.get(rename.new_name, ()) if i not in renamed_indexes]
+                if holders:
+                    rename.status = FeatureRename.NAME_EXISTS
+                    rename.conflicting_index = holders[0]
+                elif rename.new_name in claimed_indexes:
+                    rename.status = FeatureRename.DUPLICATE
+                    rename.conflicting_index = claimed_indexes[rename.new_name]
+                else:
+                    claimed_indexes[rename.new_name] = rename.index
+                    continue
+                is_changed = True
+            pending = [rename for rename in pending if rename.is_renamed]
+
+    # Properties
+    @property
+    def new_names(self) -> dict[str, str]:
+        new_names: dict[str, str] = {}
+        for rename in self.renamed:
+            if rename.old_name:
+                new_names.setdefault(rename.old_name, rename.new_name)
+        return new_names
+
+    @property
+    def renamed(self) -> List[FeatureRename]:
+        return [rename for rename in self._renames if rename.is_renamed]
+
+    @property
+    def skipped(self) -> List[FeatureRename]:
+        return [rename for rename in self._renames
+                if rename.status in (FeatureRename.DUPLICATE, FeatureRename.NAME_EXISTS)]
@@ -1,22 +1,35 @@
+import hashlib
 import os
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from queue import Queue
+from threading import Event, Semaphore, Thread
+from typing import Callable, Iterable, List, Optional
 
-import lib.Utilities
 from lib import Utilities
-from lib.DimensionNameParser import DimensionNameSorter
+from lib.DimensionNameParser import DimensionNameCache, DimensionNameCacheStats, DimensionNameSorter, \
+    DimensionNameTranslation, DimensionRuleException, DimensionRuleStatistics
+from lib.MicroVuFileReader import MicroVuFileReader
+from lib.MicroVuFileWriter import MicroVuFileWriter
 from lib.MicroVuProgram import MicroVuProgram, MicroVuException, DimensionName
-from lib.Utilities import get_unencoded_file_lines, get_utf_encoded_file_lines, get_filepath_by_name
+from lib.ResourceRegistry import ResourceRegistry
+from lib.Settings import Settings
 
 
 class Processor(metaclass=ABCMeta):
+    LEGACY_PROMPT_NAMES: tuple[str, ...] = ()
+    SITE: str = ""
     _dimension_root: str
     _export_path: str
     _hand_edit_dimension_names: bool
     _microvu_programs: List[MicroVuProgram] = []
-    _sorter: DimensionNameSorter
+    _point_cloud_reductions: List[str]
+    _resources: ResourceRegistry
+    _settings: Settings
+    _skipped_renames: List[str]
+    _written_files: List[MicroVuFileWriter]
 
     @abstractmethod
     def process_files(self) -> None:
@@ -24,32 +37,71 @@ class Processor(metaclass=ABCMeta):
 
     def __init__(self, user_initials: str):
         self.user_initials = user_initials
-        self._dimension_root: str = lib.Utilities.GetStoredIniValue("GlobalSettings", "dimension_root", "Settings")
-        hand_edit_setting_value = lib.Utilities.GetStoredIniValue("GlobalSettings", "hand_edit_dimension_names", "Settings")
-        self._export_path = lib.Utilities.GetStoredIniValue("Paths", "export_path", "Settings")
-        self._hand_edit_dimension_names = hand_edit_setting_value == "True"
-        Processor._sorter = DimensionNameSorter()
+        self._resources = Utilities.get_resources()
+        self._settings = Utilities.get_settings()
+        self._dimension_root: str = self._settings.dimension_root
+        self._export_path = self._settings.export_path
+        self._hand_edit_dimension_names = self._settings.hand_edit_dimension_names
+        self._point_cloud_reductions = []
+        self._skipped_renames = []
+        self._written_files = []
+        try:
+            DimensionNameSorter.load_rules(Utilities.get_dimension_rules_filepath())
+        except DimensionRuleException as e:
+            raise ProcessorException(e.args[0]) from e
+        DimensionNameSorter.get_shared().is_adaptive = self._settings.adaptive_dimension_rule_order
+        DimensionNameCache.get_shared().resize(
+            self._settings.dimension_name_cache_size or DimensionNameCache.DEFAULT_MAX_SIZE)
+
+    @staticmethod
+    def check_output_filepath(output_filepath: str) -> None:
+        if os.path.exists(output_filepath):
+            file_name = Path(output_filepath).name
+            dir_name = os.path.dirname(output_filepath)
+            raise ProcessorException(
+                f"File '{file_name}' already exists in output directory '{dir_name}'."
+            )
 
     @staticmethod
     def parse_dimension_name(dimension_name: str, dimension_root: str) -> str:
-        return Processor._sorter.get_dimension_name(dimension_name, dimension_root)
+        return DimensionNameCache.get_shared().get_dimension_name(dimension_name, dimension_root)
+
+    @staticmethod
+    def parse_dimension_names(dimension_names: List[str], dimension_root: str) -> DimensionNameTranslation:
+        return DimensionNameCache.get_shared().translate_many(dimension_names, dimension_root)
 
     @property
     def allow_deletion_of_old_program(self) -> bool:
-        return Utilities.GetStoredIniValue("GlobalSettings", "allow_delete", "Settings") == "True"
+        return self._settings.allow_delete
 
     @property
     def disable_on_convert(self) -> bool:
-        return Utilities.GetStoredIniValue("GlobalSettings", "disable_on_convert", "Settings") == "True"
+        return self._settings.disable_on_convert
 
     @property
     def remove_bring_to_metrology_pic(self) -> bool:
-        return Utilities.GetStoredIniValue("GlobalSettings", "remove_bring_to_metrology_pic", "Settings") == "True"
+        return self._settings.remove_bring_to_metrology_pic
+
+    @property
+    def legacy_prompt_names(self) -> tuple[str, ...]:
+        return self._settings.get_legacy_prompt_names(self.SITE) or self.LEGACY_PROMPT_NAMES
 
     @property
     def micro_vu_programs(self) -> list[MicroVuProgram]:
         return self._microvu_programs
 
+    @property
+    def point_cloud_reductions(self) -> list[str]:
+        return self._point_cloud_reductions
+
+    @property
+    def skipped_renames(self) -> list[str]:
+        return self._skipped_renames
+
+    @property
+    def written_files(self) -> list[MicroVuFileWriter]:
+        return self._written_files
+
     def add_micro_vu_program(self, micro_vu: MicroVuProgram):
         self._microvu_programs.append(micro_vu)
 
@@ -59,26 +111,53 @@ class Processor(metaclass=ABCMeta):
 
 
 class CoonRapidsProcessor(Processor):
+    LEGACY_PROMPT_NAMES: tuple[str, ...] = (
+        "PT #", "Employee #", "Machine #", "PT#", "Employee#", "Machine#", "Run-Setup", "Job #", "Job#", "PT",
+        "REV LETTER", "OPERATION", "EMPLOYEE", "JOB", "MACHINE", "IN PROCESS", "SEQUENCE", "SPFILENAME",
+    )
+    PIPELINE_QUEUE_SIZE: int = 4
+    PROMPT_LINE_TYPES: tuple[str, ...] = ("Prmt", "Txt")
+    SITE: str = "CoonRapids"
+
+    def _convert_micro_vu(self, micro_vu: MicroVuProgram) -> None:
+        self._transform_micro_vu(micro_vu, True)
+        self._write_file_to_harddrive(micro_vu)
+        if self.allow_deletion_of_old_program:
+            micro_vu.file_lines.materialize()
+            os.remove(micro_vu.filepath)
+
+    def _transform_micro_vu(self, micro_vu: MicroVuProgram, is_converting: bool) -> None:
+        self._replace_export_filepath(micro_vu)
+        self._replace_report_filepath(micro_vu)
+        if not micro_vu.is_smartprofile:
+            self._replace_dimension_names(micro_vu)
+        else:
+            self._inject_smart_profile_call(micro_vu)
+            self._decimate_point_cloud(micro_vu)
+        self._replace_prompt_section(micro_vu)
+        if not micro_vu.has_text_kill:
+            self._inject_kill_file_call(micro_vu)
+        is_disabling = is_converting and self.disable_on_convert
+        if is_disabling and not micro_vu.has_bring_to_metrology_picture:
+            self._inject_bring_to_metrology_picture(micro_vu)
+        self._update_comments(micro_vu)
+        if is_disabling:
+            self._disable_dimensions(micro_vu)
+        if not is_converting and self.remove_bring_to_metrology_pic:
+            self._remove_bring_to_metrology_picture(micro_vu)
+        micro_vu.update_instruction_count()
+
+    def _decimate_point_cloud(self, micro_vu: MicroVuProgram) -> None:
+        spacing = self._settings.point_cloud_spacing
+        point_count = self._settings.point_cloud_point_count
+        if not micro_vu.is_smartprofile or (spacing <= 0 and point_count <= 0):
+            return
+        decimation = micro_vu.decimate_point_cloud(spacing, point_count)
+        if decimation.removed_count:
+            self._point_cloud_reductions.append(f"{micro_vu.filename}: {decimation}")
 
     def _delete_old_prompts(self, micro_vu):
-        micro_vu.delete_line_containing_text("Name \"PT #\"")
-        micro_vu.delete_line_containing_text("Name \"Employee #\"")
-        micro_vu.delete_line_containing_text("Name \"Machine #\"")
-        micro_vu.delete_line_containing_text("Name \"PT#\"")
-        micro_vu.delete_line_containing_text("Name \"Employee#\"")
-        micro_vu.delete_line_containing_text("Name \"Machine#\"")
-        micro_vu.delete_line_containing_text("Name \"Run-Setup\"")
-        micro_vu.delete_line_containing_text("Name \"Job #\"")
-        micro_vu.delete_line_containing_text("Name \"Job#\"")
-        micro_vu.delete_line_containing_text("Name \"PT\"")
-        micro_vu.delete_line_containing_text("Name \"REV LETTER\"")
-        micro_vu.delete_line_containing_text("Name \"OPERATION\"")
-        micro_vu.delete_line_containing_text("Name \"EMPLOYEE\"")
-        micro_vu.delete_line_containing_text("Name \"JOB\"")
-        micro_vu.delete_line_containing_text("Name \"MACHINE\"")
-        micro_vu.delete_line_containing_text("Name \"IN PROCESS\"")
-        micro_vu.delete_line_containing_text("Name \"SEQUENCE\"")
-        micro_vu.delete_line_containing_text("Name \"SPFILENAME\"")
+        micro_vu.delete_named_lines(self.legacy_prompt_names, self.PROMPT_LINE_TYPES)
 
     def _disable_dimensions(self, micro_vu):
         for i, line in enumerate(micro_vu.file_lines):
@@ -100,12 +179,7 @@ class CoonRapidsProcessor(Processor):
     def _get_new_prompts(self, micro_vu: MicroVuProgram) -> list[str]:
         pattern = 'sp_prompt_text.txt' if micro_vu.is_smartprofile else 'prompt_text.txt'
 
-        prompt_file = get_filepath_by_name(pattern)
-        if not prompt_file:
-            return []
-
-        prompt_lines = get_utf_encoded_file_lines(prompt_file)
-        return prompt_lines or []
+        return self._resources.get_lines(pattern)
 
     def _inject_bring_to_metrology_picture(self, micro_vu: MicroVuProgram) -> None:
 
@@ -114,40 +188,28 @@ class CoonRapidsProcessor(Processor):
 
         bring_to_met_pic_idx = micro_vu.bring_part_to_metrology_index
 
-        bring_to_met_text_filepath = get_filepath_by_name('BringPartToMetrology_text.txt')
-        if not bring_to_met_text_filepath:
-            raise ProcessorException("Can't find 'BringPartToMetrology_text' file.")
-
-        lines = get_unencoded_file_lines(bring_to_met_text_filepath)
+        lines = self._resources.get_lines('BringPartToMetrology_text.txt')
         if not lines:
             raise ProcessorException("Can't find 'BringPartToMetrology_text' file.")
 
-        micro_vu.insert_line(bring_to_met_pic_idx, lines[3])
-        micro_vu.insert_line(bring_to_met_pic_idx, lines[2])
-        micro_vu.insert_line(bring_to_met_pic_idx, lines[1])
+        micro_vu.insert_lines(bring_to_met_pic_idx, lines[1:4])
 
     def _inject_kill_file_call(self, micro_vu: MicroVuProgram) -> None:
 
         if micro_vu.instructions_index == -1:
             return
 
-        if any("killFile.bat" in line for line in micro_vu.file_lines):
+        if micro_vu.kill_file_call_index > -1:
             self._replace_kill_file_call(micro_vu)
             return
 
         text_kill_index = micro_vu.instructions_index + 1
 
-        textkill_filepath = get_filepath_by_name('TextKill_text.txt')
-        if not textkill_filepath:
-            raise ProcessorException("Can't find 'TextKill_text' file.")
-
-        lines = get_unencoded_file_lines(textkill_filepath)
+        lines = self._resources.get_lines('TextKill_text.txt')
         if not lines:
             raise ProcessorException("Can't find 'TextKill_text' file.")
 
-        micro_vu.insert_line(text_kill_index, lines[3])
-        micro_vu.insert_line(text_kill_index, lines[2])
-        micro_vu.insert_line(text_kill_index, lines[1])
+        micro_vu.insert_lines(text_kill_index, lines[1:4])
 
     def _inject_smart_profile_call(self, micro_vu: MicroVuProgram) -> None:
 
@@ -168,17 +230,13 @@ class CoonRapidsProcessor(Processor):
         if not microvu_system_id:
             return
 
-        smartprofile_filepath = get_filepath_by_name('CallSmartProfile_text.txt')
-        if not smartprofile_filepath:
-            raise ProcessorException("Can't find 'CallSmartProfile_text' file.")
-
-        prompt_lines = get_unencoded_file_lines(smartprofile_filepath)
+        prompt_lines = self._resources.get_lines('CallSmartProfile_text.txt')
         if not prompt_lines:
             raise ProcessorException("Can't find 'CallSmartProfile_text' file.")
 
         smartprofile_line = prompt_lines[1]
-        smartprofile_script_path = lib.Utilities.GetStoredIniValue("Paths", "smart_profile_script_filepath", "Settings")
-        smartprofile_exe_path = lib.Utilities.GetStoredIniValue("Paths", "smart_profile_exe_filepath", "Settings")
+        smartprofile_script_path = self._settings.smart_profile_script_filepath
+        smartprofile_exe_path = self._settings.smart_profile_exe_filepath
         smartprofile_line = smartprofile_line.replace("<?SYS>", microvu_system_id)
         smartprofile_line = smartprofile_line.replace("<?EXE>", smartprofile_exe_path)
         smartprofile_line = smartprofile_line.replace("<?SCR>", smartprofile_script_path)
@@ -191,20 +249,19 @@ class CoonRapidsProcessor(Processor):
         if idx == -1:
             return
 
-        del micro_vu.file_lines[idx + 2]
-        del micro_vu.file_lines[idx + 1]
-        del micro_vu.file_lines[idx]
+        micro_vu.delete_lines([idx, idx + 1, idx + 2])
 
     def _replace_dimension_names(self, micro_vu: MicroVuProgram) -> None:
         if micro_vu.is_smartprofile:
             return
         dimension_names: list[DimensionName] = micro_vu.dimension_names
-        for dimension_name in dimension_names:
-            if self._hand_edit_dimension_names:
-                new_dimension_name = dimension_name.name
-            else:
-                new_dimension_name = Processor.parse_dimension_name(dimension_name.name, self._dimension_root)
-            micro_vu.update_feature_name(dimension_name.index, new_dimension_name)
+        new_dimension_names = [dimension_name.name for dimension_name in dimension_names]
+        if not self._hand_edit_dimension_names:
+            new_dimension_names = Processor.parse_dimension_names(
+                new_dimension_names, self._dimension_root).dimension_names
+        rename_plan = micro_vu.update_feature_names(dict(zip(
+            [dimension_name.index for dimension_name in dimension_names], new_dimension_names)))
+        self._skipped_renames.extend(f"{micro_vu.filename}: {rename}" for rename in rename_plan.skipped)
 
     def _replace_export_filepath(self, micro_vu: MicroVuProgram) -> None:
         if micro_vu.is_smartprofile:
@@ -222,16 +279,12 @@ class CoonRapidsProcessor(Processor):
         micro_vu.export_filepath = export_filepath
 
     def _replace_kill_file_call(self, micro_vu: MicroVuProgram):
-        killfile_index = next(
-            (i for i, l in enumerate(micro_vu.file_lines)
-             if "killFile.bat" in l), -1
-        )
+        killfile_index = micro_vu.kill_file_call_index
         if killfile_index == -1:
             return
-        current_line = micro_vu.file_lines[killfile_index]
-        killfile_node = MicroVuProgram.get_node(current_line, "CmdText")
-        new_line = current_line.replace(killfile_node, "(CmdText \"\"\"C:\\killFile.bat\"\"\")")
-        micro_vu.file_lines[killfile_index] = new_line
+        line_nodes = micro_vu.file_lines.get_line_nodes(killfile_index)
+        line_nodes.set_text("CmdText", "\"C:\\killFile.bat\"")
+        micro_vu.file_lines[killfile_index] = line_nodes.text
 
     def _replace_prompt_section(self, micro_vu: MicroVuProgram) -> None:
         insert_index = micro_vu.prompt_insertion_index
@@ -245,39 +298,41 @@ class CoonRapidsProcessor(Processor):
 
         self._delete_old_prompts(micro_vu)
 
+        new_prompt_lines: list[str] = []
         for line in prompt_lines:
             if line.find("(Name \"IN PROCESS\")") > 0:
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"MACHINE\")") > 0:
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"JOB\")") > 0:
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"EMPLOYEE\")") > 0:
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"OPERATION\")") > 0:
                 line = line.replace("<O>", str(micro_vu.op_number))
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"REV LETTER\")") > 0:
                 line = line.replace("<R>", str(micro_vu.rev_number))
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"PT\")") > 0:
                 line = line.replace("<P>", str(micro_vu.part_number))
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"SEQUENCE\")") > 0:
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"SPFILENAME\")") > 0:
                 smartprofile_projectname = micro_vu.smartprofile_projectname
                 line = line.replace("<SPF>", smartprofile_projectname)
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
+        micro_vu.insert_lines(insert_index, new_prompt_lines)
         return
 
     def _replace_report_filepath(self, micro_vu: MicroVuProgram) -> None:
@@ -286,7 +341,7 @@ class CoonRapidsProcessor(Processor):
             return
         view_name = micro_vu.view_name
         part_rev = f"REV{micro_vu.rev_number}"
-        report_filepath: str = Utilities.GetStoredIniValue("Paths", "reporting_root_path", "Settings")
+        report_filepath: str = self._settings.reporting_root_path
         report_filepath += micro_vu.part_number
         report_filepath += f"_OP{micro_vu.op_number}"
         if len(view_name) > 0:
@@ -302,59 +357,122 @@ class CoonRapidsProcessor(Processor):
         micro_vu.comment = current_comment
 
     def _write_file_to_harddrive(self, micro_vu: MicroVuProgram) -> None:
-        if os.path.exists(micro_vu.output_filepath):
-            file_name = Path(micro_vu.output_filepath).name
-            dir_name = os.path.dirname(micro_vu.output_filepath)
-            raise ProcessorException(
-                f"File '{file_name}' already exists in output directory '{dir_name}'."
-            )
+        Processor.check_output_filepath(micro_vu.output_filepath)
         os.makedirs(micro_vu.output_directory, exist_ok=True)
-        with open(micro_vu.output_filepath, 'w+', encoding='utf-16-le', newline='\r\n') as f:
-            for line in micro_vu.file_lines:
-                f.write(f"{line}")
+        self._written_files.append(micro_vu.write_file(micro_vu.output_filepath, self._settings.fsync_output_files))
+
+    def _write_processor_results(self, write_queue: Queue, in_flight: Semaphore, results: list["ProcessorResult"],
+                                 on_result: Optional[Callable[["ProcessorResult"], None]]) -> None:
+        while (item := write_queue.get()) is not None:
+            job, future = item
+            try:
+                result = future.result()
+            except Exception as e:
+                result = ProcessorResult(job.input_filepath, error=str(e) or type(e).__name__)
+            results.append(result)
+            if result.succeeded:
+                self._write_result_to_harddrive(job, result)
+            result.output_lines = []
+            in_flight.release()
+            if on_result is not None:
+                on_result(result)
+
+    def _write_result_to_harddrive(self, job: "ProcessorJob", result: "ProcessorResult") -> None:
+        try:
+            Processor.check_output_filepath(result.output_filepath)
+            os.makedirs(os.path.dirname(result.output_filepath), exist_ok=True)
+            written_file = MicroVuFileWriter.write_lines(result.output_filepath, result.output_lines,
+                                                         is_fsync=self._settings.fsync_output_files)
+            result.write_seconds = written_file.elapsed_seconds
+            result.written_byte_count = written_file.byte_count
+            if job.transform == ProcessorJob.CONVERT and self.allow_deletion_of_old_program:
+                os.remove(result.input_filepath)
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
 
     def process_file(self, micro_vu: MicroVuProgram):
-        self._replace_export_filepath(micro_vu)
-        self._replace_report_filepath(micro_vu)
-        if not micro_vu.is_smartprofile:
-            self._replace_dimension_names(micro_vu)
-        else:
-            self._inject_smart_profile_call(micro_vu)
-        self._replace_prompt_section(micro_vu)
-        if not micro_vu.has_text_kill:
-            self._inject_kill_file_call(micro_vu)
-        self._update_comments(micro_vu)
-        if self.remove_bring_to_metrology_pic:
-            self._remove_bring_to_metrology_picture(micro_vu)
-        micro_vu.update_instruction_count()
-        self._write_file_to_harddrive(micro_vu)
+        with micro_vu:
+            self._transform_micro_vu(micro_vu, False)
+            self._write_file_to_harddrive(micro_vu)
 
     def process_files(self) -> None:
+        self._point_cloud_reductions.clear()
+        self._skipped_renames.clear()
+        self._written_files.clear()
         try:
             for micro_vu in self.micro_vu_programs:
-                self._replace_export_filepath(micro_vu)
-                self._replace_report_filepath(micro_vu)
-                if not micro_vu.is_smartprofile:
-                    self._replace_dimension_names(micro_vu)
-                else:
-                    self._inject_smart_profile_call(micro_vu)
-                self._replace_prompt_section(micro_vu)
-                if not micro_vu.has_text_kill:
-                    self._inject_kill_file_call(micro_vu)
-                if self.disable_on_convert and not micro_vu.has_bring_to_metrology_picture:
-                    self._inject_bring_to_metrology_picture(micro_vu)
-                self._update_comments(micro_vu)
-                if self.disable_on_convert:
-                    self._disable_dimensions(micro_vu)
-                micro_vu.update_instruction_count()
-                self._write_file_to_harddrive(micro_vu)
-                if self.allow_deletion_of_old_program:
-                    os.remove(micro_vu.filepath)
+                self._convert_micro_vu(micro_vu)
         except Exception as e:
             raise ProcessorException(e.args[0]) from e
+        finally:
+            for micro_vu in self.micro_vu_programs:
+                micro_vu.close()
+
+    def process_files_in_pipeline(self, jobs: Optional[Iterable["ProcessorJob"]] = None,
+                                  max_workers: Optional[int] = None, queue_size: int = PIPELINE_QUEUE_SIZE,
+                                  on_result: Optional[Callable[["ProcessorResult"], None]] = None
+                                  ) -> list["ProcessorResult"]:
+        if jobs is None:
+            jobs = [ProcessorJob.from_micro_vu(type(self), self.user_initials, micro_vu) for micro_vu in self.micro_vu_programs]
+            for micro_vu in self.micro_vu_programs:
+                micro_vu.close()
+        max_workers = max_workers or os.cpu_count() or 1
+        read_queue: Queue = Queue(maxsize=queue_size)
+        write_queue: Queue = Queue()
+        in_flight = Semaphore(max_workers + queue_size)
+        results: list[ProcessorResult] = []
+        stop_event = Event()
+        reader = Thread(target=_read_processor_jobs, args=(jobs, read_queue, stop_event), daemon=True)
+        writer = Thread(target=self._write_processor_results, args=(write_queue, in_flight, results, on_result),
+                        daemon=True)
+        reader.start()
+        writer.start()
+        is_reading = True
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                while (item := read_queue.get()) is not None:
+                    job, error = item
+                    in_flight.acquire()
+                    if error:
+                        future = Future()
+                        future.set_result(ProcessorResult(job.input_filepath, error=error))
+                    else:
+                        future = executor.submit(run_processor_transform_job, job)
+                    write_queue.put((job, future))
+                is_reading = False
+        finally:
+            stop_event.set()
+            while is_reading and read_queue.get() is not None:
+                pass
+            reader.join()
+            write_queue.put(None)
+            writer.join()
+        return results
+
+    def process_files_in_pool(self, max_workers: Optional[int] = None) -> list["ProcessorResult"]:
+        jobs = [ProcessorJob.from_micro_vu(type(self), self.user_initials, micro_vu) for micro_vu in self.micro_vu_programs]
+        for micro_vu in self.micro_vu_programs:
+            micro_vu.close()
+        if max_workers == 1:
+            return [run_processor_job(job) for job in jobs]
+        results: list[ProcessorResult] = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_processor_job, job) for job in jobs]
+            for job, future in zip(jobs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(ProcessorResult(job.input_filepath, error=str(e) or type(e).__name__))
+        return results
 
 
 class AnokaProcessor(CoonRapidsProcessor):
+    LEGACY_PROMPT_NAMES: tuple[str, ...] = (
+        "PT #", "Employee #", "Machine #", "PT#", "Employee#", "Machine#", "Run-Setup", "Job #", "Job#", "PT",
+        "REV LETTER", "OPERATION", "EMPLOYEE", "JOB", "MACHINE", "IN PROCESS", "SEQUENCE", "SPFILENAME",
+    )
+    SITE: str = "Anoka"
+
     def __init__(self, user_initials: str):
         super().__init__(user_initials)
 
@@ -371,9 +489,8 @@ class AnokaProcessor(CoonRapidsProcessor):
             raise ProcessorException(f"Can't determine where to put the prompts. Cannot process file {micro_vu.filename}.")
 
         start_idx: int = micro_vu.get_index_containing_text("AutoExpFile")
-        for idx in range(insert_idx, start_idx, -1):
-            if micro_vu.file_lines[idx].startswith("Prmt"):
-                del micro_vu.file_lines[idx]
+        micro_vu.delete_lines([idx for idx in range(insert_idx, start_idx, -1)
+                               if micro_vu.file_lines[idx].startswith("Prmt")])
 
         insert_index: int = micro_vu.get_index_containing_text("(Name \"START")
 
@@ -381,33 +498,34 @@ class AnokaProcessor(CoonRapidsProcessor):
         if not prompt_lines:
             raise ProcessorException("Can't find 'prompt_text' file.")
 
+        new_prompt_lines: list[str] = []
         for line in prompt_lines:
             if line.find("(Name \"IN PROCESS\")") > 0:
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"MACHINE\")") > 0:
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"JOB\")") > 0:
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"EMPLOYEE\")") > 0:
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"OPERATION\")") > 0:
                 line = line.replace("<O>", str(micro_vu.op_number))
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"REV LETTER\")") > 0:
                 line = line.replace("<R>", str(micro_vu.rev_number))
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"PT\")") > 0:
                 line = line.replace("<P>", str(micro_vu.part_number))
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"SEQUENCE\")") > 0:
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
             if line.find("(Name \"SPFILENAME\")") > 0:
                 try:
@@ -415,13 +533,14 @@ class AnokaProcessor(CoonRapidsProcessor):
                 except MicroVuException as e:
                     raise ProcessorException(e.args[0]) from e
                 line = line.replace("<SPF>", smartprofile_projectname)
-                micro_vu.insert_line(insert_index, line)
+                new_prompt_lines.insert(0, line)
                 continue
+        micro_vu.insert_lines(insert_index, new_prompt_lines)
         return
 
 
 def get_processor(user_initials: str):
-    if Utilities.GetStoredIniValue("Location", "Site", "Settings") == "CoonRapids":
+    if Utilities.get_settings().site == CoonRapidsProcessor.SITE:
         processor = CoonRapidsProcessor(user_initials)
     else:
         processor = AnokaProcessor(user_initials)
@@ -432,3 +551,185 @@ def get_processor(user_initials: str):
 
 class ProcessorException(Exception):
     pass
+
+
+class ProcessorJob:
+    CONVERT: str = "convert"
+    PROCESS_FILE: str = "process file"
+
+    @staticmethod
+    def from_micro_vu(processor_type: type[CoonRapidsProcessor], user_initials: str, micro_vu: MicroVuProgram,
+                      transform: str = CONVERT) -> "ProcessorJob":
+        return ProcessorJob(processor_type, user_initials, micro_vu.filepath, micro_vu.op_number,
+                            micro_vu.rev_number, micro_vu.smartprofile_projectname, micro_vu.manual_dimension_names,
+                            transform)
+
+    def __init__(self, processor_type: type[CoonRapidsProcessor], user_initials: str, input_filepath: str,
+                 op_number: str, rev_number: str, smartprofile_projectname: str = "",
+                 manual_dimension_names: Iterable[DimensionName] = (), transform: str = CONVERT):
+        self.processor_type = processor_type
+        self.user_initials = user_initials
+        self.input_filepath = input_filepath
+        self.op_number = op_number
+        self.rev_number = rev_number
+        self.smartprofile_projectname = smartprofile_projectname
+        self.manual_dimension_names = list(manual_dimension_names)
+        self.file_bytes = b""
+        self.transform = transform
+
+    @property
+    def content_hash(self) -> str:
+        return hashlib.sha256(self.file_bytes).hexdigest()
+
+    @property
+    def output_filepath(self) -> str:
+        return MicroVuProgram.get_output_filepath(self.input_filepath)
+
+    def get_file_lines(self) -> Optional[list[str]]:
+        return MicroVuFileReader.decode_lines(self.file_bytes) if self.file_bytes else None
+
+    def read_file(self) -> None:
+        if self.file_bytes:
+            return
+        with open(self.input_filepath, "rb") as f:
+            self.file_bytes = f.read()
+
+
+class ProcessorResult:
+
+    def __init__(self, input_filepath: str, output_filepath: str = "", error: str = "",
+                 dimension_name_cache_stats: Optional[DimensionNameCacheStats] = None,
+                 dimension_rule_statistics: Optional[DimensionRuleStatistics] = None):
+        self.input_filepath = input_filepath
+        self.output_filepath = output_filepath
+        self.error = error
+        self.dimension_name_cache_stats = dimension_name_cache_stats or DimensionNameCacheStats()
+        self.dimension_rule_statistics = dimension_rule_statistics or DimensionRuleStatistics()
+        self.output_lines: list[str] = []
+        self.point_cloud_reductions: list[str] = []
+        self.skipped_renames: list[str] = []
+        self.write_seconds = 0.0
+        self.written_byte_count = 0
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.error
+
+
+class ProcessorBatchSummary:
+
+    def __init__(self, results: list[ProcessorResult]):
+        self.results = results
+        self.dimension_name_cache_stats = DimensionNameCacheStats()
+        self.dimension_rule_statistics = DimensionRuleStatistics()
+        for result in results:
+            self.dimension_name_cache_stats += result.dimension_name_cache_stats
+            self.dimension_rule_statistics += result.dimension_rule_statistics
+
+    def __str__(self) -> str:
+        lines = [f"Converted {self.succeeded_count} of {len(self.results)} files."]
+        lines.extend(f"{result.input_filepath}: {result.error}" for result in self.failed_results)
+        if skipped_renames := self.skipped_renames:
+            lines.append(f"Skipped {len(skipped_renames)} dimension renames:")
+            lines.extend(skipped_renames)
+        if point_cloud_reductions := self.point_cloud_reductions:
+            lines.append(f"Decimated {len(point_cloud_reductions)} point clouds:")
+            lines.extend(point_cloud_reductions)
+        lines.append(f"Wrote {self.written_byte_count:,} bytes in {self.write_seconds:.2f} s.")
+        lines.append(f"Dimension name cache: {self.dimension_name_cache_stats} "
+                     f"({self.dimension_name_cache_stats.hit_rate:.0%} hit rate)")
+        lines.append(f"Dimension name rules: {self.dimension_rule_statistics}")
+        return "\n".join(lines)
+
+    @property
+    def failed_results(self) -> list[ProcessorResult]:
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def point_cloud_reductions(self) -> list[str]:
+        return [reduction for result in self.results for reduction in result.point_cloud_reductions]
+
+    @property
+    def skipped_renames(self) -> list[str]:
+        return [skipped_rename for result in self.results for skipped_rename in result.skipped_renames]
+
+    @property
+    def succeeded_count(self) -> int:
+        return len(self.results) - len(self.failed_results)
+
+    @property
+    def write_seconds(self) -> float:
+        return sum(result.write_seconds for result in self.results)
+
+    @property
+    def written_byte_count(self) -> int:
+        return sum(result.written_byte_count for result in self.results)
+
+    def export_dimension_rule_statistics(self, filepath: str) -> None:
+        rule_names = (p.name for p in DimensionNameSorter.get_shared().dimension_parsers)
+        self.dimension_rule_statistics.export_json(filepath, rule_names)
+
+
+def _read_processor_jobs(jobs: Iterable[ProcessorJob], read_queue: Queue, stop_event: Event) -> None:
+    try:
+        for job in jobs:
+            if stop_event.is_set():
+                break
+            error = ""
+            try:
+                job.read_file()
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            read_queue.put((job, error))
+    finally:
+        read_queue.put(None)
+
+
+def _run_processor_job(job: ProcessorJob, is_writing: bool) -> ProcessorResult:
+    cache_stats = DimensionNameCache.get_shared().stats
+    rule_statistics = DimensionNameSorter.get_shared().statistics
+    output_filepath = ""
+    output_existed = True
+    output_lines: list[str] = []
+    error = ""
+    point_cloud_reductions: list[str] = []
+    skipped_renames: list[str] = []
+    written_files: list[MicroVuFileWriter] = []
+    try:
+        micro_vu = MicroVuProgram(job.input_filepath, job.op_number, job.rev_number, job.smartprofile_projectname,
+                                  job.get_file_lines())
+        if job.manual_dimension_names:
+            micro_vu.manual_dimension_names = job.manual_dimension_names
+        output_filepath = micro_vu.output_filepath
+        output_existed = os.path.exists(output_filepath)
+        processor = job.processor_type(job.user_initials)
+        if is_writing:
+            processor._convert_micro_vu(micro_vu)
+        else:
+            Processor.check_output_filepath(output_filepath)
+            processor._transform_micro_vu(micro_vu, job.transform == ProcessorJob.CONVERT)
+            output_lines = list(micro_vu.file_lines)
+        point_cloud_reductions = processor.point_cloud_reductions
+        skipped_renames = processor.skipped_renames
+        written_files = processor.written_files
+    except Exception as e:
+        if output_filepath and not output_existed and os.path.exists(output_filepath):
+            os.remove(output_filepath)
+        error = str(e) or type(e).__name__
+    result = ProcessorResult(job.input_filepath, output_filepath, error,
+                             DimensionNameCache.get_shared().stats - cache_stats,
+                             DimensionNameSorter.get_shared().statistics - rule_statistics)
+    result.output_lines = output_lines
+    result.point_cloud_reductions = point_cloud_reductions
+    result.skipped_renames = skipped_renames
+    result.write_seconds = sum(written_file.elapsed_seconds for written_file in written_files)
+    result.written_byte_count = sum(written_file.byte_count for written_file in written_files)
+    return result
+
+
+def run_processor_job(job: ProcessorJob) -> ProcessorResult:
+    return _run_processor_job(job, True)
+
+
+def run_processor_transform_job(job: ProcessorJob) -> ProcessorResult:
+    return _run_processor_job(job, False)
@@ -0,0 +1,168 @@
+import hashlib
+import mmap
+import os
+import re
+from collections.abc import Sequence
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+class MicroVuFileReader(Sequence):
+    ENCODING: str = "utf-16-le"
+    _CODE_UNIT_SIZE: int = 2
+
+    _filepath: str
+    _line_offsets: np.ndarray
+    _mmap: Optional[mmap.mmap]
+
+    # Static Methods
+    @staticmethod
+    def decode_lines(data: bytes) -> list[str]:
+        code_unit_count = len(data) // MicroVuFileReader._CODE_UNIT_SIZE
+        text = data[:code_unit_count * MicroVuFileReader._CODE_UNIT_SIZE].decode(MicroVuFileReader.ENCODING)
+        lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        last_line = lines.pop()
+        lines = [f"{line}\n" for line in lines]
+        if last_line:
+            lines.append(last_line)
+        return lines
+
+    # Dunder Methods
+    def __init__(self, filepath: str):
+        self._filepath = filepath
+        self._mmap = None
+        with open(filepath, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size >= MicroVuFileReader._CODE_UNIT_SIZE:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._line_offsets = self._get_line_offsets(file_size)
+
+    def __enter__(self) -> "MicroVuFileReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __getitem__(self, index: int) -> str:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MicroVuFileReader index out of range")
+        return self.decode(int(self._line_offsets[index]), int(self._line_offsets[index + 1]))
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self) -> int:
+        return len(self._line_offsets) - 1
+
+    # Internal Methods
+    def _find(self, encoded_text: bytes, pattern: Optional[re.Pattern], begin_offset: int) -> int:
+        if pattern is None:
+            return self._mmap.find(encoded_text, begin_offset)
+        match = pattern.search(self._mmap, begin_offset)
+        return match.start() if match else -1
+
+    def _get_line_offsets(self, file_size: int) -> np.ndarray:
+        if self._mmap is None:
+            return np.zeros(1, dtype=np.int64)
+        code_unit_count = file_size // MicroVuFileReader._CODE_UNIT_SIZE
+        code_units = np.frombuffer(self._mmap, dtype="<u2", count=code_unit_count)
+        line_feeds = code_units == 0x0A
+        carriage_returns = code_units == 0x0D
+        carriage_returns[:-1] &= ~line_feeds[1:]
+        line_ends = np.flatnonzero(line_feeds | carriage_returns) + 1
+        del code_units
+        offsets = [np.zeros(1, dtype=np.int64), line_ends.astype(np.int64) * MicroVuFileReader._CODE_UNIT_SIZE]
+        if not len(line_ends) or line_ends[-1] != code_unit_count:
+            offsets.append(np.array([code_unit_count * MicroVuFileReader._CODE_UNIT_SIZE], dtype=np.int64))
+        return np.concatenate(offsets)
+
+    # Properties
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def is_closed(self) -> bool:
+        return self._mmap is None
+
+    # Public Methods
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def decode(self, begin_offset: int, end_offset: int, errors: str = "strict") -> str:
+        if self._mmap is None:
+            raise ValueError(f"File '{self._filepath}' is closed.")
+        text = self._mmap[begin_offset:end_offset].decode(MicroVuFileReader.ENCODING, errors)
+        if text.endswith("\r\n"):
+            return f"{text[:-2]}\n"
+        if text.endswith("\r"):
+            return f"{text[:-1]}\n"
+        return text
+
+    def find_line_indexes(self, text: str, min_column: int = 0, ignore_case: bool = False) -> list[int]:
+        offsets = self.find_offsets(text, ignore_case)
+        if not len(offsets):
+            return []
+        line_indexes = self.get_line_indexes(offsets)
+        columns = (offsets - self._line_offsets[line_indexes]) // MicroVuFileReader._CODE_UNIT_SIZE
+        return np.unique(line_indexes[columns >= min_column]).tolist()
+
+    def find_offsets(self, text: str, ignore_case: bool = False) -> np.ndarray:
+        if self._mmap is None:
+            return np.zeros(0, dtype=np.int64)
+        encoded_text = text.encode(MicroVuFileReader.ENCODING)
+        pattern = re.compile(re.escape(encoded_text), re.IGNORECASE) if ignore_case else None
+        offsets: list[int] = []
+        offset = self._find(encoded_text, pattern, 0)
+        while offset != -1:
+            if offset % MicroVuFileReader._CODE_UNIT_SIZE:
+                offset = self._find(encoded_text, pattern, offset + 1)
+                continue
+            offsets.append(offset)
+            offset = self._find(encoded_text, pattern, offset + len(encoded_text))
+        return np.array(offsets, dtype=np.int64)
+
+    def get_content_hash(self) -> str:
+        if self._mmap is None and len(self):
+            raise ValueError(f"File '{self._filepath}' is closed.")
+        return hashlib.sha256(self._mmap if self._mmap is not None else b"").hexdigest()
+
+    def get_line_indexes(self, offsets: np.ndarray) -> np.ndarray:
+        return np.searchsorted(self._line_offsets, offsets, side="right") - 1
+
+    def get_line_offsets(self, index: int) -> tuple[int, int]:
+        return int(self._line_offsets[index]), int(self._line_offsets[index + 1])
+
+    def get_line_prefix(self, index: int, length: int) -> str:
+        begin_offset, end_offset = self.get_line_offsets(index)
+        end_offset = min(end_offset, begin_offset + length * MicroVuFileReader._CODE_UNIT_SIZE)
+        return self.decode(begin_offset, end_offset, "ignore")
+
+    def get_line_values(self, prefix: str, terminator: str, min_column: int = 0) -> dict[int, str]:
+        offsets = self.find_offsets(prefix)
+        if not len(offsets):
+            return {}
+        line_indexes = self.get_line_indexes(offsets)
+        columns = (offsets - self._line_offsets[line_indexes]) // MicroVuFileReader._CODE_UNIT_SIZE
+        encoded_terminator = terminator.encode(MicroVuFileReader.ENCODING)
+        prefix_size = len(prefix) * MicroVuFileReader._CODE_UNIT_SIZE
+        values: dict[int, str] = {}
+        for offset, line_index, column in zip(offsets.tolist(), line_indexes.tolist(), columns.tolist()):
+            if column < min_column or line_index in values:
+                continue
+            value_offset = offset + prefix_size
+            line_end_offset = int(self._line_offsets[line_index + 1])
+            end_offset = self._mmap.find(encoded_terminator, value_offset, line_end_offset)
+            while end_offset != -1 and end_offset % MicroVuFileReader._CODE_UNIT_SIZE:
+                end_offset = self._mmap.find(encoded_terminator, end_offset + 1, line_end_offset)
+            if end_offset != -1:
+                values[line_index] = self.decode(value_offset, end_offset)
+        return values
@@ -0,0 +1,107 @@
+import os
+import stat
+import tempfile
+import time
+from typing import Iterable
+
+
+def _read_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+class MicroVuFileWriter:
+    CHUNK_SIZE: int = 1 << 20
+    ENCODING: str = "utf-16-le"
+    NEWLINE: str = "\r\n"
+    _TEMP_SUFFIX: str = ".tmp"
+    _UMASK: int = _read_umask()
+
+    _byte_count: int
+    _elapsed_seconds: float
+    _encoding: str
+    _filepath: str
+    _is_fsync: bool
+    _newline: str
+
+    # Static Methods
+    @staticmethod
+    def get_file_mode(filepath: str) -> int:
+        try:
+            return stat.S_IMODE(os.stat(filepath).st_mode)
+        except OSError:
+            return 0o666 & ~MicroVuFileWriter._UMASK
+
+    @staticmethod
+    def write_lines(filepath: str, lines: Iterable[str], encoding: str = ENCODING, newline: str = NEWLINE,
+                    is_fsync: bool = False) -> "MicroVuFileWriter":
+        writer = MicroVuFileWriter(filepath, encoding, newline, is_fsync)
+        writer.write(lines)
+        return writer
+
+    # Dunder Methods
+    def __init__(self, filepath: str, encoding: str = ENCODING, newline: str = NEWLINE, is_fsync: bool = False):
+        self._filepath = filepath
+        self._encoding = encoding
+        self._newline = newline
+        self._is_fsync = is_fsync
+        self._byte_count = 0
+        self._elapsed_seconds = 0.0
+
+    def __str__(self) -> str:
+        return f"{self._filepath}: {self._byte_count:,} bytes in {self._elapsed_seconds:.3f} s"
+
+    # Internal Methods
+    def _encode(self, chunk: list[str]) -> bytes:
+        text = "".join(chunk)
+        if self._newline not in ("", "\n"):
+            text = text.replace("\n", self._newline)
+        return text.encode(self._encoding)
+
+    def _write_chunks(self, f, lines: Iterable[str]) -> None:
+        chunk: list[str] = []
+        chunk_size = 0
+        for line in lines:
+            chunk.append(line)
+            chunk_size += len(line)
+            if chunk_size >= MicroVuFileWriter.CHUNK_SIZE:
+                self._byte_count += f.write(self._encode(chunk))
+                chunk = []
+                chunk_size = 0
+        if chunk:
+            self._byte_count += f.write(self._encode(chunk))
+
+    # Properties
+    @property
+    def byte_count(self) -> int:
+        return self._byte_count
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return self._elapsed_seconds
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    # Public Methods
+    def write(self, lines: Iterable[str]) -> None:
+        start_time = time.perf_counter()
+        self._byte_count = 0
+        directory, file_name = os.path.split(os.path.abspath(self._filepath))
+        file_descriptor, temp_filepath = tempfile.mkstemp(suffix=MicroVuFileWriter._TEMP_SUFFIX,
+                                                          prefix=f".{file_name}.", dir=directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as f:
+                self._write_chunks(f, lines)
+                if self._is_fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.chmod(temp_filepath, MicroVuFileWriter.get_file_mode(self._filepath))
+            os.replace(temp_filepath, self._filepath)
+        except BaseException:
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+            raise
+        self._elapsed_seconds = time.perf_counter() - start_time
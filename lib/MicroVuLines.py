@@ -0,0 +1,363 @@
+import re
+from collections.abc import MutableSequence
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from lib.MicroVuFileReader import MicroVuFileReader
+from lib.MicroVuNodes import MicroVuLineNodes
+
+
+class MicroVuLineEdit:
+    DELETE: str = "delete"
+    INSERT: str = "insert"
+    REPLACE: str = "replace"
+
+    def __init__(self, kind: str, index: int, original_index: int = -1):
+        self.kind = kind
+        self.index = index
+        self.original_index = original_index
+
+
+class MicroVuLines(MutableSequence):
+    KEY_MARKERS: tuple[str, ...] = (
+        "(PropLabels ",
+        "(Sys ",
+        "AutoExpFile",
+        "AutoRptFileName",
+        "Bring Part To Metrology 1Factory.jpg",
+        "C:\\killFile.bat",
+        "killFile.bat",
+        "SmartProfile.exe",
+    )
+    _NAME_NODE: str = "(Name \""
+
+    _edits: list[MicroVuLineEdit]
+    _instruction_lines: set[int]
+    _line_ids: list[int]
+    _line_positions: np.ndarray
+    _lines: list[str | int]
+    _lines_by_marker: dict[str, set[int]]
+    _lines_by_name: dict[str, set[int]]
+    _lines_by_type: dict[str, set[int]]
+    _next_line_id: int
+    _nodes_by_line: dict[int, MicroVuLineNodes]
+    _original_line_count: int
+    _reader: Optional[MicroVuFileReader]
+    _replaced_line_ids: set[int]
+
+    # Static Methods
+    @staticmethod
+    def get_line_name(line: str) -> str:
+        begin_index = line.find(MicroVuLines._NAME_NODE)
+        if begin_index < 2:
+            return ""
+        begin_index += len(MicroVuLines._NAME_NODE)
+        end_index = line.find("\"", begin_index)
+        if end_index == -1:
+            return ""
+        return line[begin_index:end_index]
+
+    @staticmethod
+    def get_line_type(line: str) -> str:
+        end_index = line.find(" ")
+        if end_index == -1:
+            end_index = len(line)
+        return line[:end_index].strip().lstrip("\ufeff")
+
+    # Dunder Methods
+    def __init__(self, lines: Iterable[str] | MicroVuFileReader = ()):
+        if isinstance(lines, MicroVuFileReader):
+            self._reader = lines
+            self._lines = list(range(len(lines)))
+        else:
+            self._reader = None
+            self._lines = list(lines)
+        self._edits = []
+        self._line_ids = list(range(len(self._lines)))
+        self._line_positions = np.arange(len(self._lines), dtype=np.int64)
+        self._next_line_id = len(self._lines)
+        self._original_line_count = len(self._lines)
+        self._replaced_line_ids = set()
+        if self._reader is not None:
+            self._build_index_from_reader()
+        else:
+            self._rebuild_index()
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            self.delete_lines(range(*index.indices(len(self._lines))))
+            return
+        self.delete_lines([index])
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._lines)))]
+        line = self._lines[index]
+        if isinstance(line, int):
+            line = self._reader[line]
+            self._lines[index] = line
+        return line
+
+    def __iter__(self) -> Iterator[str]:
+        self.materialize()
+        return iter(self._lines)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __setitem__(self, index: int | slice, value: str | Iterable[str]) -> None:
+        if isinstance(index, slice):
+            indexes = range(*index.indices(len(self._lines)))
+            value = list(value)
+            if index.step not in (None, 1):
+                if len(value) != len(indexes):
+                    raise ValueError(f"attempt to assign sequence of size {len(value)} "
+                                     f"to extended slice of size {len(indexes)}")
+                for i, line in zip(indexes, value):
+                    self[i] = line
+                return
+            self.delete_lines(indexes)
+            self.insert_lines(indexes.start, value)
+            return
+        index = self._normalize_index(index)
+        current_line = self[index]
+        line_id = self._line_ids[index]
+        line_nodes = self._nodes_by_line.pop(line_id, None)
+        if line_nodes is not None and line_nodes.text is value:
+            self._nodes_by_line[line_id] = line_nodes
+        if current_line == value:
+            return
+        self._remove_from_index(line_id, current_line)
+        self._lines[index] = value
+        self._add_to_index(line_id, value)
+        self._edits.append(MicroVuLineEdit(MicroVuLineEdit.REPLACE, index, self.get_original_index(index)))
+        self._replaced_line_ids.add(line_id)
+
+    # Internal Methods
+    def _add_to_index(self, line_id: int, line: str) -> None:
+        self._lines_by_type.setdefault(MicroVuLines.get_line_type(line), set()).add(line_id)
+        if line.find("(Name ") > 1:
+            self._instruction_lines.add(line_id)
+        if name := MicroVuLines.get_line_name(line):
+            self._lines_by_name.setdefault(name, set()).add(line_id)
+        upper_line = line.upper()
+        for marker in MicroVuLines.KEY_MARKERS:
+            if marker.upper() in upper_line:
+                self._lines_by_marker[marker].add(line_id)
+
+    def _allocate_line_ids(self, count: int) -> list[int]:
+        line_ids = list(range(self._next_line_id, self._next_line_id + count))
+        self._next_line_id += count
+        if self._next_line_id > len(self._line_positions):
+            capacity = max(self._next_line_id, 2 * len(self._line_positions))
+            unused_positions = np.full(capacity - len(self._line_positions), -1, dtype=np.int64)
+            self._line_positions = np.concatenate((self._line_positions, unused_positions))
+        return line_ids
+
+    def _build_index_from_reader(self) -> None:
+        self._instruction_lines = set(self._reader.find_line_indexes("(Name ", 2))
+        self._lines_by_marker = {
+            marker: set(self._reader.find_line_indexes(marker, ignore_case=True))
+            for marker in MicroVuLines.KEY_MARKERS
+        }
+        self._lines_by_name = {}
+        for i, name in self._reader.get_line_values(MicroVuLines._NAME_NODE, "\"", 2).items():
+            self._lines_by_name.setdefault(name, set()).add(i)
+        self._lines_by_type = {}
+        for i in range(len(self._reader)):
+            line_prefix = self._reader.get_line_prefix(i, 32)
+            if " " not in line_prefix:
+                line_prefix = self._reader[i]
+            self._lines_by_type.setdefault(MicroVuLines.get_line_type(line_prefix), set()).add(i)
+        self._nodes_by_line = {}
+
+    def _get_first_position(self, line_ids: Optional[set[int]]) -> int:
+        if not line_ids:
+            return -1
+        return int(self._line_positions[list(line_ids)].min())
+
+    def _get_positions(self, line_ids: Optional[set[int]]) -> list[int]:
+        if not line_ids:
+            return []
+        return np.sort(self._line_positions[list(line_ids)]).tolist()
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self._lines)
+        if not 0 <= index < len(self._lines):
+            raise IndexError("MicroVuLines index out of range")
+        return index
+
+    def _rebuild_index(self) -> None:
+        self._instruction_lines = set()
+        self._lines_by_marker = {marker: set() for marker in MicroVuLines.KEY_MARKERS}
+        self._lines_by_name = {}
+        self._lines_by_type = {}
+        self._nodes_by_line = {}
+        for i, line in enumerate(self._lines):
+            self._add_to_index(i, line)
+
+    def _remove_from_index(self, line_id: int, line: str) -> None:
+        MicroVuLines._remove_line_id(self._lines_by_type, MicroVuLines.get_line_type(line), line_id)
+        if line.find("(Name ") > 1:
+            self._instruction_lines.discard(line_id)
+        if name := MicroVuLines.get_line_name(line):
+            MicroVuLines._remove_line_id(self._lines_by_name, name, line_id)
+        upper_line = line.upper()
+        for marker in MicroVuLines.KEY_MARKERS:
+            if marker.upper() in upper_line:
+                self._lines_by_marker[marker].discard(line_id)
+
+    @staticmethod
+    def _remove_line_id(line_ids_by_key: dict[str, set[int]], key: str, line_id: int) -> None:
+        line_ids = line_ids_by_key[key]
+        line_ids.discard(line_id)
+        if not line_ids:
+            del line_ids_by_key[key]
+
+    # Properties
+    @property
+    def changed_indexes(self) -> list[int]:
+        return [
+            i for i, line_id in enumerate(self._line_ids)
+            if line_id >= self._original_line_count or line_id in self._replaced_line_ids
+        ]
+
+    @property
+    def deleted_original_indexes(self) -> list[int]:
+        return np.flatnonzero(self._line_positions[:self._original_line_count] < 0).tolist()
+
+    @property
+    def edits(self) -> list[MicroVuLineEdit]:
+        return list(self._edits)
+
+    @property
+    def instruction_count(self) -> int:
+        return len(self._instruction_lines)
+
+    @property
+    def instruction_indexes(self) -> list[int]:
+        return self._get_positions(self._instruction_lines)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._reader is None or self._reader.is_closed
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._reader is None
+
+    @property
+    def names(self) -> set[str]:
+        return set(self._lines_by_name)
+
+    @property
+    def version(self) -> int:
+        return len(self._edits)
+
+    # Public Methods
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+
+    def delete_lines(self, indexes: Iterable[int]) -> None:
+        deleted_indexes = sorted({self._normalize_index(i) for i in indexes})
+        if not deleted_indexes:
+            return
+        line_ids = [self._line_ids[i] for i in deleted_indexes]
+        for i, line_id in zip(deleted_indexes, line_ids):
+            self._remove_from_index(line_id, self[i])
+            self._nodes_by_line.pop(line_id, None)
+            self._edits.append(MicroVuLineEdit(MicroVuLineEdit.DELETE, i, self.get_original_index(i)))
+        for i in reversed(deleted_indexes):
+            del self._lines[i]
+            del self._line_ids[i]
+        positions = self._line_positions
+        positions[line_ids] = -1
+        is_shifted = positions > deleted_indexes[0]
+        positions[is_shifted] -= np.searchsorted(deleted_indexes, positions[is_shifted])
+
+    def get_index_containing_text(self, text_to_find: str) -> int:
+        if text_to_find in self._lines_by_marker:
+            upper_text = text_to_find.upper()
+            positions = self._get_positions(self._lines_by_marker[text_to_find])
+            return next((i for i in positions if self[i].upper().find(upper_text) > 1), -1)
+        if text_to_find.startswith(MicroVuLines._NAME_NODE[1:]):
+            text_to_find = f"({text_to_find}"
+        if text_to_find.startswith(MicroVuLines._NAME_NODE):
+            return self.get_name_prefix_index(text_to_find[len(MicroVuLines._NAME_NODE):])
+        regex = re.compile(re.escape(text_to_find), re.IGNORECASE)
+        return next((i for i in range(len(self._lines)) if regex.search(self[i], 2)), -1)
+
+    def get_line_nodes(self, index: int) -> MicroVuLineNodes:
+        index = self._normalize_index(index)
+        line_id = self._line_ids[index]
+        if (line_nodes := self._nodes_by_line.get(line_id)) is None:
+            line_nodes = MicroVuLineNodes(self[index])
+            self._nodes_by_line[line_id] = line_nodes
+        return line_nodes
+
+    def get_marker_index(self, marker: str) -> int:
+        return self._get_first_position(self._lines_by_marker[marker])
+
+    def get_marker_indexes(self, marker: str) -> list[int]:
+        return self._get_positions(self._lines_by_marker[marker])
+
+    def get_name_index(self, name: str) -> int:
+        return self._get_first_position(self._lines_by_name.get(name))
+
+    def get_original_index(self, index: int) -> int:
+        line_id = self._line_ids[self._normalize_index(index)]
+        return line_id if line_id < self._original_line_count else -1
+
+    def get_name_indexes(self, name: str) -> list[int]:
+        return self._get_positions(self._lines_by_name.get(name))
+
+    def get_name_prefix_index(self, name_text: str) -> int:
+        search_text = f"{MicroVuLines._NAME_NODE}{name_text}".upper()
+        matches = [
+            self._get_first_position(line_ids)
+            for name, line_ids in self._lines_by_name.items()
+            if f"{MicroVuLines._NAME_NODE}{name}\")".upper().startswith(search_text)
+        ]
+        return min(matches, default=-1)
+
+    def get_type_index(self, line_type: str) -> int:
+        return self._get_first_position(self._lines_by_type.get(line_type))
+
+    def get_type_indexes(self, line_type: str) -> list[int]:
+        return self._get_positions(self._lines_by_type.get(line_type))
+
+    def insert(self, index: int, line: str) -> None:
+        self.insert_lines(index, [line])
+
+    def insert_lines(self, index: int, lines: Iterable[str]) -> None:
+        lines = list(lines)
+        if not lines:
+            return
+        if index < 0:
+            index = max(index + len(self._lines), 0)
+        index = min(index, len(self._lines))
+        line_ids = self._allocate_line_ids(len(lines))
+        positions = self._line_positions
+        positions[positions >= index] += len(lines)
+        positions[line_ids] = np.arange(index, index + len(lines))
+        self._lines[index:index] = lines
+        self._line_ids[index:index] = line_ids
+        for i, (line_id, line) in enumerate(zip(line_ids, lines), index):
+            self._add_to_index(line_id, line)
+            self._edits.append(MicroVuLineEdit(MicroVuLineEdit.INSERT, i))
+
+    def iter_lines(self) -> Iterator[str]:
+        for line in self._lines:
+            yield self._reader[line] if isinstance(line, int) else line
+
+    def materialize(self) -> None:
+        if self._reader is None:
+            return
+        for i, line in enumerate(self._lines):
+            if isinstance(line, int):
+                self._lines[i] = self._reader[line]
+        self._reader.close()
+        self._reader = None
@@ -0,0 +1,213 @@
+import re
+from typing import Optional
+
+
+class MicroVuNode:
+    key: str
+    start: int
+    end: int
+    value_start: int
+    value_end: int
+    _children: Optional[list["MicroVuNode"]]
+    _line: "MicroVuLineNodes"
+
+    # Dunder Methods
+    def __init__(self, line: "MicroVuLineNodes", key: str, start: int, end: int, value_start: int, value_end: int):
+        self._line = line
+        self.key = key
+        self.start = start
+        self.end = end
+        self.value_start = value_start
+        self.value_end = value_end
+        self._children = None
+
+    # Properties
+    @property
+    def children(self) -> list["MicroVuNode"]:
+        if self._children is None:
+            self._children = self._line.tokenize(self.value_start, self.value_end) if self.has_children else []
+        return self._children
+
+    @property
+    def has_children(self) -> bool:
+        return self._line.is_nested(self.value_start, self.value_end)
+
+    @property
+    def raw_value(self) -> str:
+        return self._line.text[self.value_start:self.value_end]
+
+    @property
+    def source(self) -> str:
+        return self._line.text[self.start:self.end]
+
+    @property
+    def text(self) -> str:
+        return MicroVuLineNodes.unquote(self.raw_value)
+
+
+class MicroVuLineNodes:
+    _KEY: re = re.compile(r"[^\s()\"]*")
+    _NESTED: re = re.compile(r"\s*\(")
+    _SYNTAX: re = re.compile(r"[()\"]")
+
+    _created_nodes: list[MicroVuNode]
+    _nodes: Optional[list[MicroVuNode]]
+    _text: str
+
+    # Static Methods
+    @staticmethod
+    def quote(value: str) -> str:
+        escaped_value = value.replace("\"", "\"\"")
+        return f"\"{escaped_value}\""
+
+    @staticmethod
+    def unquote(raw_value: str) -> str:
+        if len(raw_value) > 1 and raw_value.startswith("\"") and raw_value.endswith("\""):
+            return raw_value[1:-1].replace("\"\"", "\"")
+        return raw_value
+
+    # Dunder Methods
+    def __init__(self, text: str):
+        self._text = text
+        self._nodes = None
+        self._created_nodes = []
+
+    # Internal Methods
+    def _create_node(self, start: int, end: int) -> MicroVuNode:
+        key = MicroVuLineNodes._KEY.match(self._text, start + 1, end - 1).group()
+        value_start = start + 1 + len(key)
+        if key and self._text[value_start] == " ":
+            value_start += 1
+        node = MicroVuNode(self, key, start, end, value_start, end - 1)
+        self._created_nodes.append(node)
+        return node
+
+    def _discard_children(self, node: MicroVuNode) -> None:
+        if node._children is None:
+            return
+        self._created_nodes = [
+            n for n in self._created_nodes
+            if n is node or not (node.value_start <= n.start and n.end <= node.value_end)
+        ]
+        node._children = None
+
+    def _replace(self, start: int, end: int, new_text: str) -> None:
+        offset = len(new_text) - (end - start)
+        self._text = f"{self._text[:start]}{new_text}{self._text[end:]}"
+        for node in self._created_nodes:
+            if node.end <= start:
+                continue
+            if node.start >= end:
+                node.start += offset
+                node.end += offset
+                node.value_start += offset
+                node.value_end += offset
+            else:
+                node.end += offset
+                node.value_end += offset
+
+    def _skip_string(self, position: int, end: int) -> int:
+        while True:
+            quote_index = self._text.find("\"", position, end)
+            if quote_index == -1:
+                return end
+            if self._text.startswith("\"\"", quote_index):
+                position = quote_index + 2
+                continue
+            return quote_index + 1
+
+    # Properties
+    @property
+    def header(self) -> str:
+        first_node_index = self._text.find("(")
+        if first_node_index == -1:
+            return self._text.rstrip("\r\n")
+        return self._text[:first_node_index]
+
+    @property
+    def nodes(self) -> list[MicroVuNode]:
+        if self._nodes is None:
+            self._nodes = self.tokenize(0, len(self._text))
+        return self._nodes
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    # Public Methods
+    def append(self, key: str, raw_value: str = "") -> MicroVuNode:
+        nodes = self.nodes
+        insert_index = len(self._text.rstrip("\r\n"))
+        node_text = f"({key} {raw_value})" if raw_value else f"({key})"
+        self._replace(insert_index, insert_index, f" {node_text}")
+        node = self._create_node(insert_index + 1, insert_index + 1 + len(node_text))
+        nodes.append(node)
+        return node
+
+    def find(self, key: str) -> Optional[MicroVuNode]:
+        return next(iter(self.find_all(key)), None)
+
+    def find_all(self, key: str) -> list[MicroVuNode]:
+        found: list[MicroVuNode] = []
+        pending = list(reversed(self.nodes))
+        while pending:
+            node = pending.pop()
+            if node.key == key:
+                found.append(node)
+            elif node.has_children:
+                pending.extend(reversed(node.children))
+        return found
+
+    def get(self, key: str) -> Optional[MicroVuNode]:
+        return next((node for node in self.nodes if node.key == key), None)
+
+    def get_text(self, key: str) -> str:
+        node = self.get(key)
+        return node.text if node else ""
+
+    def is_nested(self, begin: int, end: int) -> bool:
+        return bool(MicroVuLineNodes._NESTED.match(self._text, begin, end))
+
+    def remove(self, node: MicroVuNode) -> None:
+        self._discard_children(node)
+        for siblings in [self.nodes, *(n._children for n in self._created_nodes if n._children)]:
+            if node in siblings:
+                siblings.remove(node)
+                break
+        self._created_nodes.remove(node)
+        start = node.start - 1 if node.start > 0 and self._text[node.start - 1] == " " else node.start
+        self._replace(start, node.end, "")
+
+    def set_raw_value(self, node: MicroVuNode, raw_value: str) -> None:
+        self._discard_children(node)
+        self._replace(node.value_start, node.value_end, raw_value)
+
+    def set_text(self, key: str, value: str) -> MicroVuNode:
+        return self.set_value(key, MicroVuLineNodes.quote(value))
+
+    def set_value(self, key: str, raw_value: str) -> MicroVuNode:
+        if node := self.get(key):
+            self.set_raw_value(node, raw_value)
+            return node
+        return self.append(key, raw_value)
+
+    def tokenize(self, begin: int, end: int) -> list[MicroVuNode]:
+        nodes: list[MicroVuNode] = []
+        depth = 0
+        node_start = -1
+        position = begin
+        while match := MicroVuLineNodes._SYNTAX.search(self._text, position, end):
+            index = match.start()
+            if self._text[index] == "\"":
+                position = self._skip_string(index + 1, end)
+                continue
+            if self._text[index] == "(":
+                if depth == 0:
+                    node_start = index
+                depth += 1
+            elif depth > 0:
+                depth -= 1
+                if depth == 0:
+                    nodes.append(self._create_node(node_start, index + 1))
+            position = index + 1
+        return nodes
@@ -0,0 +1,119 @@
+import re
+from typing import Iterable, Optional
+
+import numpy as np
+
+from lib.MicroVuLines import MicroVuLines
+
+
+class MicroVuPointCloud:
+    DEFAULT_LINE_TYPES: tuple[str, ...] = ("BEP", "Crc", "Pnt")
+    POINT_PATTERNS: dict[str, tuple[re.Pattern, ...]] = {
+        "BEP": (re.compile(r"\(Geom \((\S+) (\S+) (\S+)\)\)"),),
+        "Crc": (re.compile(r"\(PCS \(\((\S+) \S+ \S+ \S+\) \((\S+) \S+ \S+ \S+\) \((\S+) \S+ \S+ \S+\)"),
+                re.compile(r"\(PCS \(\(\S+ \S+ (\S+)\) \(\S+ \S+ (\S+)\)()")),
+        "Pnt": (re.compile(r"\(Pnt \((\S+) (\S+) (\S+)\)\)"),),
+    }
+
+    _feature_indexes: np.ndarray
+    _feature_starts: np.ndarray
+    _line_indexes: np.ndarray
+    _point_feature_indexes: np.ndarray
+    _points: np.ndarray
+
+    # Static Methods
+    @staticmethod
+    def get_decimation_mask(points: np.ndarray, spacing: float = 0.0, point_count: int = 0,
+                            keep_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        if spacing <= 0 and point_count <= 0:
+            return np.ones(len(points), dtype=bool)
+        mask = np.zeros(len(points), dtype=bool)
+        if not len(points):
+            return mask
+        mask[[0, -1]] = True
+        if keep_mask is not None:
+            mask |= keep_mask
+        arc_lengths = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))))
+        if spacing > 0:
+            buckets = np.floor(arc_lengths / spacing)
+            mask[1:] |= buckets[1:] != buckets[:-1]
+        else:
+            targets = np.linspace(0.0, arc_lengths[-1], point_count)
+            mask[np.searchsorted(arc_lengths, targets).clip(0, len(points) - 1)] = True
+        return mask
+
+    @staticmethod
+    def parse_points(text: str) -> np.ndarray:
+        if not text.strip():
+            return np.empty((0, 3))
+        try:
+            values = np.array(text.split(), dtype=float)
+        except ValueError:
+            raise ValueError(f"Point cloud payload is not numeric: '{text[:80]}'") from None
+        if values.size % 3:
+            raise ValueError(f"Point cloud payload has {values.size} values, which is not a multiple of 3.")
+        return values.reshape(-1, 3)
+
+    # Dunder Methods
+    def __init__(self, file_lines: MicroVuLines, line_types: Iterable[str] = DEFAULT_LINE_TYPES):
+        line_indexes: list[int] = []
+        payloads: list[str] = []
+        for line_type in line_types:
+            patterns = MicroVuPointCloud.POINT_PATTERNS.get(line_type, ())
+            for i in file_lines.get_type_indexes(line_type):
+                line = file_lines[i]
+                for pattern in patterns:
+                    if match := pattern.search(line):
+                        line_indexes.append(i)
+                        payloads.append(" ".join(value or "0" for value in match.groups()))
+                        break
+        order = np.argsort(np.array(line_indexes, dtype=np.int64), kind="stable")
+        self._line_indexes = np.array(line_indexes, dtype=np.int64)[order]
+        self._points = MicroVuPointCloud.parse_points(" ".join(payloads))[order]
+        self._point_feature_indexes = self._get_point_feature_indexes(file_lines.instruction_indexes)
+        self._feature_indexes, self._feature_starts = np.unique(self._point_feature_indexes, return_index=True)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    # Internal Methods
+    def _get_point_feature_indexes(self, instruction_indexes: list[int]) -> np.ndarray:
+        if not instruction_indexes:
+            return self._line_indexes.copy()
+        instruction_indexes = np.array(instruction_indexes, dtype=np.int64)
+        positions = np.searchsorted(instruction_indexes, self._line_indexes, side="right") - 1
+        return np.where(positions > -1, instruction_indexes[np.maximum(positions, 0)], self._line_indexes)
+
+    # Properties
+    @property
+    def bounding_box(self) -> np.ndarray:
+        if not len(self):
+            return np.full((2, 3), np.nan)
+        return np.array([self._points.min(axis=0), self._points.max(axis=0)])
+
+    @property
+    def feature_indexes(self) -> list[int]:
+        return self._feature_indexes.tolist()
+
+    @property
+    def line_indexes(self) -> np.ndarray:
+        return self._line_indexes
+
+    @property
+    def points(self) -> np.ndarray:
+        return self._points
+
+    # Public Methods
+    def get_bounding_boxes(self) -> np.ndarray:
+        if not len(self):
+            return np.empty((0, 2, 3))
+        return np.stack([np.minimum.reduceat(self._points, self._feature_starts, axis=0),
+                         np.maximum.reduceat(self._points, self._feature_starts, axis=0)], axis=1)
+
+    def get_point_counts(self) -> dict[int, int]:
+        counts = np.diff(np.append(self._feature_starts, len(self)))
+        return dict(zip(self.feature_indexes, counts.tolist()))
+
+    def get_points(self, feature_index: int) -> np.ndarray:
+        return self._points[self._point_feature_indexes == feature_index]
@@ -0,0 +1,93 @@
+import re
+
+import numpy as np
+
+from lib.MicroVuLines import MicroVuLines
+from lib.MicroVuPointCloud import MicroVuPointCloud
+
+
+class MicroVuPointDecimation:
+    EXPORTED_POINT_MARKER: str = "(ExpProps "
+    _REFERENCE: re = re.compile(r"\(\w+ ([0-9A-F]+)\)")
+    _SYSTEM: re = re.compile(r"\(Sys (\w+)\)")
+
+    _deleted_line_indexes: list[int]
+    _deleted_names: list[str]
+    _point_count: int
+    _removed_byte_count: int
+
+    # Dunder Methods
+    def __init__(self, file_lines: MicroVuLines, spacing: float = 0.0, point_count: int = 0):
+        self._deleted_line_indexes = []
+        self._deleted_names = []
+        self._point_count = 0
+        self._removed_byte_count = 0
+        cloud = MicroVuPointCloud(file_lines, ("Pnt",))
+        points_by_line = dict(zip(cloud.line_indexes.tolist(), cloud.points))
+        referenced_ids: set[str] = set()
+        for line in file_lines:
+            referenced_ids.update(MicroVuPointDecimation._REFERENCE.findall(line))
+        instruction_indexes = file_lines.instruction_indexes + [len(file_lines)]
+        run: list[tuple[int, int]] = []
+        run_system_id = ""
+        for position, i in enumerate(instruction_indexes[:-1]):
+            line = file_lines[i]
+            if i not in points_by_line or MicroVuPointDecimation.EXPORTED_POINT_MARKER not in line:
+                self._decimate_run(file_lines, run, points_by_line, referenced_ids, spacing, point_count)
+                run = []
+                continue
+            system_id = match.group(1) if (match := MicroVuPointDecimation._SYSTEM.search(line)) else ""
+            if run and system_id != run_system_id:
+                self._decimate_run(file_lines, run, points_by_line, referenced_ids, spacing, point_count)
+                run = []
+            run.append((i, instruction_indexes[position + 1]))
+            run_system_id = system_id
+        self._decimate_run(file_lines, run, points_by_line, referenced_ids, spacing, point_count)
+
+    def __str__(self) -> str:
+        return (f"removed {self.removed_count} of {self._point_count} point cloud points "
+                f"({self._removed_byte_count:,} bytes)")
+
+    # Internal Methods
+    def _decimate_run(self, file_lines: MicroVuLines, run: list[tuple[int, int]], points_by_line: dict,
+                      referenced_ids: set[str], spacing: float, point_count: int) -> None:
+        self._point_count += len(run)
+        if len(run) < 3:
+            return
+        keep_mask = np.array([MicroVuPointDecimation._is_important(file_lines[i], referenced_ids) for i, _ in run])
+        points = np.array([points_by_line[i] for i, _ in run])
+        mask = MicroVuPointCloud.get_decimation_mask(points, spacing, point_count, keep_mask)
+        for (begin_index, end_index), is_kept in zip(run, mask.tolist()):
+            if is_kept:
+                continue
+            self._deleted_names.append(MicroVuLines.get_line_name(file_lines[begin_index]))
+            for i in range(begin_index, end_index):
+                line = file_lines[i]
+                self._deleted_line_indexes.append(i)
+                self._removed_byte_count += 2 * (len(line) + line.count("\n"))
+
+    @staticmethod
+    def _is_important(line: str, referenced_ids: set[str]) -> bool:
+        header_parts = line.split(" ", 3)
+        return "(PropLabels " in line or (len(header_parts) > 2 and header_parts[2] in referenced_ids)
+
+    # Properties
+    @property
+    def deleted_line_indexes(self) -> list[int]:
+        return list(self._deleted_line_indexes)
+
+    @property
+    def deleted_names(self) -> list[str]:
+        return list(self._deleted_names)
+
+    @property
+    def point_count(self) -> int:
+        return self._point_count
+
+    @property
+    def removed_byte_count(self) -> int:
+        return self._removed_byte_count
+
+    @property
+    def removed_count(self) -> int:
+        return len(self._deleted_names)
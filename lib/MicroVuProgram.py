@@ -1,10 +1,18 @@
 import os
 import re
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Iterable, List, Optional
 
 import lib.Utilities
-from lib.Utilities import get_utf_encoded_file_lines
+from lib.FeatureRenamePlan import FeatureRenamePlan
+from lib.MicroVuFileReader import MicroVuFileReader
+from lib.MicroVuFileWriter import MicroVuFileWriter
+from lib.MicroVuLines import MicroVuLines
+from lib.MicroVuNodes import MicroVuLineNodes
+from lib.MicroVuPointCloud import MicroVuPointCloud
+from lib.MicroVuPointDecimation import MicroVuPointDecimation
+from lib.MicroVuProgramProbe import MicroVuProgramProbe
+from lib.MicroVuSystemGraph import MicroVuSystemGraph
 
 
 class DimensionName:
@@ -19,22 +27,25 @@ class MicroVuException(Exception):
 
 
 class MicroVuProgram:
+    _cached_lines: Optional[MicroVuLines]
+    _cached_values: dict[str, Any]
+    _cached_version: int
+    _file_lines: MicroVuLines
     _filepath: str
     _has_calculators: bool
     _is_smartprofile: bool
     _op_num: str
+    _part_number: str
     _rev_num: str
     _smartprofile_projectname: str
+    _view_name: str
     _manual_dimension_names: List[DimensionName] = []
 
     # Static Methods
     @staticmethod
     def get_node(line_text: str, search_value: str) -> str:
-        begin_index: int = line_text.upper().find(f"({search_value.upper()}")
-        end_index: int = line_text.find(")", begin_index + len(search_value) + 1)
-        if end_index == -1:
-            end_index = len(line_text)
-        return line_text[begin_index:end_index + 1].strip()
+        node = MicroVuLineNodes(line_text).find(search_value)
+        return node.source if node else ""
 
     @staticmethod
     def get_node_text(line_text: str, search_value: str, start_delimiter: str, end_delimiter: str = "") -> str:
@@ -47,6 +58,11 @@ class MicroVuProgram:
             end_index = len(line_text)
         return line_text[begin_index + 1:end_index].strip()
 
+    @staticmethod
+    def get_output_filepath(filepath: str) -> str:
+        output_rootpath = lib.Utilities.get_settings().output_rootpath
+        return str(Path(output_rootpath, Path(filepath).parts[-2], Path(filepath).name))
+
     @staticmethod
     def set_node_text(line_text: str, search_value: str, set_value: str, start_delimiter: str,
                       end_delimiter: str = "") -> str:
@@ -56,90 +72,149 @@ class MicroVuProgram:
         return line_text.replace(current_node, new_node)
 
     # Dunder Methods
-    def __init__(self, input_filepath: str, op_num: str, rev_num: str, smartprofile_projectname: str):
+    def __init__(self, input_filepath: str, op_num: str, rev_num: str, smartprofile_projectname: str,
+                 file_lines: Optional[Iterable[str]] = None):
         self._filepath = input_filepath
-        self.file_lines = get_utf_encoded_file_lines(self._filepath)
+        self._file_lines = MicroVuLines(MicroVuFileReader(self._filepath) if file_lines is None else file_lines)
         self._op_num = op_num.upper()
         self._rev_num = rev_num.upper()
         self._smartprofile_projectname = smartprofile_projectname
+        self._cached_lines = None
+        self._cached_values = {}
+        self._cached_version = -1
+        self._part_number = re.split("[ _]", Path(input_filepath).stem)[0]
+        self._view_name = MicroVuProgram._get_view_name(input_filepath)
         self._postinit()
 
+    def __enter__(self) -> "MicroVuProgram":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     # Internal Methods
-    def _does_name_already_exist(self, name_to_find: str) -> bool:
-        search_text = f"(Name \"{name_to_find}\")"
-        return any(line.find(search_text) > 1 for line in self.file_lines)
+    def _get_cached_value(self, key: str, get_value: Callable[[], Any]) -> Any:
+        if self._cached_lines is not self.file_lines or self._cached_version != self.file_lines.version:
+            self._cached_lines = self.file_lines
+            self._cached_values = {}
+            self._cached_version = self.file_lines.version
+        if key not in self._cached_values:
+            self._cached_values[key] = get_value()
+        return self._cached_values[key]
+
+    def _get_dimension_name_values(self) -> list[tuple[int, str]]:
+        dimension_name_values: list[tuple[int, str]] = []
+        for i in self.file_lines.get_marker_indexes("(PropLabels "):
+            line = self.file_lines[i]
+            if line.startswith("Calc"):
+                continue
+            if line.startswith("Prmt"):
+                continue
+            dimension_name_values.append((i, MicroVuLines.get_line_name(line)))
+        return dimension_name_values
+
+    def _get_has_auto_report(self) -> bool:
+        line_idx = self.get_index_containing_text("AutoExpFile")
+        if line_idx < 1:
+            return False
+        line_nodes = self.file_lines.get_line_nodes(line_idx)
+        sort_by_name_node = line_nodes.get("AutoRptSortInstructionsByName")
+        if not sort_by_name_node or sort_by_name_node.raw_value != "0":
+            return False
+        if not line_nodes.get("AutoRptTemplateName"):
+            return False
+        if not line_nodes.get("AutoRptAppendDateAndTime"):
+            return False
+        return line_nodes.get("AutoRptFileName") is not None
+
+    def _get_header_text(self, key: str) -> str:
+        line_idx = self.get_index_containing_text(key)
+        if line_idx < 1:
+            return ""
+        return self.file_lines.get_line_nodes(line_idx).get_text(key)
 
     def _get_instructions_count(self) -> str:
-        return str(len([line for line in self.file_lines if line.find("(Name ") > 1]))
+        return str(self.file_lines.instruction_count)
 
-    def _global_replace(self, old_value: str, new_value: str) -> None:
-        quoted_old_value = f"\"{old_value}\""
-        quoted_new_value = f"\"{new_value}\""
-        for i, l in enumerate(self.file_lines):
-            if l.find(quoted_old_value) > 0:
-                new_line = l.replace(quoted_old_value, quoted_new_value)
-                self.file_lines[i] = new_line
+    @staticmethod
+    def _replace_node_values(line_nodes: MicroVuLineNodes, key: str, old_values: tuple[str, ...],
+                             new_value: str) -> None:
+        for node in line_nodes.find_all(key):
+            if node.raw_value in old_values:
+                line_nodes.set_raw_value(node, new_value)
+
+    @staticmethod
+    def _get_view_name(filepath: str) -> str:
+        rev_begin_idx = 0
+        rev_end_idx = 0
+        view_name = ""
+
+        filename = Path(filepath).stem
+        filename_parts = re.split("[ _]", filename)
+        count_of_parts = len(filename_parts)
+        if count_of_parts == 1:
+            return ""
+        for x in range(len(filename_parts)):
+            if filename_parts[x].upper().startswith("REV"):
+                rev_begin_idx = x
+                if filename_parts[rev_begin_idx].upper() == "REV":
+                    rev_end_idx = rev_begin_idx + 1
+                else:
+                    rev_end_idx = rev_begin_idx
+
+        if rev_begin_idx == 0:
+            for part in range(1, len(filename_parts)):
+                view_name += f"{filename_parts[part]} "
+        elif rev_begin_idx == 1 and rev_end_idx < count_of_parts - 1:
+            for part in range(rev_end_idx, len(filename_parts)):
+                view_name += f"{filename_parts[part]} "
+        else:
+            for part in range(1, rev_end_idx):
+                view_name += f"{filename_parts[part]} "
+        return view_name.strip()
 
     def _postinit(self):
         self._set_smartprofile()
         self._set_has_calculators()
 
     def _set_has_calculators(self) -> None:
-        calcs: list[bool] = [line.startswith("Calc ") for line in self.file_lines]
-        self._has_calculators = any(calcs)
+        self._has_calculators = self.file_lines.get_type_index("Calc") > -1
 
     def _set_smartprofile(self) -> None:
         line_idx = self.get_index_containing_text("AutoExpFile")
-        existing_export_filepath = str(Path(MicroVuProgram.get_node_text(
-                self.file_lines[line_idx], "AutoExpFile", "\""))).upper()
-        existing_export_filename = Path(MicroVuProgram.get_node_text(
-                self.file_lines[line_idx], "AutoExpFile", "\"")).stem.upper()
-        if existing_export_filename == "OUTPUT":
-            self._is_smartprofile = True
-            return
-        if "C:\\MICROVU\\POINTCLOUDS\\" in existing_export_filepath:
-            self._is_smartprofile = True
-            return
-        self._is_smartprofile = False
+        auto_export_filepath = self.file_lines.get_line_nodes(line_idx).get_text("AutoExpFile")
+        self._is_smartprofile = MicroVuProgramProbe.is_smartprofile_export_filepath(auto_export_filepath)
 
     # Properties
     @property
     def bring_part_to_metrology_index(self) -> int:
-        return next(
-            (
-                i
-                for i, l in enumerate(self.file_lines)
-                if "Bring Part To Metrology 1Factory.jpg" in l
-            ),
-            -1,
-        )
+        return self.file_lines.get_marker_index("Bring Part To Metrology 1Factory.jpg")
 
     @property
     def can_write_to_output_file(self) -> bool:
         return not os.path.exists(self.output_filepath)
 
+    @property
+    def changed_line_indexes(self) -> list[int]:
+        return self.file_lines.changed_indexes
+
     @property
     def comment(self) -> str:
-        if comment_idx := self.get_index_containing_text("(Name \"Edited"):
-            if " (Txt " in self.file_lines[comment_idx]:
-                return MicroVuProgram.get_node_text(self.file_lines[comment_idx], "(Txt ", "\"")
-            else:
-                return ""
-        else:
+        comment_idx = self.get_index_containing_text("(Name \"Edited")
+        if comment_idx < 1:
             return ""
+        return self.file_lines.get_line_nodes(comment_idx).get_text("Txt").strip()
 
     @comment.setter
     def comment(self, value: str) -> None:
-        if line_idx := self.get_index_containing_text("(Name \"Edited"):
-            if " (Txt " in self.file_lines[line_idx]:
-                updated_comment_line = MicroVuProgram.set_node_text(self.file_lines[line_idx], "(Txt ", value, "\"")
-                self.file_lines[line_idx] = updated_comment_line
-            else:
-                if value.startswith("\r\n"):
-                    new_line = f'{self.file_lines[line_idx][:-2]} (Txt \"{value[4:]}\")\n'
-                else:
-                    new_line = f'{self.file_lines[line_idx][:-2]} (Txt \"{value}\")\n'
-                self.file_lines[line_idx] = new_line
+        line_idx = self.get_index_containing_text("(Name \"Edited")
+        if line_idx < 1:
+            return
+        line_nodes = self.file_lines.get_line_nodes(line_idx)
+        if not line_nodes.get("Txt") and value.startswith("\r\n"):
+            value = value[4:]
+        line_nodes.set_text("Txt", value)
+        self.file_lines[line_idx] = line_nodes.text
 
     @property
     def dimension_names(self) -> list[DimensionName]:
@@ -147,48 +222,44 @@ class MicroVuProgram:
             return []
         if self._manual_dimension_names:
             return self._manual_dimension_names
-        dimensions: list[DimensionName] = []
-        for i, line in enumerate(self.file_lines):
-            if line.find("(PropLabels ") > -1:
-                if line.startswith("Calc"):
-                    continue
-                if line.startswith("Prmt"):
-                    continue
-                old_dimension_name = MicroVuProgram.get_node_text(line, "(Name ", "\"")
-                dimension = DimensionName(i, old_dimension_name)
-                dimensions.append(dimension)
-        return dimensions
+        dimension_name_values = self._get_cached_value("dimension_names", self._get_dimension_name_values)
+        return [DimensionName(i, name) for i, name in dimension_name_values]
 
     @property
     def export_filepath(self) -> str:
         if self.is_smartprofile:
             return "C:\\TEXT\\OUTPUT.txt"
-        if line_idx := self.get_index_containing_text("AutoExpFile"):
-            return MicroVuProgram.get_node_text(self.file_lines[line_idx], "AutoExpFile", "\"")
-        else:
-            return ""
+        return self._get_cached_value("export_filepath", lambda: self._get_header_text("AutoExpFile"))
 
     @export_filepath.setter
     def export_filepath(self, value: str) -> None:
         if self.is_smartprofile:
             value = "C:\\TEXT\\OUTPUT.txt"
         line_idx = self.get_index_containing_text("AutoExpFile")
-        if not line_idx:
+        if line_idx < 1:
             return
-        line_text = self.file_lines[line_idx]
-        updated_line_text = MicroVuProgram.set_node_text(line_text, "(ExpFile ", value, "\"")
-        updated_line_text = MicroVuProgram.set_node_text(updated_line_text, "(AutoExpFile ", value, "\"")
+        line_nodes = self.file_lines.get_line_nodes(line_idx)
+        if line_nodes.get("ExpFile"):
+            line_nodes.set_text("ExpFile", value)
+        line_nodes.set_text("AutoExpFile", value)
         if self.is_smartprofile:
-            updated_line_text = updated_line_text.replace("(AutoExpFSApSt DT)", "(AutoExpFSApSt None)")
+            MicroVuProgram._replace_node_values(line_nodes, "AutoExpFSApSt", ("DT",), "None")
         else:
-            updated_line_text = updated_line_text.replace("(AutoExpFSApSt None)", "(AutoExpFSApSt DT)")
-        updated_line_text = updated_line_text.replace("(FldDlm Tab)", "(FldDlm CrLf)")
-        updated_line_text = updated_line_text.replace("(FldDlm Comma)", "(FldDlm CrLf)")
-        updated_line_text = updated_line_text.replace("(NoDblQt 1)", "(NoDblQt 0)")
-        updated_line_text = updated_line_text.replace("(RunSep 1)", "(RunSep 0)")
-        updated_line_text = updated_line_text.replace("(ValDlm Comma)", "(ValDlm Tab)")
-        updated_line_text = updated_line_text.replace("(AutoRptTemplateName \"\")", "(AutoRptTemplateName \"Classic\")")
-        self.file_lines[line_idx] = updated_line_text
+            MicroVuProgram._replace_node_values(line_nodes, "AutoExpFSApSt", ("None",), "DT")
+        MicroVuProgram._replace_node_values(line_nodes, "FldDlm", ("Tab", "Comma"), "CrLf")
+        MicroVuProgram._replace_node_values(line_nodes, "NoDblQt", ("1",), "0")
+        MicroVuProgram._replace_node_values(line_nodes, "RunSep", ("1",), "0")
+        MicroVuProgram._replace_node_values(line_nodes, "ValDlm", ("Comma",), "Tab")
+        MicroVuProgram._replace_node_values(line_nodes, "AutoRptTemplateName", ("\"\"",), "\"Classic\"")
+        self.file_lines[line_idx] = line_nodes.text
+
+    @property
+    def file_lines(self) -> MicroVuLines:
+        return self._file_lines
+
+    @file_lines.setter
+    def file_lines(self, lines: list[str]) -> None:
+        self._file_lines = MicroVuLines(lines)
 
     @property
     def filename(self) -> str:
@@ -200,7 +271,7 @@ class MicroVuProgram:
 
     @property
     def has_text_kill(self) -> bool:
-        return any("C:\\killFile.bat" in line for line in self.file_lines)
+        return self.file_lines.get_marker_index("C:\\killFile.bat") > -1
 
     @property
     def has_calculators(self) -> bool:
@@ -208,16 +279,7 @@ class MicroVuProgram:
 
     @property
     def has_auto_report(self) -> bool:
-        if not (line_idx := self.get_index_containing_text("AutoExpFile")):
-            return False
-        line = self.file_lines[line_idx]
-        if "(AutoRptSortInstructionsByName 0)" not in line:
-            return False
-        if "(AutoRptTemplateName" not in line:
-            return False
-        if "(AutoRptAppendDateAndTime" not in line:
-            return False
-        return "(AutoRptFileName" in line
+        return self._get_cached_value("has_auto_report", self._get_has_auto_report)
 
     @property
     def get_existing_smartprofile_call_index(self) -> int:
@@ -225,7 +287,7 @@ class MicroVuProgram:
 
     @property
     def instructions_index(self) -> int:
-        return next((i for i, l in enumerate(self.file_lines) if l.startswith("Instructions")), 0)
+        return max(self.file_lines.get_type_index("Instructions"), 0)
 
     @property
     def is_smartprofile(self) -> bool:
@@ -233,22 +295,15 @@ class MicroVuProgram:
 
     @property
     def has_bring_to_metrology_picture(self) -> bool:
-        return any("Bring Part To Metrology 1Factory.jpg" in line for line in self.file_lines)
+        return self.bring_part_to_metrology_index > -1
 
     @property
     def kill_file_call_index(self) -> int:
-        return next(
-                (i for i, l in enumerate(self.file_lines)
-                 if "killFile.bat" in l), -1
-        )
+        return self.file_lines.get_marker_index("killFile.bat")
 
     @property
     def last_microvu_system_id(self) -> str:
-        last_system_reference_line = [line for line in self.file_lines if line.upper().find("(SYS ") > 1][-1]
-        if last_system_reference_line.startswith("Sys 1"):
-            return MicroVuProgram.get_node_text(last_system_reference_line, "Sys 1", " ")
-        else:
-            return MicroVuProgram.get_node_text(last_system_reference_line, "(Sys", " ", ")")
+        return self.system_graph.last_system_id
 
     @property
     def manual_dimension_names(self) -> List[DimensionName]:
@@ -264,21 +319,19 @@ class MicroVuProgram:
 
     @property
     def output_directory(self) -> str:
-        output_rootpath = lib.Utilities.GetStoredIniValue("Paths", "output_rootpath", "Settings")
-        parent_directory = Path(self._filepath).parts[-2]
-        return str(Path(output_rootpath, parent_directory))
+        return os.path.dirname(self.output_filepath)
 
     @property
     def output_filepath(self) -> str:
-        output_directory = self.output_directory
-        file_name = Path(self._filepath).name
-        return str(Path(output_directory, file_name))
+        return MicroVuProgram.get_output_filepath(self._filepath)
 
     @property
     def part_number(self) -> str:
-        filename = Path(self._filepath).stem
-        parts = re.split("[ _]", filename)
-        return parts[0]
+        return self._part_number
+
+    @property
+    def point_cloud(self) -> MicroVuPointCloud:
+        return self._get_cached_value("point_cloud", lambda: MicroVuPointCloud(self.file_lines))
 
     @property
     def prompt_insertion_index(self) -> int:
@@ -295,10 +348,7 @@ class MicroVuProgram:
     def report_filepath(self) -> str:
         if self.is_smartprofile:
             return ""
-        if line_idx := self.get_index_containing_text("AutoRptFileName"):
-            return MicroVuProgram.get_node_text(self.file_lines[line_idx], "AutoRptFileName", "\"")
-        else:
-            return ""
+        return self._get_cached_value("report_filepath", lambda: self._get_header_text("AutoRptFileName"))
 
     @report_filepath.setter
     def report_filepath(self, value: str) -> None:
@@ -307,36 +357,21 @@ class MicroVuProgram:
 
         if self.has_auto_report:
             line_idx = self.get_index_containing_text("AutoRptFileName")
-            if not line_idx:
+            if line_idx < 1:
                 return
-            line_text = self.file_lines[line_idx]
-            if self.is_smartprofile:
-                updated_line_text = MicroVuProgram.set_node_text(line_text, "(AutoRptFileName ", "", "\"")
-            else:
-                updated_line_text = MicroVuProgram.set_node_text(line_text, "(AutoRptFileName ", value, "\"")
-            self.file_lines[line_idx] = updated_line_text
+            line_nodes = self.file_lines.get_line_nodes(line_idx)
+            line_nodes.set_text("AutoRptFileName", value)
+            self.file_lines[line_idx] = line_nodes.text
         else:
-            if line_idx := self.get_index_containing_text("AutoExpFile"):
-                line = self.file_lines[line_idx][:-2]
-                if "(AutoRptSortInstructionsByName" not in line:
-                    line += " (AutoRptSortInstructionsByName 0)"
-                else:
-                    existing_node = MicroVuProgram.get_node(line, "AutoRptSortInstructionsByName")
-                    line = line.replace(existing_node, "(AutoRptSortInstructionsByName 0)")
-
-                if "(AutoRptTemplateName" not in line:
-                    line += " (AutoRptTemplateName \"Classic\")"
-                else:
-                    existing_node = MicroVuProgram.get_node(line, "AutoRptTemplateName")
-                    line = line.replace(existing_node, "(AutoRptTemplateName \"Classic\")")
-
-                if "(AutoRptAppendDateAndTime" not in line:
-                    line += " (AutoRptAppendDateAndTime 1)"
-                else:
-                    existing_node = MicroVuProgram.get_node(line, "AutoRptAppendDateAndTime")
-                    line = line.replace(existing_node, "(AutoRptAppendDateAndTime 1)")
-                line += f" (AutoRptFileName \"{value}\")\n"
-                self.file_lines[line_idx] = line
+            line_idx = self.get_index_containing_text("AutoExpFile")
+            if line_idx < 1:
+                return
+            line_nodes = self.file_lines.get_line_nodes(line_idx)
+            line_nodes.set_value("AutoRptSortInstructionsByName", "0")
+            line_nodes.set_text("AutoRptTemplateName", "Classic")
+            line_nodes.set_value("AutoRptAppendDateAndTime", "1")
+            line_nodes.set_text("AutoRptFileName", value)
+            self.file_lines[line_idx] = line_nodes.text
 
     @property
     def rev_number(self) -> str:
@@ -354,66 +389,95 @@ class MicroVuProgram:
     def smartprofile_projectname(self, value: str) -> None:
         self._smartprofile_projectname = value
 
+    @property
+    def system_graph(self) -> MicroVuSystemGraph:
+        return self._get_cached_value("system_graph", lambda: MicroVuSystemGraph(self.file_lines))
+
     @property
     def view_name(self) -> str:
-        rev_begin_idx = 0
-        rev_end_idx = 0
-        view_name = ""
+        return self._view_name
 
-        filename = Path(self._filepath).stem
-        filename_parts = re.split("[ _]", filename)
-        count_of_parts = len(filename_parts)
-        if count_of_parts == 1:
-            return ""
-        for x in range(len(filename_parts)):
-            if filename_parts[x].upper().startswith("REV"):
-                rev_begin_idx = x
-                if filename_parts[rev_begin_idx].upper() == "REV":
-                    rev_end_idx = rev_begin_idx + 1
-                else:
-                    rev_end_idx = rev_begin_idx
+    # Public Methods
+    def close(self) -> None:
+        self.file_lines.close()
 
-        if rev_begin_idx == 0:
-            for part in range(1, len(filename_parts)):
-                view_name += f"{filename_parts[part]} "
-        elif rev_begin_idx == 1 and rev_end_idx < count_of_parts - 1:
-            for part in range(rev_end_idx, len(filename_parts)):
-                view_name += f"{filename_parts[part]} "
-        else:
-            for part in range(1, rev_end_idx):
-                view_name += f"{filename_parts[part]} "
-        return view_name.strip()
+    def decimate_point_cloud(self, spacing: float = 0.0, point_count: int = 0) -> MicroVuPointDecimation:
+        decimation = MicroVuPointDecimation(self.file_lines, spacing, point_count)
+        self.file_lines.delete_lines(decimation.deleted_line_indexes)
+        return decimation
 
-    # Public Methods
     def delete_line_containing_text(self, text_to_find: str) -> None:
         idx_to_delete = self.get_index_containing_text(text_to_find)
         if idx_to_delete > 0:
             del self.file_lines[idx_to_delete]
 
+    def delete_lines(self, line_indexes: list[int]) -> None:
+        self.file_lines.delete_lines(line_indexes)
+
+    def delete_named_lines(self, names: Iterable[str], line_types: Iterable[str]) -> None:
+        upper_names = {name.upper() for name in names}
+        line_types = set(line_types)
+        self.file_lines.delete_lines([
+            i
+            for name in self.file_lines.names if name.upper() in upper_names
+            for i in self.file_lines.get_name_indexes(name)
+            if i > 0 and MicroVuLines.get_line_type(self.file_lines[i]) in line_types
+        ])
+
     def get_index_containing_text(self, text_to_find: str) -> int:
-        return next(
-                (i for i, l in enumerate(self.file_lines)
-                 if l.upper().find(text_to_find.upper()) > 1), -1
-        )
+        return self.file_lines.get_index_containing_text(text_to_find)
 
     def insert_line(self, line_index: int, line: str) -> None:
         self.file_lines.insert(line_index, line)
 
-    def update_feature_name(self, line_index: int, feature_name: str) -> None:
-        if self._does_name_already_exist(feature_name):
-            return
-        current_line = self.file_lines[line_index]
-        current_name = MicroVuProgram.get_node_text(current_line, "(Name ", "\"")
-        new_line = MicroVuProgram.set_node_text(current_line, "(Name ", feature_name, "\"")
-        new_line = new_line.replace(f"\"{current_name}\"", f"\"{feature_name}\"")
-        self.file_lines[line_index] = new_line
-        self._global_replace(f"\"{current_name}\"", f"\"{feature_name}\"")
+    def insert_lines(self, line_index: int, lines: list[str]) -> None:
+        self.file_lines.insert_lines(line_index, lines)
+
+    def plan_feature_names(self, feature_names: dict[int, str]) -> FeatureRenamePlan:
+        name_indexes = {name: self.file_lines.get_name_indexes(name) for name in self.file_lines.names}
+        current_names = {i: self.file_lines.get_line_nodes(i).get_text("Name") for i in feature_names}
+        return FeatureRenamePlan(feature_names, current_names, name_indexes)
+
+    def update_feature_name(self, line_index: int, feature_name: str) -> FeatureRenamePlan:
+        return self.update_feature_names({line_index: feature_name})
+
+    def update_feature_names(self, feature_names: dict[int, str]) -> FeatureRenamePlan:
+        plan = self.plan_feature_names(feature_names)
+        for rename in plan.renamed:
+            line_nodes = self.file_lines.get_line_nodes(rename.index)
+            old_value = MicroVuLineNodes.quote(rename.old_name)
+            new_value = MicroVuLineNodes.quote(rename.new_name)
+            for prop_labels_node in line_nodes.find_all("PropLabels"):
+                for node in prop_labels_node.children:
+                    if node.raw_value == old_value:
+                        line_nodes.set_raw_value(node, new_value)
+            line_nodes.set_text("Name", rename.new_name)
+            self.file_lines[rename.index] = line_nodes.text
+        return plan
 
     def update_instruction_count(self) -> None:
+        if lib.Utilities.get_settings().verify_instruction_count:
+            self.verify_instruction_count()
         instruction_count = self._get_instructions_count()
         idx: int = self.get_index_containing_text("AutoExpFile")
-        self.file_lines[idx] = MicroVuProgram.set_node_text(
-                self.file_lines[idx], "(InsIdx", instruction_count, " ", ")")
-        instruction_line_idx = next((i for i, l in enumerate(self.file_lines) if l.startswith("Instructions")), 0)
+        if idx > -1:
+            line_nodes = self.file_lines.get_line_nodes(idx)
+            if node := line_nodes.get("InsIdx"):
+                line_nodes.set_raw_value(node, str(instruction_count))
+                self.file_lines[idx] = line_nodes.text
+        instruction_line_idx = self.instructions_index
         self.file_lines[instruction_line_idx] = MicroVuProgram.set_node_text(
                 self.file_lines[instruction_line_idx], "Instructions", instruction_count, " ")
+
+    def verify_instruction_count(self) -> None:
+        instruction_count = 0
+        for line in self.file_lines.iter_lines():
+            instruction_count += sum(1 for part in line.rstrip("\r\n").split("\n") if part.find("(Name ") > 1)
+        if instruction_count != self.file_lines.instruction_count:
+            raise MicroVuException(f"{self.filename} has {instruction_count} instructions but "
+                                   f"{self.file_lines.instruction_count} are indexed.")
+
+    def write_file(self, filepath: str, is_fsync: bool = False) -> MicroVuFileWriter:
+        if os.path.normcase(os.path.abspath(filepath)) == os.path.normcase(os.path.abspath(self._filepath)):
+            self.file_lines.materialize()
+        return MicroVuFileWriter.write_lines(filepath, self.file_lines, is_fsync=is_fsync)
@@ -0,0 +1,179 @@
+import io
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Optional
+
+from lib.MicroVuLines import MicroVuLines
+from lib.MicroVuNodes import MicroVuLineNodes
+
+
+class MicroVuProgramProbe:
+    BLOCK_SIZE: int = 1 << 16
+    ENCODING: str = "utf-16-le"
+    HEADER_LINE_TYPES: tuple[str, ...] = ("Instructions", "Prog")
+    LINE_PREFIX_LENGTH: int = 64
+    _LINE_FEED: bytes = "\n".encode(ENCODING)
+
+    _bytes_read: int
+    _data: Optional[bytes]
+    _declared_instruction_count: int
+    _export_filepath: str
+    _filepath: str
+    _has_calculators: bool
+    _instruction_count: int
+    _is_end_of_file: bool
+    _is_header_read: bool
+    _lines_read: int
+    _offset: int
+    _report_filepath: str
+
+    # Static Methods
+    @staticmethod
+    def decode(data: bytes) -> str:
+        text = data[:len(data) // 2 * 2].decode(MicroVuProgramProbe.ENCODING, "ignore")
+        if text.endswith("\r\n"):
+            return f"{text[:-2]}\n"
+        return text
+
+    @staticmethod
+    def is_header_line(line_prefix: str) -> bool:
+        return MicroVuLines.get_line_type(line_prefix) in MicroVuProgramProbe.HEADER_LINE_TYPES
+
+    @staticmethod
+    def is_smartprofile_export_filepath(export_filepath: str) -> bool:
+        if Path(export_filepath).stem.upper() == "OUTPUT":
+            return True
+        return "C:\\MICROVU\\POINTCLOUDS\\" in str(Path(export_filepath)).upper()
+
+    # Dunder Methods
+    def __init__(self, filepath: str, data: Optional[bytes] = None):
+        self._filepath = filepath
+        self._data = data
+        self._bytes_read = 0
+        self._declared_instruction_count = -1
+        self._export_filepath = ""
+        self._has_calculators = False
+        self._instruction_count = 0
+        self._is_end_of_file = False
+        self._is_header_read = False
+        self._lines_read = 0
+        self._offset = 0
+        self._report_filepath = ""
+        self._probe(lambda: self._is_header_read)
+
+    # Internal Methods
+    def _is_complete(self) -> bool:
+        if self._has_calculators:
+            return True
+        return -1 < self._declared_instruction_count <= self._instruction_count
+
+    def _open(self) -> BinaryIO:
+        return open(self._filepath, "rb") if self._data is None else io.BytesIO(self._data)
+
+    def _probe(self, is_done: Callable[[], bool]) -> None:
+        if self._is_end_of_file or is_done():
+            return
+        for line in self._read_lines():
+            self._read_line(line)
+            if is_done():
+                break
+
+    def _read_line(self, line: str) -> None:
+        line_type = MicroVuLines.get_line_type(line)
+        if line_type == "Prog":
+            line_nodes = MicroVuLineNodes(line)
+            self._export_filepath = line_nodes.get_text("AutoExpFile")
+            self._report_filepath = line_nodes.get_text("AutoRptFileName")
+        elif line_type == "Instructions" and not self._is_header_read:
+            self._is_header_read = True
+            try:
+                self._declared_instruction_count = int(line.split()[1])
+            except (IndexError, ValueError):
+                pass
+        if line.find("(Name ") > 1:
+            self._is_header_read = True
+            self._instruction_count += 1
+            self._has_calculators = line_type == "Calc"
+
+    def _read_lines(self) -> Iterator[str]:
+        prefix_size = MicroVuProgramProbe.LINE_PREFIX_LENGTH * 2
+        with self._open() as f:
+            f.seek(self._offset)
+            block_offset = self._offset
+            line_parts: list[bytes] = []
+            line_size = 0
+            is_kept = True
+            while block := f.read(MicroVuProgramProbe.BLOCK_SIZE):
+                self._bytes_read += len(block)
+                begin_index = 0
+                while begin_index < len(block):
+                    end_index = block.find(MicroVuProgramProbe._LINE_FEED, begin_index)
+                    while end_index != -1 and end_index % 2:
+                        end_index = block.find(MicroVuProgramProbe._LINE_FEED, end_index + 1)
+                    next_index = len(block) if end_index == -1 else end_index + 2
+                    if is_kept:
+                        line_parts.append(block[begin_index:next_index])
+                    line_size += next_index - begin_index
+                    if is_kept and line_size >= prefix_size:
+                        line_prefix = b"".join(line_parts)[:prefix_size]
+                        if not MicroVuProgramProbe.is_header_line(MicroVuProgramProbe.decode(line_prefix)):
+                            line_parts = [line_prefix]
+                            is_kept = False
+                    begin_index = next_index
+                    if end_index == -1:
+                        break
+                    self._offset = block_offset + next_index
+                    self._lines_read += 1
+                    yield MicroVuProgramProbe.decode(b"".join(line_parts))
+                    line_parts = []
+                    line_size = 0
+                    is_kept = True
+                block_offset += len(block)
+            if line_parts:
+                self._offset = block_offset
+                self._lines_read += 1
+                yield MicroVuProgramProbe.decode(b"".join(line_parts))
+        self._is_end_of_file = True
+
+    def _scan(self) -> None:
+        self._probe(self._is_complete)
+
+    # Properties
+    @property
+    def export_filepath(self) -> str:
+        return self._export_filepath
+
+    @property
+    def filename(self) -> str:
+        return Path(self._filepath).name
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def bytes_read(self) -> int:
+        return self._bytes_read
+
+    @property
+    def has_calculators(self) -> bool:
+        self._scan()
+        return self._has_calculators
+
+    @property
+    def instruction_count(self) -> int:
+        if self._declared_instruction_count > -1:
+            return self._declared_instruction_count
+        self._scan()
+        return self._instruction_count
+
+    @property
+    def is_smartprofile(self) -> bool:
+        return MicroVuProgramProbe.is_smartprofile_export_filepath(self._export_filepath)
+
+    @property
+    def lines_read(self) -> int:
+        return self._lines_read
+
+    @property
+    def report_filepath(self) -> str:
+        return self._report_filepath
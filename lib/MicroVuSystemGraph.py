@@ -0,0 +1,156 @@
+import re
+from typing import Iterable, Optional
+
+import numpy as np
+
+from lib.MicroVuLines import MicroVuLines
+
+
+class MicroVuSystemGraph:
+    _PCS_ROW: re = re.compile(r"\(([^()]*)\)")
+
+    _feature_system_ids: dict[int, str]
+    _global_transforms: Optional[np.ndarray]
+    _line_indexes: np.ndarray
+    _local_transforms: np.ndarray
+    _parent_positions: np.ndarray
+    _positions_by_id: dict[str, int]
+    _system_ids: list[str]
+
+    # Static Methods
+    @staticmethod
+    def get_pcs_transform(raw_pcs: str) -> np.ndarray:
+        transform = np.identity(4)
+        rows = [row.split() for row in MicroVuSystemGraph._PCS_ROW.findall(raw_pcs)[:3]]
+        if len(rows) != 3:
+            return transform
+        values = np.array(rows, dtype=float)
+        if values.shape[1] == 4:
+            transform[:3, :3] = values[:, 1:]
+            transform[:3, 3] = values[:, 0]
+        elif values.shape[1] == 3:
+            transform[:2, :2] = values[:2, :2]
+            transform[:2, 3] = values[:2, 2]
+        return transform
+
+    # Dunder Methods
+    def __init__(self, file_lines: MicroVuLines):
+        self._feature_system_ids = {}
+        self._global_transforms = None
+        self._positions_by_id = {}
+        self._system_ids = []
+        line_indexes: list[int] = []
+        parent_ids: list[str] = []
+        transforms: list[np.ndarray] = []
+        for i in file_lines.get_type_indexes("Sys"):
+            line_nodes = file_lines.get_line_nodes(i)
+            header_parts = line_nodes.header.split()
+            if len(header_parts) < 3:
+                continue
+            self._positions_by_id[header_parts[2]] = len(self._system_ids)
+            self._system_ids.append(header_parts[2])
+            line_indexes.append(i)
+            parent_ids.append(line_nodes.get_text("Sys").strip())
+            pcs_node = line_nodes.get("PCS")
+            transforms.append(MicroVuSystemGraph.get_pcs_transform(pcs_node.raw_value if pcs_node else ""))
+        system_line_indexes = set(line_indexes)
+        for i in file_lines.get_marker_indexes("(Sys "):
+            if i not in system_line_indexes:
+                if system_id := file_lines.get_line_nodes(i).get_text("Sys").strip():
+                    self._feature_system_ids[i] = system_id
+        self._line_indexes = np.array(line_indexes, dtype=np.int64)
+        self._parent_positions = np.array([self._positions_by_id.get(parent_id, -1) for parent_id in parent_ids],
+                                          dtype=np.int64)
+        self._local_transforms = np.array(transforms).reshape(-1, 4, 4)
+
+    def __len__(self) -> int:
+        return len(self._system_ids)
+
+    # Internal Methods
+    def _get_depths(self) -> np.ndarray:
+        depths = np.zeros(len(self), dtype=np.int64)
+        ancestors = self._parent_positions.copy()
+        for _ in range(len(self)):
+            has_ancestor = ancestors > -1
+            if not has_ancestor.any():
+                break
+            depths[has_ancestor] += 1
+            ancestors[has_ancestor] = self._parent_positions[ancestors[has_ancestor]]
+        return depths
+
+    def _get_position(self, system_id: str) -> int:
+        if (position := self._positions_by_id.get(system_id)) is None:
+            raise KeyError(f"Unknown coordinate system '{system_id}'.")
+        return position
+
+    # Properties
+    @property
+    def feature_system_ids(self) -> dict[int, str]:
+        return dict(self._feature_system_ids)
+
+    @property
+    def global_transforms(self) -> np.ndarray:
+        if self._global_transforms is None:
+            global_transforms = self._local_transforms.copy()
+            depths = self._get_depths()
+            for depth in range(1, int(depths.max(initial=0)) + 1):
+                positions = np.flatnonzero(depths == depth)
+                global_transforms[positions] = global_transforms[self._parent_positions[positions]] @ \
+                    self._local_transforms[positions]
+            self._global_transforms = global_transforms
+        return self._global_transforms
+
+    @property
+    def last_system_id(self) -> str:
+        line_index = -1
+        system_id = ""
+        for position in np.flatnonzero(self._parent_positions > -1).tolist():
+            if self._line_indexes[position] > line_index:
+                line_index = int(self._line_indexes[position])
+                system_id = self._system_ids[position]
+        for feature_line_index, feature_system_id in self._feature_system_ids.items():
+            if feature_line_index > line_index:
+                line_index = feature_line_index
+                system_id = feature_system_id
+        return system_id
+
+    @property
+    def line_indexes(self) -> list[int]:
+        return self._line_indexes.tolist()
+
+    @property
+    def local_transforms(self) -> np.ndarray:
+        return self._local_transforms
+
+    @property
+    def parent_ids(self) -> list[str]:
+        return [self._system_ids[p] if p > -1 else "" for p in self._parent_positions.tolist()]
+
+    @property
+    def system_ids(self) -> list[str]:
+        return list(self._system_ids)
+
+    # Public Methods
+    def get_children(self, system_id: str) -> list[str]:
+        position = self._get_position(system_id)
+        return [self._system_ids[p] for p in np.flatnonzero(self._parent_positions == position).tolist()]
+
+    def get_feature_transforms(self, line_indexes: Iterable[int]) -> np.ndarray:
+        positions = [self._get_position(self._feature_system_ids[i]) for i in line_indexes]
+        return self.global_transforms[np.array(positions, dtype=np.int64)]
+
+    def get_path(self, system_id: str) -> list[str]:
+        path: list[str] = []
+        position = self._get_position(system_id)
+        while position > -1 and len(path) <= len(self):
+            path.append(self._system_ids[position])
+            position = int(self._parent_positions[position])
+        return path[::-1]
+
+    def get_transform(self, system_id: str) -> np.ndarray:
+        return self.global_transforms[self._get_position(system_id)]
+
+    def transform_points(self, system_id: str, points: np.ndarray) -> np.ndarray:
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        transform = self.get_transform(system_id)
+        return points @ transform[:3, :3].T + transform[:3, 3]
@@ -0,0 +1,74 @@
+import os
+from typing import Iterable
+
+
+class ResourceRegistry:
+    SNIPPET_EXTENSION: str = ".txt"
+    _UTF16_LE_BOM: bytes = b"\xff\xfe"
+    _instances: dict[tuple[str, ...], "ResourceRegistry"] = {}
+
+    _directories: tuple[str, ...]
+    _filepaths_by_name: dict[str, str]
+    _lines_by_name: dict[str, list[str]]
+
+    # Static Methods
+    @staticmethod
+    def get_shared(directories: Iterable[str]) -> "ResourceRegistry":
+        directories = tuple(directories)
+        if (registry := ResourceRegistry._instances.get(directories)) is None:
+            registry = ResourceRegistry(directories)
+            ResourceRegistry._instances[directories] = registry
+        return registry
+
+    @staticmethod
+    def read_lines(filepath: str) -> list[str]:
+        with open(filepath, "rb") as f:
+            is_utf16 = f.read(len(ResourceRegistry._UTF16_LE_BOM)) == ResourceRegistry._UTF16_LE_BOM
+        with open(filepath, "r", encoding="utf-16-le" if is_utf16 else None) as f:
+            return f.readlines()
+
+    # Dunder Methods
+    def __init__(self, directories: Iterable[str]):
+        self._directories = tuple(directories)
+        self.reload()
+
+    # Properties
+    @property
+    def directories(self) -> tuple[str, ...]:
+        return self._directories
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(self._filepaths_by_name)
+
+    # Public Methods
+    def get_filepath(self, name: str) -> str:
+        return self._filepaths_by_name.get(name, "")
+
+    def get_lines(self, name: str) -> list[str]:
+        if (lines := self._lines_by_name.get(name)) is None:
+            filepath = self.get_filepath(name)
+            if not filepath:
+                return []
+            lines = ResourceRegistry.read_lines(filepath)
+            self._lines_by_name[name] = lines
+        return list(lines)
+
+    def get_text(self, name: str) -> str:
+        return "".join(self.get_lines(name))
+
+    def reload(self) -> None:
+        self._filepaths_by_name = {}
+        self._lines_by_name = {}
+        for directory in self._directories:
+            try:
+                file_names = sorted(os.listdir(directory))
+            except OSError:
+                continue
+            for file_name in file_names:
+                filepath = os.path.join(directory, file_name)
+                if file_name not in self._filepaths_by_name and os.path.isfile(filepath):
+                    self._filepaths_by_name[file_name] = filepath
+        for name, filepath in self._filepaths_by_name.items():
+            if name.endswith(ResourceRegistry.SNIPPET_EXTENSION):
+                self._lines_by_name[name] = ResourceRegistry.read_lines(filepath)
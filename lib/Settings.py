@@ -0,0 +1,174 @@
+import configparser
+import os
+from typing import Optional
+
+
+class Settings:
+    _instances: dict[str, "Settings"] = {}
+
+    _config: configparser.ConfigParser
+    _file_signature: Optional[tuple[int, int]]
+    _ini_filepath: str
+    _is_loaded: bool
+
+    # Static Methods
+    @staticmethod
+    def get_shared(ini_filepath: str) -> "Settings":
+        if (settings := Settings._instances.get(ini_filepath)) is None:
+            settings = Settings(ini_filepath)
+            Settings._instances[ini_filepath] = settings
+        return settings
+
+    # Dunder Methods
+    def __init__(self, ini_filepath: str):
+        self._ini_filepath = ini_filepath
+        self._config = configparser.ConfigParser()
+        self._file_signature = None
+        self._is_loaded = False
+
+    # Internal Methods
+    def _get_bool(self, ini_section: str, ini_key: str) -> bool:
+        return self.get_value(ini_section, ini_key) == "True"
+
+    def _get_file_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(self._ini_filepath)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self) -> None:
+        file_signature = self._get_file_signature()
+        if self._is_loaded and file_signature == self._file_signature:
+            return
+        config = configparser.ConfigParser()
+        if file_signature is not None:
+            config.read(self._ini_filepath)
+        self._config = config
+        self._file_signature = file_signature
+        self._is_loaded = True
+
+    # Properties
+    @property
+    def adaptive_dimension_rule_order(self) -> bool:
+        return self._get_bool("GlobalSettings", "adaptive_dimension_rule_order")
+
+    @property
+    def allow_delete(self) -> bool:
+        return self._get_bool("GlobalSettings", "allow_delete")
+
+    @property
+    def dimension_root(self) -> str:
+        return self.get_value("GlobalSettings", "dimension_root")
+
+    @property
+    def dimension_name_cache_size(self) -> int:
+        setting_value = self.get_value("GlobalSettings", "dimension_name_cache_size")
+        return int(setting_value) if setting_value.isdigit() else 0
+
+    @property
+    def dimension_rules_filepath(self) -> str:
+        return self.get_value("Paths", "dimension_rules_filepath")
+
+    @property
+    def disable_on_convert(self) -> bool:
+        return self._get_bool("GlobalSettings", "disable_on_convert")
+
+    @property
+    def export_path(self) -> str:
+        return self.get_value("Paths", "export_path")
+
+    @property
+    def fsync_output_files(self) -> bool:
+        return self._get_bool("GlobalSettings", "fsync_output_files")
+
+    @property
+    def hand_edit_dimension_names(self) -> bool:
+        return self._get_bool("GlobalSettings", "hand_edit_dimension_names")
+
+    @property
+    def ini_filepath(self) -> str:
+        return self._ini_filepath
+
+    @property
+    def initials(self) -> str:
+        return self.get_value("UserSettings", "initials")
+
+    @property
+    def input_rootpath(self) -> str:
+        return self.get_value("Paths", "input_rootpath")
+
+    @property
+    def output_rootpath(self) -> str:
+        return self.get_value("Paths", "output_rootpath")
+
+    @property
+    def point_cloud_point_count(self) -> int:
+        setting_value = self.get_value("GlobalSettings", "point_cloud_point_count")
+        return int(setting_value) if setting_value.isdigit() else 0
+
+    @property
+    def point_cloud_spacing(self) -> float:
+        try:
+            return max(float(self.get_value("GlobalSettings", "point_cloud_spacing")), 0.0)
+        except ValueError:
+            return 0.0
+
+    @property
+    def remove_bring_to_metrology_pic(self) -> bool:
+        return self._get_bool("GlobalSettings", "remove_bring_to_metrology_pic")
+
+    @property
+    def reporting_root_path(self) -> str:
+        return self.get_value("Paths", "reporting_root_path")
+
+    @property
+    def site(self) -> str:
+        return self.get_value("Location", "site")
+
+    @property
+    def smart_profile_directory(self) -> str:
+        return self.get_value("Paths", "smart_profile_directory")
+
+    @property
+    def smart_profile_exe_filepath(self) -> str:
+        return self.get_value("Paths", "smart_profile_exe_filepath")
+
+    @property
+    def smart_profile_script_filepath(self) -> str:
+        return self.get_value("Paths", "smart_profile_script_filepath")
+
+    @property
+    def template_directory(self) -> str:
+        return self.get_value("Paths", "template_directory")
+
+    @property
+    def verify_instruction_count(self) -> bool:
+        return self._get_bool("GlobalSettings", "verify_instruction_count")
+
+    # Public Methods
+    def get_legacy_prompt_names(self, site: str) -> tuple[str, ...]:
+        setting_value = self.get_value("GlobalSettings", f"{site}_legacy_prompt_names")
+        return tuple(name.strip() for name in setting_value.split(",") if name.strip())
+
+    def get_value(self, ini_section: str, ini_key: str) -> str:
+        self._refresh()
+        for key in (ini_key, "*"):
+            try:
+                return self._config.get(ini_section, key)
+            except configparser.Error:
+                continue
+        return ""
+
+    def reload(self) -> None:
+        self._is_loaded = False
+        self._refresh()
+
+    def set_value(self, ini_value: str, ini_section: str, ini_key: str) -> None:
+        self._refresh()
+        if not self._config.has_section(ini_section):
+            self._config.add_section(ini_section)
+        self._config.set(ini_section, ini_key, ini_value)
+        with open(self._ini_filepath, "w") as conf:
+            self._config.write(conf)
+        self._file_signature = self._get_file_signature()
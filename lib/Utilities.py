@@ -1,6 +1,9 @@
-import configparser
 import os
 
+from lib.MicroVuFileWriter import MicroVuFileWriter
+from lib.ResourceRegistry import ResourceRegistry
+from lib.Settings import Settings
+
 
 def GetIniFilePath(ini_file_name):
     if config_env_variable := os.getenv('MICRO_VU_CONVERTER_CONFIG_LOCATION'):
@@ -10,31 +13,28 @@ def GetIniFilePath(ini_file_name):
 
 
 def GetStoredIniValue(ini_section, ini_key, ini_filename):
-    ini_file_path = GetIniFilePath(ini_filename)
-    config = configparser.ConfigParser()
-    config.read(ini_file_path)
-    try:
-        config_value = config.get(ini_section, ini_key)
-    except:
-        try:
-            config_value = config.get(ini_section, "*")
-        except:
-            config_value = ""
-    return config_value
+    return get_settings(ini_filename).get_value(ini_section, ini_key)
 
 
 def StoreIniValue(ini_value, ini_section, ini_key, ini_filename):
-    ini_file_path = GetIniFilePath(ini_filename)
-    config = configparser.ConfigParser()
-    if not os.path.exists(ini_file_path):
-        config.add_section(ini_section)
-    else:
-        if not config.has_section(ini_section):
-            config.add_section(ini_section)
-        config.read(ini_file_path)
-    config.set(ini_section, ini_key, ini_value)
-    with open(ini_file_path, "w") as conf:
-        config.write(conf)
+    get_settings(ini_filename).set_value(ini_value, ini_section, ini_key)
+
+
+def get_dimension_rules_filepath() -> str:
+    settings = get_settings()
+    if dimension_rules_filepath := settings.dimension_rules_filepath:
+        return dimension_rules_filepath
+    return os.path.join(os.path.dirname(settings.ini_filepath), "DimensionNameRules.ini")
+
+
+def get_resources() -> ResourceRegistry:
+    lib_directory = os.path.dirname(__file__)
+    template_directory = get_settings().template_directory or lib_directory
+    return ResourceRegistry.get_shared((template_directory, os.path.dirname(lib_directory)))
+
+
+def get_settings(ini_filename: str = "Settings") -> Settings:
+    return Settings.get_shared(GetIniFilePath(ini_filename))
 
 
 def get_unencoded_file_lines(file_path: str) -> list[str]:
@@ -65,7 +65,6 @@ def get_file_as_string(file_path: str):
         return str(f.read())
 
 
-def write_lines_to_file(output_filepath: str, file_lines: list[str], encoding='utf-8', newline='\n'):
-    with open(output_filepath, 'w+', encoding=f'{encoding}', newline=f'{newline}') as f:
-        for line in file_lines:
-            f.write(f"{line}")
+def write_lines_to_file(output_filepath: str, file_lines: list[str], encoding='utf-8', newline='\n',
+                        is_fsync: bool = False) -> MicroVuFileWriter:
+    return MicroVuFileWriter.write_lines(output_filepath, file_lines, encoding, newline, is_fsync)
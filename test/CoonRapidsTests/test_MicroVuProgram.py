@@ -2,7 +2,7 @@ import shutil
 
 import pytest
 
-from lib.MicroVuProgram import MicroVuProgram
+from lib.MicroVuProgram import MicroVuProgram, MicroVuException
 from test.CommonFunctions import get_input_filepath, get_output_filepath, delete_all_files_in_output_directory, \
     get_output_directory
 
@@ -156,6 +156,42 @@ def test_update_feature_name(micro_vu):
     assert micro_vu.file_lines[54].find("D_DATUM") > -1
 
 
+def test_update_feature_names():
+    micro_vu = MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", "")
+    micro_vu.update_feature_names({174: "4", 184: "ITEM 4", 194: "5", 200: "4"})
+    assert micro_vu.file_lines[174].startswith("Dst 2 1551B738 (Name \"4\") (ExpLab) (PropLabels (DistX \"4\"))")
+    assert micro_vu.file_lines[184].startswith("Ang 2 1FB12200 (Name \"ITEM 4\") (ExpLab) (PropLabels (AngInt \"ITEM 4\"))")
+    assert micro_vu.file_lines[194].find("(Name \"5\")") > -1
+    assert micro_vu.file_lines[200].find("(Name \"#ITEM 30\")") > -1
+
+
+def test_update_feature_names_leaves_other_lines():
+    micro_vu = MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", "")
+    note_line = "Txt 0 1EFD3AA9 (Name \"Farfignugen\") (Txt \"ITEM 4\")\n"
+    micro_vu.insert_line(len(micro_vu.file_lines), note_line)
+    micro_vu.update_feature_names({174: "4"})
+    assert micro_vu.file_lines[174].startswith("Dst 2 1551B738 (Name \"4\") (ExpLab) (PropLabels (DistX \"4\"))")
+    assert micro_vu.file_lines[-1] == note_line
+
+
+def test_update_feature_names_swap():
+    micro_vu = MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", "")
+    plan = micro_vu.update_feature_names({174: "#ITEM 30", 200: "ITEM 4", 194: "ITEM 4"})
+    assert micro_vu.file_lines[174].startswith("Dst 2 1551B738 (Name \"#ITEM 30\")")
+    assert micro_vu.file_lines[200].find("(Name \"ITEM 4\")") > -1
+    assert [(rename.index, rename.status, rename.conflicting_index) for rename in plan.skipped] == [
+        (194, "duplicate", 200)]
+
+
+def test_delete_named_lines():
+    micro_vu = MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", "")
+    micro_vu.insert_line(17, "Prmt 0 1EFD3AA9 (Name \"Job #\") (ExpProps Ans) (Txt \"Job #\")\n")
+    micro_vu.delete_named_lines(["JOB #", "Employee #", "ITEM 4"], ("Prmt", "Txt"))
+    assert micro_vu.file_lines.get_name_indexes("Job #") == []
+    assert micro_vu.file_lines.get_name_indexes("Employee #") == []
+    assert micro_vu.file_lines.get_name_index("ITEM 4") > -1
+
+
 def test_update_instruction_count(micro_vu):
     micro_vu.insert_line(10, "Prmt 0 1EFD3AA8 (Name \"Farfignugen #\") (ExpProps Ans) (Txt \"Farfignugen\")")
     micro_vu.update_instruction_count()
@@ -165,6 +201,68 @@ def test_update_instruction_count(micro_vu):
     assert micro_vu.file_lines[3].find("Instructions 54") > -1
 
 
+def test_update_instruction_count_without_ins_idx():
+    micro_vu = MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", "")
+    idx = micro_vu.get_index_containing_text("AutoExpFile")
+    line_without_ins_idx = micro_vu.file_lines[idx].replace("(InsIdx 54) ", "")
+    micro_vu.file_lines[idx] = line_without_ins_idx
+    micro_vu.update_instruction_count()
+    assert micro_vu.file_lines[idx] == line_without_ins_idx
+    micro_vu.file_lines[idx] = line_without_ins_idx.replace("AutoExpFile", "Farfignugen")
+    last_line = micro_vu.file_lines[-1]
+    micro_vu.update_instruction_count()
+    assert micro_vu.file_lines[-1] == last_line
+    assert micro_vu.file_lines[3].find("Instructions 54") > -1
+
+
+def test_derived_values_follow_edits():
+    micro_vu = MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", "")
+    version = micro_vu.file_lines.version
+    export_filepath = micro_vu.export_filepath
+    dimension_count = len(micro_vu.dimension_names)
+    micro_vu.dimension_names[0].name = "FARFIGNUGEN"
+    assert micro_vu.dimension_names[0].name != "FARFIGNUGEN"
+    assert micro_vu.file_lines.version == version
+    micro_vu.export_filepath = "C:\\TEXT\\Farfignugen.csv"
+    assert micro_vu.file_lines.version > version
+    assert micro_vu.export_filepath == "C:\\TEXT\\Farfignugen.csv" != export_filepath
+    micro_vu.delete_lines([micro_vu.dimension_names[0].index])
+    assert len(micro_vu.dimension_names) == dimension_count - 1
+
+
+def test_verify_instruction_count():
+    micro_vu = MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", "")
+    micro_vu.insert_lines(10, ["Prmt 0 1EFD3AA8 (Name \"Farfignugen #\") (ExpProps Ans) (Txt \"Farfignugen\")\n"])
+    micro_vu.delete_lines([11])
+    micro_vu.verify_instruction_count()
+    assert not micro_vu.file_lines.is_materialized
+    micro_vu.insert_line(10, "Prmt 0 1EFD3AA9 (Name \"Farfignugen 2\") (Txt \"Farfignugen\")\n"
+                             "Prmt 0 1EFD3AAA (Name \"Farfignugen 3\") (Txt \"Farfignugen\")\n")
+    with pytest.raises(MicroVuException):
+        micro_vu.verify_instruction_count()
+
+
+def test_write_file_over_input(tmp_path):
+    input_filepath = str(tmp_path / "446007 END VIEW.iwp")
+    shutil.copy(get_input_filepath("446007 END VIEW.iwp"), input_filepath)
+    micro_vu = MicroVuProgram(input_filepath, "10", "A", "")
+    micro_vu.comment = "Farfignugen"
+    writer = micro_vu.write_file(input_filepath)
+    assert writer.byte_count == (tmp_path / "446007 END VIEW.iwp").stat().st_size
+    assert MicroVuProgram(input_filepath, "10", "A", "").comment == "Farfignugen"
+    assert len(micro_vu.file_lines) == len(MicroVuProgram(input_filepath, "10", "A", "").file_lines)
+
+
+def test_close():
+    with MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", "") as micro_vu:
+        assert not micro_vu.file_lines.is_closed
+        first_line = micro_vu.file_lines[0]
+    assert micro_vu.file_lines.is_closed
+    assert micro_vu.file_lines[0] == first_line
+    with pytest.raises(ValueError):
+        list(micro_vu.file_lines)
+
+
 def test_kill_file_call_index(micro_vu):
     assert micro_vu.kill_file_call_index == 4
 
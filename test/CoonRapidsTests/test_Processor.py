@@ -1,9 +1,12 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
 
 import pytest
 
 import lib
 from lib import MicroVuFileProcessor
+from lib.DimensionNameParser import DimensionNameSorter
 from lib.MicroVuProgram import MicroVuProgram
 from test.CommonFunctions import store_ini_value, get_input_filepath, get_output_filepath, get_utf_encoded_file_lines, \
     get_node_text
@@ -168,3 +171,144 @@ def test_features_disabled(micro_vu_lines):
     assert "(DontMeasure)" in micro_vu_lines[218]
     assert "(DontMeasure)" in micro_vu_lines[224]
     assert "(DontMeasure)" in micro_vu_lines[234]
+
+
+def test_process_files_closes_programs_on_error():
+    micro_vu = MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", "")
+    p = lib.MicroVuFileProcessor.get_processor("JTW")
+    p.add_micro_vu_program(micro_vu)
+    with pytest.raises(lib.MicroVuFileProcessor.ProcessorException):
+        p.process_files()
+    assert micro_vu.file_lines.is_closed
+
+
+def test_process_files_in_pool():
+    p = lib.MicroVuFileProcessor.get_processor("JTW")
+    p.add_micro_vu_programs([
+        MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", ""),
+        MicroVuProgram(get_input_filepath("446007 ITEM 1 PROFILE.iwp"), "10", "A", ""),
+    ])
+    results = p.process_files_in_pool(2)
+    assert all(micro_vu.file_lines.is_closed for micro_vu in p.micro_vu_programs)
+    assert [os.path.basename(result.input_filepath) for result in results] == [
+        "446007 END VIEW.iwp", "446007 ITEM 1 PROFILE.iwp"]
+    assert not results[0].succeeded
+    assert "already exists" in results[0].error
+    assert results[1].succeeded
+    assert os.path.exists(get_output_filepath("446007 ITEM 1 PROFILE.iwp"))
+    os.remove(get_output_filepath("446007 ITEM 1 PROFILE.iwp"))
+    summary = lib.MicroVuFileProcessor.ProcessorBatchSummary(results)
+    assert summary.succeeded_count == 1
+    assert summary.failed_results == [results[0]]
+    assert str(summary).startswith("Converted 1 of 2 files.")
+    assert "Dimension name cache:" in str(summary)
+    assert summary.written_byte_count == results[1].written_byte_count > 0
+    assert results[0].written_byte_count == 0
+
+
+def test_process_files_in_pipeline():
+    output_filepath = get_output_filepath("446007 ITEM 1 PROFILE.iwp")
+    p = lib.MicroVuFileProcessor.get_processor("JTW")
+    p.add_micro_vu_program(MicroVuProgram(get_input_filepath("446007 ITEM 1 PROFILE.iwp"), "10", "A", ""))
+    assert p.process_files_in_pool(1)[0].succeeded
+    expected_lines = get_utf_encoded_file_lines(output_filepath)
+    os.remove(output_filepath)
+    missing_job = MicroVuFileProcessor.ProcessorJob(type(p), "JTW", get_input_filepath("446007 ITEM 1 PROFILE.iwp")
+                                                    + ".missing", "10", "A")
+    p.add_micro_vu_program(MicroVuProgram(get_input_filepath("446007 END VIEW.iwp"), "10", "A", ""))
+    jobs = [MicroVuFileProcessor.ProcessorJob.from_micro_vu(type(p), "JTW", micro_vu)
+            for micro_vu in p.micro_vu_programs]
+    assert jobs[0].output_filepath == output_filepath
+    recorded_results = []
+    results = p.process_files_in_pipeline(jobs + [missing_job], max_workers=2, queue_size=1,
+                                          on_result=recorded_results.append)
+    assert recorded_results == results
+    assert [result.input_filepath for result in results] == [job.input_filepath for job in jobs + [missing_job]]
+    assert results[0].succeeded, results[0].error
+    assert results[0].written_byte_count == os.path.getsize(output_filepath)
+    assert results[0].output_lines == []
+    assert get_utf_encoded_file_lines(output_filepath) == expected_lines
+    os.remove(output_filepath)
+    assert "already exists" in results[1].error
+    assert not results[2].succeeded
+
+
+def test_process_files_in_pipeline_stops_reader_on_error(monkeypatch):
+    def submit(*_):
+        raise RuntimeError("Farfignugen")
+
+    def get_jobs():
+        for _ in range(10):
+            read_count.append(1)
+            yield MicroVuFileProcessor.ProcessorJob(type(p), "JTW", get_input_filepath("446007 END VIEW.iwp"),
+                                                    "10", "A")
+
+    monkeypatch.setattr(MicroVuFileProcessor.ProcessPoolExecutor, "submit", submit)
+    p = lib.MicroVuFileProcessor.get_processor("JTW")
+    read_count = []
+    with pytest.raises(RuntimeError):
+        p.process_files_in_pipeline(get_jobs(), max_workers=1, queue_size=1)
+    assert len(read_count) < 10
+
+
+def test_process_files_in_pipeline_keeps_workers_busy(monkeypatch):
+    worker_count = 4
+    barrier = Barrier(worker_count, timeout=5)
+
+    def run_job(job):
+        barrier.wait()
+        return MicroVuFileProcessor.ProcessorResult(job.input_filepath, error="Farfignugen")
+
+    monkeypatch.setattr(MicroVuFileProcessor, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(MicroVuFileProcessor, "run_processor_transform_job", run_job)
+    p = lib.MicroVuFileProcessor.get_processor("JTW")
+    jobs = [MicroVuFileProcessor.ProcessorJob(type(p), "JTW", get_input_filepath("446007 END VIEW.iwp"), "10", "A")
+            for _ in range(worker_count * 2)]
+    results = p.process_files_in_pipeline(jobs, max_workers=worker_count, queue_size=1)
+    assert [result.error for result in results] == ["Farfignugen"] * len(jobs)
+
+
+def test_legacy_prompt_names_are_per_site():
+    coon_rapids_processor = MicroVuFileProcessor.CoonRapidsProcessor("JTW")
+    anoka_processor = MicroVuFileProcessor.AnokaProcessor("JTW")
+    assert coon_rapids_processor.legacy_prompt_names == MicroVuFileProcessor.CoonRapidsProcessor.LEGACY_PROMPT_NAMES
+    store_ini_value("Farfignugen, PT #", "GlobalSettings", "Anoka_legacy_prompt_names")
+    try:
+        assert anoka_processor.legacy_prompt_names == ("Farfignugen", "PT #")
+        assert coon_rapids_processor.legacy_prompt_names == MicroVuFileProcessor.CoonRapidsProcessor.LEGACY_PROMPT_NAMES
+    finally:
+        store_ini_value("", "GlobalSettings", "Anoka_legacy_prompt_names")
+    assert anoka_processor.legacy_prompt_names == MicroVuFileProcessor.AnokaProcessor.LEGACY_PROMPT_NAMES
+
+
+def test_dimension_parsers_are_shared():
+    sorter = DimensionNameSorter.get_shared()
+    pattern_group_count = sorter._regex.groups
+    for _ in range(25):
+        lib.MicroVuFileProcessor.get_processor("JTW")
+    assert DimensionNameSorter.get_shared() is sorter
+    assert len(sorter.dimension_parsers) == len(DimensionNameSorter.DEFAULT_PARSER_TYPES)
+    assert sorter._regex.groups == pattern_group_count
+    assert lib.MicroVuFileProcessor.Processor.parse_dimension_name("ITEM_12A_1X", "INSP_") == "INSP_12A"
+
+
+def test_point_cloud_decimation():
+    store_ini_value("10", "GlobalSettings", "point_cloud_point_count")
+    try:
+        p = lib.MicroVuFileProcessor.get_processor("JTW")
+        p.add_micro_vu_program(MicroVuProgram(get_input_filepath("110047396A0_OPFAI_REVA_SP.iwp"), "10", "A",
+                                              "110047396A0_OPFAI_REVA_SP"))
+        results = p.process_files_in_pool(1)
+    finally:
+        store_ini_value("0", "GlobalSettings", "point_cloud_point_count")
+    output_filepath = get_output_filepath("110047396A0_OPFAI_REVA_SP.iwp")
+    assert results[0].succeeded, results[0].error
+    output_lines = get_utf_encoded_file_lines(output_filepath)
+    os.remove(output_filepath)
+    assert len(results[0].point_cloud_reductions) == 1
+    assert "removed 48 of 78 point cloud points" in results[0].point_cloud_reductions[0]
+    assert "Decimated 1 point clouds:" in str(lib.MicroVuFileProcessor.ProcessorBatchSummary(results))
+    assert not any("(Name \"305\")" in line for line in output_lines)
+    assert any("(Name \"304\")" in line for line in output_lines)
+    instruction_count = sum(1 for line in output_lines if line.find("(Name ") > 1)
+    assert f"Instructions {instruction_count}" in output_lines[3]
@@ -1,3 +1,7 @@
+import json
+
+import pytest
+
 import lib
 
 from lib import DimensionNameParser
@@ -153,3 +157,174 @@ def test_parse_dimension_names():
     assert processor.get_dimension_name("ITEM_32X1", "INSP_") == "INSP_32A"
 
 
+
+
+def test_first_matching_parser_wins():
+    processor = lib.DimensionNameParser.DimensionNameSorter()
+    assert isinstance(processor.get_dimension_parser("12 1"), DimensionNameParser.Parser10)
+    assert isinstance(processor.get_dimension_parser("item_12.1a 1x"), DimensionNameParser.Parser1)
+    assert isinstance(processor.get_dimension_parser("ITEM_32X1"), DimensionNameParser.Parser17)
+    assert processor.get_dimension_parser("Farfignugen") is None
+    assert processor.get_dimension_name("Farfignugen", "INSP_") == "FARFIGNUGEN"
+
+
+def test_register_parser():
+    class ParserZ(DimensionNameParser.DimensionParser):
+        def __init__(self):
+            super().__init__(r"Z(\d+)")
+
+        def format_dimension_name(self, match, prefix: str) -> str:
+            return f"{prefix}{match[1]}Z"
+
+    shared_sorter = DimensionNameParser.DimensionNameSorter.get_shared()
+    DimensionNameParser.DimensionNameSorter.register_parser(ParserZ, 0)
+    try:
+        with pytest.raises(ValueError):
+            DimensionNameParser.DimensionNameSorter.register_parser(ParserZ)
+        sorter = DimensionNameParser.DimensionNameSorter.get_shared()
+        assert sorter is not shared_sorter
+        assert isinstance(sorter.dimension_parsers[0], ParserZ)
+        assert sorter.get_dimension_name("z12", "INSP_") == "INSP_12Z"
+        assert shared_sorter.get_dimension_name("z12", "INSP_") == "Z12"
+    finally:
+        DimensionNameParser.DimensionNameSorter.unregister_parser(ParserZ)
+    assert DimensionNameParser.DimensionNameSorter.get_shared().get_dimension_name("z12", "INSP_") == "Z12"
+
+
+def test_dimension_name_cache():
+    cache = DimensionNameParser.DimensionNameCache(2)
+    assert cache.get_dimension_name("ITEM_12A_1X", "INSP_") == "INSP_12A"
+    assert cache.get_dimension_name("ITEM_12A_1X", "INSP_") == "INSP_12A"
+    assert cache.get_dimension_name("ITEM_12A_1X", "") == "12A"
+    assert cache.get_dimension_name("#12", "INSP_") == "INSP_12"
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.size, stats.max_size) == (1, 3, 1, 2, 2)
+    assert cache.get_dimension_name("ITEM_12A_1X", "INSP_") == "INSP_12A"
+    assert cache.stats.misses == 4
+    cache.resize(1)
+    assert len(cache) == 1
+    assert cache.stats.evictions == 3
+    assert str(cache.stats) == "1 hits, 4 misses, 3 evictions, 1/1 entries"
+    assert (cache.stats - stats).misses == 1
+
+
+def test_dimension_rules_file(tmp_path):
+    rules_filepath = tmp_path / "DimensionNameRules.ini"
+    rules_filepath.write_text("[AnokaDash]\n"
+                              "pattern = (?:#*)ANOKA-(\\d+)-(\\d+)\n"
+                              "template = {prefix}{1}{letter}\n"
+                              "letter_group = 2\n"
+                              "examples = anoka-12-1, #ANOKA-3-2\n")
+    sorter_class = DimensionNameParser.DimensionNameSorter
+    try:
+        sorter_class.load_rules(str(rules_filepath))
+        assert sorter_class.get_shared().dimension_parsers[-1].name == "AnokaDash"
+        assert sorter_class.get_shared().get_dimension_name("#anoka-12-3", "INSP_") == "INSP_12C"
+        assert sorter_class.get_shared().get_dimension_name("ITEM_12A_1X", "INSP_") == "INSP_12A"
+        assert DimensionNameParser.DimensionNameCache().get_dimension_name("ANOKA-7-1", "") == "7A"
+    finally:
+        sorter_class.load_rules(str(tmp_path / "Farfignugen.ini"))
+    assert sorter_class.get_shared().get_dimension_name("ANOKA-12-1", "INSP_") == "ANOKA-12-1"
+
+
+@pytest.mark.parametrize("rule_text, message", [
+    ("[Digits]\npattern = (\\d+)\ntemplate = {prefix}{1}\nexamples = 12\n", "shadowed by 'Parser16'"),
+    ("[Digits]\npattern = (?:#*)(\\d+)\ntemplate = {prefix}{1}\nexamples = 12\nbefore = Parser16\n",
+     "'Parser16' is unreachable"),
+    ("[Digits]\npattern = Z(\\d+)\ntemplate = {prefix}{2}\nexamples = Z12\n", "invalid template"),
+    ("[Digits]\npattern = Z(\\d+)\ntemplate = {prefix}{1}\nexamples = Y12\n", "doesn't match"),
+    ("[Digits]\npattern = Z(\\d+)\ntemplate = {prefix}{1}\n", "at least one example"),
+    ("[Digits]\npattern = Z(\\d+)\ntemplate = {prefix}{1}\nexamples = Z1\nbefore = Parser99\n",
+     "unknown rule 'Parser99'"),
+    ("[Letters]\npattern = (?:#*)(\\d+)([A-Z]+)\ntemplate = {prefix}{1}\nexamples = 12AB\nbefore = Parser15\n",
+     "'Parser15' is shadowed by 'Letters' for '12A'"),
+    ("[Twice]\npattern = Z(\\d)\\1\ntemplate = {prefix}{1}\nexamples = Z11\n", "numbered backreferences"),
+    ("[Flags]\npattern = (?i)Z(\\d+)\ntemplate = {prefix}{1}\nexamples = Z1\n", "global inline flags"),
+    ("[Grouped]\npattern = (?P<Parser1>Z)(\\d+)\ntemplate = {prefix}{2}\nexamples = Z1\n",
+     "'Grouped' can't be combined"),
+])
+def test_invalid_dimension_rules(tmp_path, rule_text, message):
+    rules_filepath = tmp_path / "DimensionNameRules.ini"
+    rules_filepath.write_text(rule_text)
+    shared_sorter = DimensionNameParser.DimensionNameSorter.get_shared()
+    with pytest.raises(DimensionNameParser.DimensionRuleException, match=message):
+        DimensionNameParser.DimensionNameSorter.load_rules(str(rules_filepath))
+    assert DimensionNameParser.DimensionNameSorter.get_shared() is shared_sorter
+
+
+def test_dimension_rule_statistics(tmp_path):
+    sorter = DimensionNameParser.DimensionNameSorter()
+    cache = DimensionNameParser.DimensionNameCache()
+    for name in ["#12", "#12", "12A", "Farfignugen", "farfignugen"]:
+        sorter.get_dimension_name(name, "INSP_")
+    assert sorter.statistics.match_counts == {"Parser16": 2, "Parser15": 1}
+    assert sorter.statistics.unmatched_names == {"FARFIGNUGEN": 2}
+    assert str(sorter.statistics) == "3 matched, 2 unmatched (1 distinct)"
+    shared_statistics = DimensionNameParser.DimensionNameSorter.get_shared().statistics
+    cache.get_dimension_name("#13", "INSP_")
+    cache.get_dimension_name("#13", "INSP_")
+    statistics = DimensionNameParser.DimensionNameSorter.get_shared().statistics - shared_statistics
+    assert statistics.match_counts == {"Parser16": 2}
+    statistics_filepath = tmp_path / "statistics.json"
+    sorter.export_statistics(str(statistics_filepath))
+    exported = json.loads(statistics_filepath.read_text())
+    assert list(exported["match_counts"].items())[:2] == [("Parser16", 2), ("Parser15", 1)]
+    assert exported["match_counts"]["Parser12"] == 0
+    assert len(exported["match_counts"]) == 17
+    assert exported["unmatched_names"] == {"FARFIGNUGEN": 2}
+    sorter.reset_statistics()
+    assert sorter.statistics.match_count == 0
+
+
+def test_adaptive_rule_order():
+    names = ["#12", "12A", "12 1", "12_1X", "ITEM_12.1A 1X", "INSP-12.1_1X", "ITEM_32X1", "12.16", "#12.1_A",
+             "ITEM 12A_1X", "12_B", "#ITEM-12", "Farfignugen"]
+    sorter = DimensionNameParser.DimensionNameSorter()
+    expected = [sorter.get_dimension_name(name, "INSP_") for name in names]
+    for _ in range(5):
+        sorter.get_dimension_name("#12", "INSP_")
+        sorter.get_dimension_name("12 1", "INSP_")
+    sorter.reorder()
+    match_order = [p.name for p in sorter.match_order]
+    assert match_order[:2] == ["Parser10", "Parser16"]
+    assert match_order.index("Parser10") < match_order.index("Parser12")
+    assert [sorter.get_dimension_name(name, "INSP_") for name in names] == expected
+    sorter.is_adaptive = False
+    assert sorter.match_order == sorter.dimension_parsers
+
+
+def test_adaptive_rule_order_without_examples():
+    class ParserZ(DimensionNameParser.DimensionParser):
+        def __init__(self):
+            super().__init__(r"Z(\d+)")
+
+        def format_dimension_name(self, match, prefix: str) -> str:
+            return f"{prefix}{match[1]}Z"
+
+    rule = DimensionNameParser.DimensionRule("Zed", r"ZED(\d+)", "{prefix}{1}", examples=("ZED12",))
+    sorter = DimensionNameParser.DimensionNameSorter((DimensionNameParser.Parser16, ParserZ), [rule])
+    for _ in range(5):
+        sorter.get_dimension_name("Z12", "INSP_")
+        sorter.get_dimension_name("ZED12", "INSP_")
+    sorter.reorder()
+    assert [p.name for p in sorter.match_order] == ["Parser16", "ParserZ", "Zed"]
+    sorter = DimensionNameParser.DimensionNameSorter((DimensionNameParser.Parser16,), [rule])
+    sorter.get_dimension_name("ZED12", "INSP_")
+    sorter.reorder()
+    assert [p.name for p in sorter.match_order] == ["Zed", "Parser16"]
+
+
+def test_translate_many():
+    sorter = DimensionNameParser.DimensionNameSorter()
+    names = ["ITEM_12A_1X", "#12", "12A", "ITEM_12A_1X", "Farfignugen", "ITEM 12"]
+    translation = sorter.translate_many(names, "INSP_")
+    assert len(translation) == 6
+    assert translation.dimension_names == ["INSP_12A", "INSP_12", "INSP_12A", "INSP_12A", "FARFIGNUGEN", "INSP_12"]
+    assert [p.name if p else None for p in translation.dimension_parsers] == [
+        "Parser3", "Parser16", "Parser15", "Parser3", None, "Parser11"]
+    assert translation.collisions == {"INSP_12A": ["ITEM_12A_1X", "12A"], "INSP_12": ["#12", "ITEM 12"]}
+    assert translation.colliding_indexes == [0, 1, 2, 3, 5]
+    assert translation.unmatched_names == ["Farfignugen"]
+    assert sorter.statistics.match_counts["Parser3"] == 2
+    cached_translation = DimensionNameParser.DimensionNameCache().translate_many(names, "INSP_")
+    assert cached_translation.dimension_names == translation.dimension_names
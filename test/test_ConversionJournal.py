@@ -0,0 +1,96 @@
+import json
+import os
+
+import pytest
+
+from lib.ConversionJournal import ConversionJournal, ConversionJournalEntry
+
+
+# Fixtures
+@pytest.fixture()
+def input_filepath(tmp_path) -> str:
+    filepath = str(tmp_path / "program.iwp")
+    with open(filepath, "w") as f:
+        f.write("Farfignugen")
+    return filepath
+
+
+@pytest.fixture()
+def journal_filepath(tmp_path) -> str:
+    return str(tmp_path / "311s.journal.jsonl")
+
+
+def _get_entry(filepath: str, outcome: str = ConversionJournalEntry.SUCCEEDED, error: str = "",
+               content_hash: str = "abc") -> ConversionJournalEntry:
+    size, mtime_ns = ConversionJournal.get_file_signature(filepath)
+    return ConversionJournalEntry(filepath, outcome, filepath + ".out", error, size, mtime_ns, content_hash)
+
+
+# Tests
+def test_record_and_reload(input_filepath, journal_filepath):
+    journal = ConversionJournal(journal_filepath)
+    assert len(journal) == 0
+    assert not journal.is_completed(input_filepath)
+    journal.record(_get_entry(input_filepath, ConversionJournalEntry.FAILED, "File already exists"))
+    assert not journal.is_completed(input_filepath)
+    journal.record(_get_entry(input_filepath))
+    assert journal.is_completed(input_filepath)
+    assert journal.record_count == 2
+    reloaded_journal = ConversionJournal(journal_filepath)
+    assert len(reloaded_journal) == 1
+    assert reloaded_journal.record_count == 0
+    assert reloaded_journal.is_completed(input_filepath)
+    assert reloaded_journal.get_entry(input_filepath).output_filepath == input_filepath + ".out"
+    with open(journal_filepath) as f:
+        assert [json.loads(line)["outcome"] for line in f] == ["failed", "succeeded"]
+
+
+def test_changed_input_is_not_completed(input_filepath, journal_filepath):
+    journal = ConversionJournal(journal_filepath)
+    journal.record(_get_entry(input_filepath))
+    with open(input_filepath, "a") as f:
+        f.write("!")
+    assert not journal.is_completed(input_filepath)
+    assert not journal.is_completed(input_filepath, "def")
+    assert journal.is_completed(input_filepath, "abc")
+
+
+def test_truncated_line_is_ignored(input_filepath, journal_filepath):
+    journal = ConversionJournal(journal_filepath)
+    journal.record(_get_entry(input_filepath))
+    with open(journal_filepath, "a") as f:
+        f.write('{"input_filepath": "Farfig')
+    reloaded_journal = ConversionJournal(journal_filepath)
+    assert len(reloaded_journal) == 1
+    other_filepath = os.path.join(os.path.dirname(input_filepath), "other.iwp")
+    reloaded_journal.record(_get_entry(other_filepath, ConversionJournalEntry.FAILED, "Boom"))
+    assert len(ConversionJournal(journal_filepath)) == 2
+
+
+def test_summary(input_filepath, journal_filepath):
+    journal = ConversionJournal(journal_filepath)
+    journal.record(_get_entry(input_filepath))
+    for file_name in ("a.iwp", "b.iwp"):
+        journal.record(_get_entry(file_name, ConversionJournalEntry.FAILED, "File already exists"))
+    summary = str(journal)
+    assert summary.startswith("1 of 3 files converted, 2 failed (3 recorded this run).")
+    assert "2 x File already exists" in summary
+    assert len(journal.failed_entries) == 2
+
+
+def test_reconcile_started(input_filepath, journal_filepath):
+    journal = ConversionJournal(journal_filepath)
+    assert not journal.reconcile_started(input_filepath, "abc")
+    journal.record(_get_entry(input_filepath, ConversionJournalEntry.STARTED))
+    assert not journal.is_completed(input_filepath)
+    assert not journal.failed_entries
+    assert str(journal).startswith("0 of 1 files converted, 0 failed")
+    assert not journal.reconcile_started(input_filepath, "abc")
+    with open(input_filepath + ".out", "w") as f:
+        f.write("Farfignugen")
+    assert not journal.reconcile_started(input_filepath, "def")
+    assert journal.reconcile_started(input_filepath, "abc")
+    reloaded_journal = ConversionJournal(journal_filepath)
+    assert reloaded_journal.is_completed(input_filepath)
+    assert reloaded_journal.get_entry(input_filepath).output_filepath == input_filepath + ".out"
+    assert not reloaded_journal.reconcile_started(input_filepath, "abc")
@@ -0,0 +1,31 @@
+from lib.FeatureRenamePlan import FeatureRename, FeatureRenamePlan
+
+
+def _get_plan(feature_names: dict[int, str]) -> FeatureRenamePlan:
+    current_names = {10: "A", 20: "B", 30: "C", 40: "D"}
+    name_indexes = {name: [i] for i, name in current_names.items()}
+    return FeatureRenamePlan(feature_names, current_names, name_indexes)
+
+
+# Tests
+def test_chain_and_swap():
+    plan = _get_plan({10: "B", 20: "C", 30: "A"})
+    assert [rename.status for rename in plan] == [FeatureRename.RENAMED] * 3
+    assert plan.new_names == {"A": "B", "B": "C", "C": "A"}
+    assert plan.skipped == []
+
+
+def test_existing_name():
+    plan = _get_plan({10: "B", 20: "D"})
+    assert [rename.status for rename in plan] == [FeatureRename.NAME_EXISTS, FeatureRename.NAME_EXISTS]
+    assert [rename.conflicting_index for rename in plan] == [20, 40]
+    assert plan.new_names == {}
+    assert str(plan.skipped[0]) == "'A' -> 'B' (line 10): name exists at line 20"
+
+
+def test_duplicate_target():
+    plan = _get_plan({10: "E", 20: "E", 30: "C", 40: "F"})
+    assert [rename.status for rename in plan] == [
+        FeatureRename.RENAMED, FeatureRename.DUPLICATE, FeatureRename.UNCHANGED, FeatureRename.RENAMED]
+    assert plan.skipped[0].conflicting_index == 10
+    assert plan.new_names == {"A": "E", "D": "F"}
@@ -0,0 +1,99 @@
+import hashlib
+import os
+
+import pytest
+
+from lib.MicroVuFileReader import MicroVuFileReader
+from lib.MicroVuLines import MicroVuLines
+from lib.Utilities import get_utf_encoded_file_lines
+
+
+def _get_input_filepath(file_name: str) -> str:
+    current_dir = os.path.dirname(__file__)
+    return str(os.path.join(current_dir, "Input", file_name))
+
+
+def _get_input_filepaths() -> list[str]:
+    input_dir = os.path.dirname(_get_input_filepath(""))
+    return [os.path.join(input_dir, file_name) for file_name in sorted(os.listdir(input_dir))
+            if file_name.lower().endswith(".iwp")]
+
+
+# Fixtures
+@pytest.fixture()
+def reader() -> MicroVuFileReader:
+    with MicroVuFileReader(_get_input_filepath("446007 END VIEW.iwp")) as reader:
+        yield reader
+
+
+# Tests
+@pytest.mark.parametrize("filepath", _get_input_filepaths())
+def test_lines_match_text_mode_read(filepath):
+    with MicroVuFileReader(filepath) as reader:
+        assert list(reader) == get_utf_encoded_file_lines(filepath)
+
+
+@pytest.mark.parametrize("filepath", _get_input_filepaths())
+def test_decode_lines_matches_reader(filepath):
+    with open(filepath, "rb") as f:
+        data = f.read()
+    with MicroVuFileReader(filepath) as reader:
+        assert MicroVuFileReader.decode_lines(data) == list(reader)
+
+
+def test_decode_lines():
+    assert MicroVuFileReader.decode_lines("a\r\nb\rc\nd".encode("utf-16-le") + b"\x00") == ["a\n", "b\n", "c\n", "d"]
+    assert MicroVuFileReader.decode_lines("a\r\n".encode("utf-16-le")) == ["a\n"]
+    assert MicroVuFileReader.decode_lines(b"") == []
+
+
+@pytest.mark.parametrize("filepath", _get_input_filepaths())
+def test_lazy_index_matches_list_index(filepath):
+    lazy_lines = MicroVuLines(MicroVuFileReader(filepath))
+    list_lines = MicroVuLines(get_utf_encoded_file_lines(filepath))
+    for marker in MicroVuLines.KEY_MARKERS:
+        assert lazy_lines.get_marker_indexes(marker) == list_lines.get_marker_indexes(marker)
+    assert lazy_lines.instruction_indexes == list_lines.instruction_indexes
+    assert lazy_lines.names == list_lines.names
+    for name in list_lines.names:
+        assert lazy_lines.get_name_index(name) == list_lines.get_name_index(name)
+    for line_type in ["Instructions", "Prog", "Sys", "Txt", "CmdLn", "Calc"]:
+        assert lazy_lines.get_type_indexes(line_type) == list_lines.get_type_indexes(line_type)
+    assert list(lazy_lines) == list(list_lines)
+
+
+def test_find_line_indexes(reader):
+    assert reader.find_line_indexes("AutoExpFile") == [2]
+    assert reader.find_line_indexes("Farfignugen") == []
+    assert reader.find_line_indexes("AUTOEXPFILE") == []
+    assert reader.find_line_indexes("AUTOEXPFILE", ignore_case=True) == [2]
+    assert reader.get_line_prefix(3, 12) == "Instructions"
+
+
+def test_get_content_hash(reader):
+    with open(_get_input_filepath("446007 END VIEW.iwp"), "rb") as f:
+        assert reader.get_content_hash() == hashlib.sha256(f.read()).hexdigest()
+    reader.close()
+    with pytest.raises(ValueError):
+        reader.get_content_hash()
+
+
+def test_only_accessed_lines_are_decoded():
+    lines = MicroVuLines(MicroVuFileReader(_get_input_filepath("446007 END VIEW.iwp")))
+    assert lines[13].startswith("Prmt")
+    assert sum(isinstance(line, str) for line in lines._lines) == 1
+    lines.materialize()
+    assert all(isinstance(line, str) for line in lines._lines)
+
+
+def test_lazy_index_matches_mixed_case_markers(tmp_path):
+    filepath = str(tmp_path / "mixed case.iwp")
+    text = "".join(get_utf_encoded_file_lines(_get_input_filepath("446007 END VIEW.iwp")))
+    with open(filepath, "w", encoding="utf-16-le", newline="\r\n") as f:
+        f.write(text.replace("killFile.bat", "KillFile.Bat").replace("AutoExpFile", "autoexpfile"))
+    lazy_lines = MicroVuLines(MicroVuFileReader(filepath))
+    list_lines = MicroVuLines(get_utf_encoded_file_lines(filepath))
+    for marker in MicroVuLines.KEY_MARKERS:
+        assert lazy_lines.get_marker_indexes(marker) == list_lines.get_marker_indexes(marker)
+    assert lazy_lines.get_marker_index("killFile.bat") > -1
+    assert lazy_lines.get_index_containing_text("AutoExpFile") == 2
@@ -0,0 +1,72 @@
+import os
+import stat
+
+import pytest
+
+from lib.MicroVuFileReader import MicroVuFileReader
+from lib.MicroVuFileWriter import MicroVuFileWriter
+from lib.MicroVuLines import MicroVuLines
+
+
+def _get_input_filepath(file_name: str) -> str:
+    current_dir = os.path.dirname(__file__)
+    return str(os.path.join(current_dir, "Input", file_name))
+
+
+def _write_text_lines(filepath: str, lines: list[str], encoding: str = "utf-16-le", newline: str = "\r\n") -> None:
+    with open(filepath, "w", encoding=encoding, newline=newline) as f:
+        for line in lines:
+            f.write(line)
+
+
+def _read_bytes(filepath: str) -> bytes:
+    with open(filepath, "rb") as f:
+        return f.read()
+
+
+# Tests
+def test_matches_text_mode_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(MicroVuFileWriter, "CHUNK_SIZE", 1000)
+    lines = list(MicroVuLines(MicroVuFileReader(_get_input_filepath("446007 END VIEW.iwp"))))
+    expected_filepath = str(tmp_path / "expected.iwp")
+    _write_text_lines(expected_filepath, lines)
+    writer = MicroVuFileWriter.write_lines(str(tmp_path / "actual.iwp"), lines, is_fsync=True)
+    assert _read_bytes(writer.filepath) == _read_bytes(expected_filepath)
+    assert writer.byte_count == os.path.getsize(expected_filepath)
+    assert writer.elapsed_seconds > 0
+    assert str(writer).endswith(f"{writer.byte_count:,} bytes in {writer.elapsed_seconds:.3f} s")
+    assert sorted(os.listdir(tmp_path)) == ["actual.iwp", "expected.iwp"]
+
+
+def test_encoding_and_newline(tmp_path):
+    lines = ["first\n", "second\n", "third"]
+    expected_filepath = str(tmp_path / "expected.txt")
+    _write_text_lines(expected_filepath, lines, "utf-8", "\n")
+    writer = MicroVuFileWriter.write_lines(str(tmp_path / "actual.txt"), lines, "utf-8", "\n")
+    assert _read_bytes(writer.filepath) == _read_bytes(expected_filepath)
+
+
+def test_failed_write_keeps_existing_file(tmp_path):
+    filepath = str(tmp_path / "program.iwp")
+    MicroVuFileWriter.write_lines(filepath, ["original\n"])
+
+    def get_lines():
+        yield "replacement\n"
+        raise RuntimeError("Farfignugen")
+
+    with pytest.raises(RuntimeError):
+        MicroVuFileWriter.write_lines(filepath, get_lines())
+    assert _read_bytes(filepath) == "original\r\n".encode("utf-16-le")
+    assert os.listdir(tmp_path) == ["program.iwp"]
+
+
+def test_file_mode(tmp_path, monkeypatch):
+    expected_filepath = str(tmp_path / "expected.iwp")
+    _write_text_lines(expected_filepath, ["first\n"])
+    filepath = str(tmp_path / "program.iwp")
+    monkeypatch.setattr(os, "umask", None)
+    MicroVuFileWriter.write_lines(filepath, ["first\n"])
+    assert stat.S_IMODE(os.stat(filepath).st_mode) == stat.S_IMODE(os.stat(expected_filepath).st_mode)
+    os.chmod(filepath, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP)
+    MicroVuFileWriter.write_lines(filepath, ["second\n"])
+    assert stat.S_IMODE(os.stat(filepath).st_mode) == stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP
@@ -0,0 +1,144 @@
+import os
+import random
+
+import pytest
+
+from lib.MicroVuLines import MicroVuLines
+from lib.Utilities import get_utf_encoded_file_lines
+
+
+def _get_input_filepath(file_name: str) -> str:
+    current_dir = os.path.dirname(__file__)
+    return str(os.path.join(current_dir, "Input", file_name))
+
+
+def _scan_for_text(lines: MicroVuLines, text: str) -> int:
+    return next((i for i, line in enumerate(lines) if line.upper().find(text.upper()) > 1), -1)
+
+
+# Fixtures
+@pytest.fixture()
+def lines() -> MicroVuLines:
+    return MicroVuLines(get_utf_encoded_file_lines(_get_input_filepath("446007 END VIEW.iwp")))
+
+
+# Tests
+def test_get_index_containing_text(lines):
+    for text in ["AutoExpFile", "(Name \"Employee #", "Name \"Job #\"", "killFile.bat", "(PCS ((-0.0028379808"]:
+        assert lines.get_index_containing_text(text) == _scan_for_text(lines, text)
+
+
+def test_missing_text(lines):
+    assert lines.get_index_containing_text("Farfignugen") == -1
+    assert lines.get_index_containing_text("(Name \"Farfignugen") == -1
+    assert lines.get_marker_index("SmartProfile.exe") == -1
+
+
+def test_mixed_case_markers(lines):
+    kill_file_index = lines.get_marker_index("killFile.bat")
+    lines[kill_file_index] = lines[kill_file_index].replace("killFile.bat", "KillFile.BAT")
+    lines.append("CmdLn 1 1F19EBC0 (Name \"SP\") (CmdText \"C:\\smartprofile.exe\")\n")
+    assert lines.get_marker_index("killFile.bat") == kill_file_index
+    assert lines.get_index_containing_text("killFile.bat") == kill_file_index
+    assert lines.get_index_containing_text("SmartProfile.exe") == len(lines) - 1
+    assert lines.get_index_containing_text("AUTOEXPFILE") == _scan_for_text(lines, "AutoExpFile")
+
+
+def test_instruction_count(lines):
+    assert lines.instruction_count == 54
+
+
+def test_get_type_index(lines):
+    assert lines.get_type_index("Instructions") == 3
+    assert lines.get_type_index("Calc") == -1
+    assert len(lines.get_type_indexes("Sys")) == 11
+
+
+def test_get_name_index(lines):
+    assert lines.get_name_index("Employee #") == 13
+    assert lines.get_name_index("EMPLOYEE #") == -1
+    assert "ITEM 4" in lines.names
+
+
+def test_insert_shifts_index(lines):
+    lines.insert(10, "Prmt 0 1EFD3AA8 (Name \"Farfignugen #\") (ExpProps Ans) (Txt \"Farfignugen\")\n")
+    assert lines.get_name_index("Farfignugen #") == 10
+    assert lines.get_name_index("Employee #") == 14
+    assert lines.instruction_count == 55
+    assert lines.get_index_containing_text("AutoExpFile") == 2
+
+
+def test_delete_shifts_index(lines):
+    kill_file_index = lines.get_marker_index("killFile.bat")
+    del lines[kill_file_index]
+    assert lines.get_marker_index("killFile.bat") == -1
+    assert lines.get_name_index("Employee #") == 12
+    assert lines.instruction_count == 53
+
+
+def test_set_updates_index(lines):
+    lines[13] = lines[13].replace("\"Employee #\"", "\"EMPLOYEE\"")
+    assert lines.get_name_index("Employee #") == -1
+    assert lines.get_name_index("EMPLOYEE") == 13
+
+
+def test_index_matches_rebuild_after_edits(lines):
+    lines.insert(5, "Txt 0 15665BB8 (Name \"Farfignugen\") (Txt \"C:\\killFile.bat\")\n")
+    lines.append("CmdLn 1 1F19EBC0 (Name \"SP\") (CmdText \"SmartProfile.exe\")\n")
+    del lines[20]
+    lines[30] = "Sys 1 CB91928 (Name \"Bob\") (Sys 1FB10DB0)\n"
+    rebuilt = MicroVuLines(list(lines))
+    for marker in MicroVuLines.KEY_MARKERS:
+        assert lines.get_marker_indexes(marker) == rebuilt.get_marker_indexes(marker)
+    assert lines.instruction_indexes == rebuilt.instruction_indexes
+    for name in rebuilt.names:
+        assert lines.get_name_index(name) == rebuilt.get_name_index(name)
+
+
+def test_index_matches_rebuild_after_random_edits(lines):
+    rng = random.Random(311)
+    for i in range(60):
+        index = rng.randrange(len(lines))
+        if i % 3 == 0:
+            lines.insert_lines(index, [f"Txt 0 {i} (Name \"Farfignugen {i}\") (Txt \"killFile.bat\")\n"] * 2)
+        elif i % 3 == 1:
+            lines.delete_lines(rng.sample(range(len(lines)), 3))
+        else:
+            lines[index] = f"Sys 1 {i} (Name \"Bob {i}\") (Sys 1FB10DB0)\n"
+    rebuilt = MicroVuLines(list(lines))
+    for marker in MicroVuLines.KEY_MARKERS:
+        assert lines.get_marker_indexes(marker) == rebuilt.get_marker_indexes(marker)
+    assert lines.instruction_indexes == rebuilt.instruction_indexes
+    assert lines.names == rebuilt.names
+    for name in rebuilt.names:
+        assert lines.get_name_indexes(name) == rebuilt.get_name_indexes(name)
+    for line_type in ["Sys", "Txt", "Prmt", "Calc"]:
+        assert lines.get_type_indexes(line_type) == rebuilt.get_type_indexes(line_type)
+
+
+def test_edit_log_tracks_changed_lines(lines):
+    lines.insert_lines(10, ["Txt 0 1 (Name \"A\")\n", "Txt 0 2 (Name \"B\")\n"])
+    lines.delete_lines([20, 5, 21])
+    lines[30] = lines[30].replace("\n", " (Tag)\n")
+    lines[31] = lines[31]
+    assert lines.changed_indexes == [9, 10, 30]
+    assert lines.deleted_original_indexes == [5, 18, 19]
+    assert lines.get_original_index(9) == -1
+    assert lines.get_original_index(30) == 31
+    assert [edit.kind for edit in lines.edits] == ["insert", "insert", "delete", "delete", "delete", "replace"]
+    assert [edit.original_index for edit in lines.edits] == [-1, -1, 5, 18, 19, 31]
+    assert not hasattr(lines.edits[2], "line")
+
+
+def test_batch_edits_match_single_edits(lines):
+    single = MicroVuLines(list(lines))
+    for line in reversed(["Prmt 0 1 (Name \"A\")\n", "Prmt 0 2 (Name \"B\")\n"]):
+        single.insert(14, line)
+    for i in [40, 33, 20]:
+        del single[i]
+    lines.insert_lines(14, ["Prmt 0 1 (Name \"A\")\n", "Prmt 0 2 (Name \"B\")\n"])
+    lines.delete_lines([20, 33, 40])
+    assert list(lines) == list(single)
+    assert lines.instruction_indexes == single.instruction_indexes
+    for name in single.names:
+        assert lines.get_name_indexes(name) == single.get_name_indexes(name)
@@ -0,0 +1,88 @@
+import pytest
+
+from lib.MicroVuNodes import MicroVuLineNodes
+
+
+PROG_LINE = "Prog 1 15633F88 (Units Eng) (PrecDMS 0)(RoundingEnabled 0) (InsIdx 54) " \
+            "(ExpFile \"C:\\spcdata\\mvexport.txt\") (ExpFileFmt ((RunSep 1) (ValDlm Comma) (FldDlm Tab) " \
+            "(DTForm \"%Y-%m-%d %H:%M:%S\") (NoDblQt 0))) (AutoExpFile \"C:\\spcdata\\mvexport.txt\") " \
+            "(AutoExpFileInf ((Enab 1) (FrmInf ((RunSep 0) (FldDlm Comma))))) (AutoRptFileName \"\")\n"
+
+LIN_LINE = "Lin 1 1F3C4228 (Name \"13\") (Sys CB91928) (Tag) (PCS ((-0.0028 -0.0025 1.16e-005 0) " \
+           "(-9.65e-006 -1.16e-005 -0.0025 0)))\n"
+
+
+# Fixtures
+@pytest.fixture()
+def prog_nodes() -> MicroVuLineNodes:
+    return MicroVuLineNodes(PROG_LINE)
+
+
+# Tests
+def test_header(prog_nodes):
+    assert prog_nodes.header == "Prog 1 15633F88 "
+
+
+def test_top_level_nodes(prog_nodes):
+    keys = [node.key for node in prog_nodes.nodes]
+    assert keys == ["Units", "PrecDMS", "RoundingEnabled", "InsIdx", "ExpFile", "ExpFileFmt", "AutoExpFile",
+                    "AutoExpFileInf", "AutoRptFileName"]
+
+
+def test_get_text(prog_nodes):
+    assert prog_nodes.get_text("ExpFile") == "C:\\spcdata\\mvexport.txt"
+    assert prog_nodes.get_text("AutoRptFileName") == ""
+    assert prog_nodes.get("FldDlm") is None
+
+
+def test_nested_blocks_are_not_parsed_until_accessed():
+    line_nodes = MicroVuLineNodes(LIN_LINE)
+    pcs_node = line_nodes.get("PCS")
+    assert pcs_node._children is None
+    assert pcs_node.raw_value.startswith("((-0.0028")
+    assert len(line_nodes.nodes) == 4
+
+
+def test_find_all_nested(prog_nodes):
+    assert [node.raw_value for node in prog_nodes.find_all("FldDlm")] == ["Tab", "Comma"]
+    assert prog_nodes.find("DTForm").text == "%Y-%m-%d %H:%M:%S"
+
+
+def test_quoted_parentheses_and_escaped_quotes():
+    line_nodes = MicroVuLineNodes("CmdLn 1 1F19EBC0 (Name \"A (B)\") (CmdText \"\"\"C:\\killFile.bat\"\"\") (Wait 0)\n")
+    assert [node.key for node in line_nodes.nodes] == ["Name", "CmdText", "Wait"]
+    assert line_nodes.get_text("Name") == "A (B)"
+    assert line_nodes.get_text("CmdText") == "\"C:\\killFile.bat\""
+
+
+def test_set_text_rewrites_only_the_node(prog_nodes):
+    auto_export_node = prog_nodes.get("AutoExpFile")
+    prog_nodes.set_text("ExpFile", "Z:\\bob.csv")
+    assert prog_nodes.text == PROG_LINE.replace("(ExpFile \"C:\\spcdata\\mvexport.txt\")", "(ExpFile \"Z:\\bob.csv\")")
+    assert auto_export_node.text == "C:\\spcdata\\mvexport.txt"
+    assert prog_nodes.get_text("AutoRptFileName") == ""
+
+
+def test_set_nested_value(prog_nodes):
+    for node in prog_nodes.find_all("FldDlm"):
+        prog_nodes.set_raw_value(node, "CrLf")
+    assert "(FldDlm Tab)" not in prog_nodes.text
+    assert "(FldDlm Comma)" not in prog_nodes.text
+    assert prog_nodes.text.count("(FldDlm CrLf)") == 2
+    assert prog_nodes.get_text("AutoRptFileName") == ""
+
+
+def test_append_and_remove(prog_nodes):
+    prog_nodes.append("DontMeasure")
+    assert prog_nodes.text.endswith("(AutoRptFileName \"\") (DontMeasure)\n")
+    prog_nodes.set_value("InsIdx", "58")
+    assert prog_nodes.get("InsIdx").source == "(InsIdx 58)"
+    prog_nodes.remove(prog_nodes.get("DontMeasure"))
+    assert prog_nodes.text == PROG_LINE.replace("(InsIdx 54)", "(InsIdx 58)")
+
+
+def test_set_text_appends_missing_node():
+    line_nodes = MicroVuLineNodes("Txt 0 22119100 (Name \"Edited by & comments\")\n")
+    line_nodes.set_text("Txt", "bob \"the\" builder")
+    assert line_nodes.text == "Txt 0 22119100 (Name \"Edited by & comments\") (Txt \"bob \"\"the\"\" builder\")\n"
+    assert line_nodes.get_text("Txt") == "bob \"the\" builder"
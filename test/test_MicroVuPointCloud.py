@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pytest
+
+from lib.MicroVuFileReader import MicroVuFileReader
+from lib.MicroVuLines import MicroVuLines
+from lib.MicroVuPointCloud import MicroVuPointCloud
+
+
+def _get_input_filepath(file_name: str) -> str:
+    current_dir = os.path.dirname(__file__)
+    return str(os.path.join(current_dir, "Input", file_name))
+
+
+# Fixtures
+@pytest.fixture()
+def file_lines() -> MicroVuLines:
+    return MicroVuLines(MicroVuFileReader(_get_input_filepath("110047396A0_OPFAI_REVA_SP.iwp")))
+
+
+# Tests
+def test_parse_points():
+    points = MicroVuPointCloud.parse_points("0.5 1 -2e-007 3 4 5")
+    assert points.shape == (2, 3)
+    assert points.dtype == np.float64
+    assert np.allclose(points[0], [0.5, 1, -2e-7])
+    assert MicroVuPointCloud.parse_points("").shape == (0, 3)
+    with pytest.raises(ValueError):
+        MicroVuPointCloud.parse_points("1 2")
+    with pytest.raises(ValueError):
+        MicroVuPointCloud.parse_points("1 2 Farfignugen")
+
+
+def test_point_cloud(file_lines):
+    cloud = MicroVuPointCloud(file_lines)
+    assert len(cloud) == 183
+    assert cloud.points.shape == (183, 3)
+    assert np.allclose(cloud.points[0], [0.7141524, 0.082938018, 0.036473639])
+    assert cloud.line_indexes[0] == 9
+    assert np.allclose(cloud.points[2], [-8.1863866e-005, 0.0038726769, -1.3876384e-006])
+    point_counts = cloud.get_point_counts()
+    assert len(point_counts) == len(cloud.feature_indexes) == 105
+    assert sum(point_counts.values()) == len(cloud)
+    assert point_counts[117] == 2
+    assert np.allclose(cloud.get_points(117)[1], [-0.0059828093, 0.028553972, -1.2115424e-007])
+
+
+def test_bounding_boxes(file_lines):
+    cloud = MicroVuPointCloud(file_lines)
+    bounding_boxes = cloud.get_bounding_boxes()
+    assert bounding_boxes.shape == (105, 2, 3)
+    assert np.all(bounding_boxes[:, 0] <= bounding_boxes[:, 1])
+    position = cloud.feature_indexes.index(117)
+    points = cloud.get_points(117)
+    assert np.allclose(bounding_boxes[position], [points.min(axis=0), points.max(axis=0)])
+    assert np.allclose(cloud.bounding_box, [bounding_boxes[:, 0].min(axis=0), bounding_boxes[:, 1].max(axis=0)])
+
+
+def test_line_types(file_lines):
+    cloud = MicroVuPointCloud(file_lines, ("Pnt",))
+    assert len(cloud) == 84
+    assert all(count == 1 for count in cloud.get_point_counts().values())
+    empty_cloud = MicroVuPointCloud(file_lines, ("Txt",))
+    assert len(empty_cloud) == 0
+    assert empty_cloud.get_bounding_boxes().shape == (0, 2, 3)
+    assert np.isnan(empty_cloud.bounding_box).all()
+
+
+def test_get_decimation_mask():
+    points = np.column_stack([np.arange(11) * 0.1, np.zeros(11), np.zeros(11)])
+    assert MicroVuPointCloud.get_decimation_mask(points).all()
+    mask = MicroVuPointCloud.get_decimation_mask(points, spacing=0.35)
+    assert np.flatnonzero(mask).tolist() == [0, 4, 7, 10]
+    mask = MicroVuPointCloud.get_decimation_mask(points, point_count=3)
+    assert np.flatnonzero(mask).tolist() == [0, 5, 10]
+    keep_mask = np.zeros(11, dtype=bool)
+    keep_mask[2] = True
+    mask = MicroVuPointCloud.get_decimation_mask(points, point_count=2, keep_mask=keep_mask)
+    assert np.flatnonzero(mask).tolist() == [0, 2, 10]
+    assert not MicroVuPointCloud.get_decimation_mask(np.empty((0, 3)), spacing=1.0).size
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+from lib.MicroVuFileReader import MicroVuFileReader
+from lib.MicroVuLines import MicroVuLines
+from lib.MicroVuPointDecimation import MicroVuPointDecimation
+
+
+def _get_input_filepath(file_name: str) -> str:
+    current_dir = os.path.dirname(__file__)
+    return str(os.path.join(current_dir, "Input", file_name))
+
+
+# Fixtures
+@pytest.fixture()
+def file_lines() -> MicroVuLines:
+    return MicroVuLines(MicroVuFileReader(_get_input_filepath("110047396A0_OPFAI_REVA_SP.iwp")))
+
+
+# Tests
+def test_disabled(file_lines):
+    decimation = MicroVuPointDecimation(file_lines)
+    assert decimation.point_count == 78
+    assert decimation.removed_count == 0
+    assert decimation.deleted_line_indexes == []
+
+
+def test_point_count(file_lines):
+    decimation = MicroVuPointDecimation(file_lines, point_count=10)
+    assert decimation.removed_count == 48
+    assert decimation.deleted_names[0] == "305"
+    assert decimation.deleted_line_indexes[:5] == [122, 123, 124, 125, 126]
+    assert decimation.removed_byte_count > 0
+    assert str(decimation).startswith("removed 48 of 78 point cloud points")
+
+
+def test_keeps_run_ends_and_features(file_lines):
+    decimation = MicroVuPointDecimation(file_lines, spacing=1.0)
+    assert decimation.removed_count == 72
+    for name in ("START", "283", "304", "330", "333", "335", "360", "362", "364", "388"):
+        assert name not in decimation.deleted_names
+    deleted_line_indexes = set(decimation.deleted_line_indexes)
+    for i in file_lines.get_type_indexes("Crc") + file_lines.get_type_indexes("Sys"):
+        assert i not in deleted_line_indexes
+    file_lines.delete_lines(decimation.deleted_line_indexes)
+    assert file_lines.get_name_index("304") > -1
+    assert file_lines.get_name_index("305") == -1
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+from lib.MicroVuProgram import MicroVuProgram
+from lib.MicroVuProgramProbe import MicroVuProgramProbe
+
+
+def _get_input_filepath(file_name: str) -> str:
+    current_dir = os.path.dirname(__file__)
+    return str(os.path.join(current_dir, "Input", file_name))
+
+
+# Tests
+@pytest.mark.parametrize("file_name", [
+    "110047396A0_OPFAI_REVA_SP.iwp",
+    "446007 DATUM F UP.iwp",
+    "446007 END VIEW.iwp",
+    "446007 ITEM 1 PROFILE.iwp",
+    "NN00160A001-2_OPFAI_REVC_VMM_REV2.iwp",
+])
+def test_probe_matches_program(file_name):
+    filepath = _get_input_filepath(file_name)
+    probe = MicroVuProgramProbe(filepath)
+    micro_vu = MicroVuProgram(filepath, "", "", "")
+    assert probe.is_smartprofile == micro_vu.is_smartprofile
+    assert probe.has_calculators == micro_vu.has_calculators
+    assert probe.instruction_count == micro_vu.file_lines.instruction_count
+    if not micro_vu.is_smartprofile:
+        assert probe.export_filepath == micro_vu.export_filepath
+        assert probe.report_filepath == micro_vu.report_filepath
+
+
+def test_probe_stops_at_first_calculator():
+    probe = MicroVuProgramProbe(_get_input_filepath("446007 DATUM F UP.iwp"))
+    assert probe.has_calculators
+    assert probe.lines_read == 170
+
+
+def test_probe_stops_after_last_instruction():
+    probe = MicroVuProgramProbe(_get_input_filepath("NN00160A001-2_OPFAI_REVC_VMM_REV2.iwp"))
+    assert not probe.has_calculators
+    assert probe.lines_read == 741
+
+
+def test_probe_reads_only_the_header():
+    filepath = _get_input_filepath("110047396A0_OPFAI_REVA_SP.iwp")
+    probe = MicroVuProgramProbe(filepath)
+    assert probe.is_smartprofile
+    assert probe.instruction_count == 132
+    assert probe.lines_read == 4
+    assert probe.bytes_read == MicroVuProgramProbe.BLOCK_SIZE < os.path.getsize(filepath)
+    assert not probe.has_calculators
+    assert probe.lines_read == 601
+
+
+@pytest.mark.parametrize("file_name", ["110047396A0_OPFAI_REVA_SP.iwp", "446007 DATUM F UP.iwp"])
+def test_probe_streams_lines_across_blocks(monkeypatch, file_name):
+    filepath = _get_input_filepath(file_name)
+    expected_probe = MicroVuProgramProbe(filepath)
+    expected_has_calculators = expected_probe.has_calculators
+    monkeypatch.setattr(MicroVuProgramProbe, "BLOCK_SIZE", 66)
+    probe = MicroVuProgramProbe(filepath)
+    assert probe.export_filepath == expected_probe.export_filepath
+    assert probe.report_filepath == expected_probe.report_filepath
+    assert probe.has_calculators == expected_has_calculators
+    assert probe.lines_read == expected_probe.lines_read
+
+
+def test_probe_file_bytes():
+    filepath = _get_input_filepath("446007 DATUM F UP.iwp")
+    with open(filepath, "rb") as f:
+        data = f.read()
+    probe = MicroVuProgramProbe(filepath + ".missing", data)
+    assert probe.export_filepath == MicroVuProgramProbe(filepath).export_filepath
+    assert probe.has_calculators
+    assert probe.lines_read == 170
+
+
+def test_probe_bad_instruction_count(tmp_path):
+    filepath = str(tmp_path / "bad.iwp")
+    with open(filepath, "w", encoding="utf-16-le", newline="\r\n") as f:
+        f.write("Instructions Farfignugen\nTxt 0 1EFD3AA9 (Name \"Note\") (Txt \"Note\")\n")
+    probe = MicroVuProgramProbe(filepath)
+    assert probe.instruction_count == 1
+    assert probe.lines_read == 2
+
+
+def test_is_smartprofile_export_filepath():
+    assert MicroVuProgramProbe.is_smartprofile_export_filepath("OUTPUT.txt")
+    assert MicroVuProgramProbe.is_smartprofile_export_filepath("C:\\MicroVu\\PointClouds\\bob.xyz")
+    assert not MicroVuProgramProbe.is_smartprofile_export_filepath("C:\\spcdata\\mvexport.txt")
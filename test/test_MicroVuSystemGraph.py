@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pytest
+
+from lib.MicroVuFileReader import MicroVuFileReader
+from lib.MicroVuLines import MicroVuLines
+from lib.MicroVuSystemGraph import MicroVuSystemGraph
+
+
+def _get_input_filepath(file_name: str) -> str:
+    current_dir = os.path.dirname(__file__)
+    return str(os.path.join(current_dir, "Input", file_name))
+
+
+# Fixtures
+@pytest.fixture()
+def graph() -> MicroVuSystemGraph:
+    return MicroVuSystemGraph(MicroVuLines(MicroVuFileReader(_get_input_filepath("446007 END VIEW.iwp"))))
+
+
+# Tests
+def test_get_pcs_transform():
+    transform = MicroVuSystemGraph.get_pcs_transform(
+        "((0.5 1 0 0) (0.25 0 1 0) (0.125 0 0 1)  (-0.5 1 0 0) (-0.25 0 1 0) (-0.125 0 0 1))")
+    assert np.allclose(transform[:3, 3], [0.5, 0.25, 0.125])
+    assert np.allclose(transform[:3, :3], np.identity(3))
+    transform = MicroVuSystemGraph.get_pcs_transform("((0 -1 0) (1 0 0) (0 0 1)  (0 1 0) (-1 0 0) (0 0 1))")
+    assert np.allclose(transform @ [1, 0, 0, 1], [0, 1, 0, 1])
+    assert np.allclose(MicroVuSystemGraph.get_pcs_transform(""), np.identity(4))
+
+
+def test_graph(graph):
+    assert len(graph) == 11
+    assert graph.system_ids[0] == "CB91928"
+    assert graph.parent_ids[0] == ""
+    assert graph.get_children("CB91928") == ["CB90CF8"]
+    assert graph.get_path("CB90CF8") == ["CB91928", "CB90CF8"]
+    assert len(graph.get_path(graph.last_system_id)) == 11
+    assert graph.last_system_id == "1FB10DB0"
+    assert graph.local_transforms.shape == (11, 4, 4)
+    with pytest.raises(KeyError):
+        graph.get_transform("Farfignugen")
+
+
+def test_global_transforms(graph):
+    system_id = graph.last_system_id
+    expected = np.identity(4)
+    for path_id in graph.get_path(system_id):
+        expected = expected @ graph.local_transforms[graph.system_ids.index(path_id)]
+    assert np.allclose(graph.get_transform(system_id), expected)
+    points = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]])
+    assert np.allclose(graph.transform_points(system_id, points), points @ expected[:3, :3].T + expected[:3, 3])
+    feature_line_indexes = list(graph.feature_system_ids)[:3]
+    feature_transforms = graph.get_feature_transforms(feature_line_indexes)
+    assert feature_transforms.shape == (3, 4, 4)
+    assert np.allclose(feature_transforms[0], graph.get_transform(graph.feature_system_ids[feature_line_indexes[0]]))
@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from lib.ResourceRegistry import ResourceRegistry
+from lib.Utilities import get_unencoded_file_lines, get_utf_encoded_file_lines
+
+
+def _get_lib_directory() -> str:
+    current_dir = os.path.dirname(__file__)
+    return str(os.path.join(os.path.dirname(current_dir), "lib"))
+
+
+# Fixtures
+@pytest.fixture()
+def registry() -> ResourceRegistry:
+    return ResourceRegistry([_get_lib_directory()])
+
+
+# Tests
+def test_snippets_match_file_reads(registry):
+    lib_directory = _get_lib_directory()
+    assert registry.get_lines("prompt_text.txt") == get_utf_encoded_file_lines(
+        os.path.join(lib_directory, "prompt_text.txt"))
+    assert registry.get_lines("TextKill_text.txt") == get_unencoded_file_lines(
+        os.path.join(lib_directory, "TextKill_text.txt"))
+    assert registry.get_lines("Farfignugen.txt") == []
+    assert registry.get_filepath("Farfignugen.txt") == ""
+
+
+def test_lines_are_copies(registry):
+    registry.get_lines("TextKill_text.txt").clear()
+    assert registry.get_lines("TextKill_text.txt")
+
+
+def test_first_directory_wins_and_reload(tmp_path):
+    first_directory = tmp_path / "first"
+    second_directory = tmp_path / "second"
+    first_directory.mkdir()
+    second_directory.mkdir()
+    (first_directory / "a.txt").write_text("first\n")
+    (second_directory / "a.txt").write_text("second\n")
+    registry = ResourceRegistry([str(first_directory), str(second_directory)])
+    assert registry.get_text("a.txt") == "first\n"
+    (second_directory / "b.txt").write_text("b\n")
+    assert registry.get_lines("b.txt") == []
+    registry.reload()
+    assert registry.get_lines("b.txt") == ["b\n"]
+    assert registry.names == ["a.txt", "b.txt"]
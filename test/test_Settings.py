@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from lib.Settings import Settings
+
+
+# Fixtures
+@pytest.fixture()
+def ini_filepath(tmp_path) -> str:
+    filepath = str(tmp_path / "Settings.ini")
+    with open(filepath, "w") as f:
+        f.write("[GlobalSettings]\ndimension_root = INSP_\nallow_delete = False\n\n[Paths]\n* = Z:\\\n")
+    return filepath
+
+
+# Tests
+def test_typed_values(ini_filepath):
+    settings = Settings(ini_filepath)
+    assert settings.dimension_root == "INSP_"
+    assert settings.allow_delete is False
+    assert settings.export_path == "Z:\\"
+    assert settings.get_value("Location", "site") == ""
+    assert settings.get_legacy_prompt_names("Anoka") == ()
+    settings.set_value("PT #, Farfignugen", "GlobalSettings", "Anoka_legacy_prompt_names")
+    assert settings.get_legacy_prompt_names("Anoka") == ("PT #", "Farfignugen")
+    assert settings.get_legacy_prompt_names("CoonRapids") == ()
+    assert settings.point_cloud_point_count == 0
+    assert settings.point_cloud_spacing == 0.0
+    settings.set_value("0.005", "GlobalSettings", "point_cloud_spacing")
+    settings.set_value("Farfignugen", "GlobalSettings", "point_cloud_point_count")
+    assert settings.point_cloud_spacing == 0.005
+    assert settings.point_cloud_point_count == 0
+
+
+def test_reloads_only_when_file_changes(ini_filepath):
+    settings = Settings(ini_filepath)
+    assert settings.dimension_root == "INSP_"
+    original_config = settings._config
+    assert settings.dimension_root == "INSP_"
+    assert settings._config is original_config
+    with open(ini_filepath, "a") as f:
+        f.write("\n[Location]\nsite = Anoka\n")
+    assert settings.site == "Anoka"
+    assert settings._config is not original_config
+
+
+def test_set_value_writes_through(ini_filepath):
+    settings = Settings(ini_filepath)
+    settings.set_value("True", "GlobalSettings", "allow_delete")
+    assert settings.allow_delete is True
+    assert Settings(ini_filepath).allow_delete is True
+
+
+def test_get_shared(ini_filepath):
+    assert Settings.get_shared(ini_filepath) is Settings.get_shared(ini_filepath)
+    assert Settings.get_shared(ini_filepath) is not Settings.get_shared(os.path.dirname(ini_filepath))
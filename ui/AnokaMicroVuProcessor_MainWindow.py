@@ -1,14 +1,16 @@
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 from PyQt6 import QtWidgets
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QMessageBox, QFileDialog, QTableWidgetItem, QDialog
 
 import lib.Utilities
-from lib.MicroVuFileProcessor import ProcessorException, get_processor
+from lib.MicroVuFileProcessor import Processor, ProcessorException, get_processor
 from lib.MicroVuProgram import MicroVuProgram
+from lib.MicroVuProgramProbe import MicroVuProgramProbe
 from ui.Anokagui_MicroVuProcessor_MainWindow import Anokagui_MicroVuProcessorMainWindow
 from ui.DimensionNameEntryDialog import DimensionNameEntryDialog
 
@@ -68,14 +70,20 @@ class MicroVuProcessorMainWindow(QtWidgets.QMainWindow, Anokagui_MicroVuProcesso
         self.btnProcessFiles.clicked.connect(self._btnProcessFiles_clicked)
         self.tableWidget.cellDoubleClicked.connect(self._table_item_doubleclicked)
         self.chkSelectAll.stateChanged.connect(self._chkSelectAll_stateChanged)
-        self.user_initials = lib.Utilities.GetStoredIniValue("UserSettings", "Initials", "Settings")
-        self.input_rootpath = lib.Utilities.GetStoredIniValue("Paths", "Input_Rootpath", "Settings")
-        self.output_rootpath = lib.Utilities.GetStoredIniValue("Paths", "Output_Rootpath", "Settings")
-        self.smart_profile_directory = lib.Utilities.GetStoredIniValue("Paths", "smart_profile_directory", "Settings")
+        settings = lib.Utilities.get_settings()
+        self.user_initials = settings.initials
+        self.input_rootpath = settings.input_rootpath
+        self.output_rootpath = settings.output_rootpath
+        self.smart_profile_directory = settings.smart_profile_directory
         self.txtInitials.setText(self.user_initials)
         self.txtOutputFolder.setText(self.output_rootpath)
 
     # Internal Methods
+    def _close_micro_vus(self) -> None:
+        for micro_vu in self._micro_vus:
+            micro_vu.close()
+        self._micro_vus = []
+
     def _get_directory_via_dialog(self, title, default_directory=""):
         dialog = QFileDialog()
         return_path = dialog.getExistingDirectory(self, title, default_directory)
@@ -85,6 +93,12 @@ class MicroVuProcessorMainWindow(QtWidgets.QMainWindow, Anokagui_MicroVuProcesso
         dialog = QFileDialog()
         return dialog.getOpenFileName(self, title, default_directory, file_type)
 
+    def _get_program_probe(self, file_name: str) -> Optional[MicroVuProgramProbe]:
+        try:
+            return MicroVuProgramProbe(str(os.path.join(self.input_directory, file_name)))
+        except (OSError, UnicodeError, ValueError):
+            return None
+
     def _get_user_response(self, message: str, title: str) -> QMessageBox.StandardButton:
         return QMessageBox.critical(self, title, message, QMessageBox.StandardButton.Yes
                                     | QMessageBox.StandardButton.No
@@ -153,12 +167,12 @@ class MicroVuProcessorMainWindow(QtWidgets.QMainWindow, Anokagui_MicroVuProcesso
         else:
             return
 
-    def _update_micro_vu_dimension_names(self) -> bool:
+    def _update_micro_vu_dimension_names(self, processor: Processor) -> bool:
 
         for micro_vu in self._micro_vus:
             if micro_vu.is_smartprofile:
                 continue
-            dialog = DimensionNameEntryDialog(self, micro_vu)
+            dialog = DimensionNameEntryDialog(self, micro_vu, processor)
             result = dialog.exec()
             if result == QDialog.DialogCode.Rejected:
                 return False
@@ -197,8 +211,7 @@ class MicroVuProcessorMainWindow(QtWidgets.QMainWindow, Anokagui_MicroVuProcesso
 
     @property
     def hand_edit_dimension_names(self) -> bool:
-        value = lib.Utilities.GetStoredIniValue("GlobalSettings", "hand_edit_dimension_names", "Settings")
-        return value == "True"
+        return lib.Utilities.get_settings().hand_edit_dimension_names
 
     @property
     def micro_vus(self) -> list[MicroVuProgram]:
@@ -242,7 +255,7 @@ class MicroVuProcessorMainWindow(QtWidgets.QMainWindow, Anokagui_MicroVuProcesso
         #self.txtOpNumber.setText("")
         #self.txtRevNumber.setText("")
         self.tableWidget.setRowCount(0)
-        self._micro_vus.clear()
+        self._close_micro_vus()
 
     def set_process_checkboxes_checkstate(self, check_state: Qt.CheckState) -> None:
         for table_row in range(self.tableWidget.rowCount()):
@@ -277,8 +290,9 @@ class MicroVuProcessorMainWindow(QtWidgets.QMainWindow, Anokagui_MicroVuProcesso
             op_number = self.tableWidget.item(row, 4).text()
             rev_number = self.tableWidget.item(row, 5).text()
             micro_vu = MicroVuProgram(input_filepath, op_number, rev_number, smartprofile_file_name)
+            micro_vu.file_lines.materialize()
             micro_vus.append(micro_vu)
-        self._micro_vus.clear()
+        self._close_micro_vus()
         self._micro_vus = micro_vus
 
     def load_table_widget(self) -> None:
@@ -308,15 +322,22 @@ class MicroVuProcessorMainWindow(QtWidgets.QMainWindow, Anokagui_MicroVuProcesso
                 return
             self.tableWidget.setRowCount(len(files))
             for row, file in enumerate(files):
+                probe = self._get_program_probe(file)
                 textItem = QTableWidgetItem(file)
                 textItem.setFlags(Qt.ItemFlag.ItemIsEnabled)
+                if probe:
+                    textItem.setToolTip(f"Instructions: {probe.instruction_count}\n"
+                                        f"Calculators: {'Yes' if probe.has_calculators else 'No'}\n"
+                                        f"Export File: {probe.export_filepath}\n"
+                                        f"Report File: {probe.report_filepath}")
                 self.tableWidget.setItem(row, 0, textItem)
                 sp_textItem = QTableWidgetItem("")
                 self.tableWidget.setItem(row, 2, sp_textItem)
                 chkBoxItem = QTableWidgetItem()
                 chkBoxItem.setTextAlignment(Qt.AlignmentFlag.AlignHCenter)
                 chkBoxItem.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                chkBoxItem.setCheckState(Qt.CheckState.Unchecked)
+                is_profile = probe is not None and probe.is_smartprofile
+                chkBoxItem.setCheckState(Qt.CheckState.Checked if is_profile else Qt.CheckState.Unchecked)
                 self.tableWidget.setItem(row, 1, chkBoxItem)
                 chkBoxItem = QTableWidgetItem()
                 chkBoxItem.setTextAlignment(Qt.AlignmentFlag.AlignHCenter)
@@ -348,9 +369,13 @@ class MicroVuProcessorMainWindow(QtWidgets.QMainWindow, Anokagui_MicroVuProcesso
         if not self.check_micro_vus_for_calculators(self.micro_vus):
             return
 
-        processor = get_processor(self.user_initials)
+        try:
+            processor = get_processor(self.user_initials)
+        except ProcessorException as e:
+            self._show_error_message(e.args[0], "Dimension Rules Error")
+            return
 
-        if self.hand_edit_dimension_names and not self._update_micro_vu_dimension_names():
+        if self.hand_edit_dimension_names and not self._update_micro_vu_dimension_names(processor):
             return
 
         processor.add_micro_vu_programs(self.micro_vus)
@@ -361,6 +386,10 @@ class MicroVuProcessorMainWindow(QtWidgets.QMainWindow, Anokagui_MicroVuProcesso
             self._show_error_message(e.args[0], "Processing Error")
             return
 
+        if processor.skipped_renames:
+            self._show_message("These dimensions kept their old names:\n" + "\n".join(processor.skipped_renames),
+                               "Skipped Renames")
+
         if not self.micro_vus_with_calculators:
             self._show_message("Done!", "Done!")
         else:
@@ -417,8 +446,7 @@ class MicroVuProcessorMainWindow(QtWidgets.QMainWindow, Anokagui_MicroVuProcesso
 
 
 def main():
-    stylesheet_filepath = lib.Utilities.get_filepath_by_name("MacOS.qss")
-    styleSheet = lib.Utilities.get_file_as_string(stylesheet_filepath)
+    styleSheet = lib.Utilities.get_resources().get_text("MacOS.qss")
     app = QtWidgets.QApplication(sys.argv)
     app.setStyleSheet(styleSheet)
     ui = MicroVuProcessorMainWindow()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from PyQt6 import QtWidgets, QtCore, QtGui
 from PyQt6.QtCore import Qt
@@ -17,12 +17,12 @@ class DimensionNameEntryDialog(QtWidgets.QDialog):
     _processor: Processor
 
     # Dunder Methods
-    def __init__(self, parent: QWidget, mv: MicroVuProgram):
+    def __init__(self, parent: QWidget, mv: MicroVuProgram, processor: Optional[Processor] = None):
         super().__init__()
         self.parent = parent
         self._micro_vu = mv
         self._manual_dimension_names = mv.dimension_names
-        self._processor = MicroVuFileProcessor.get_processor("JTW")
+        self._processor = processor or MicroVuFileProcessor.get_processor("JTW")
         self._setupUi()
         self.btnAutoFill.clicked.connect(self._btnAutoFill_clicked)
         self.btnOK.clicked.connect(self._btnOK_clicked)
@@ -32,10 +32,13 @@ class DimensionNameEntryDialog(QtWidgets.QDialog):
 
     # Event Methods
     def _btnAutoFill_clicked(self):
-        for row, dimension_name in enumerate(self._manual_dimension_names):
-            new_name = self._processor.parse_dimension_name(dimension_name.name, "")
+        translation = self._processor.parse_dimension_names(
+            [dimension_name.name for dimension_name in self._manual_dimension_names], "")
+        for row, new_name in enumerate(translation.dimension_names):
             new_name_item = QTableWidgetItem(new_name)
             self.dimensionTable.setItem(row, 1, new_name_item)
+        for row in translation.colliding_indexes:
+            self.dimensionTable.item(row, 1).setBackground(QColor().fromRgb(220, 20, 60, 60))
 
     def _btnOK_clicked(self):
         if not self._validate_table():
@@ -205,7 +208,7 @@ class DimensionNameEntryDialog(QtWidgets.QDialog):
         return True
 
     def _update_manual_dimension_names(self):
-        dimension_root = lib.Utilities.GetStoredIniValue("GlobalSettings", "dimension_root", "Settings")
+        dimension_root = lib.Utilities.get_settings().dimension_root
 
         for row in range(self.dimensionTable.rowCount()):
             self.manual_dimension_names[row].name = dimension_root + self.dimensionTable.item(row, 1).text().upper()